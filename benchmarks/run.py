@@ -0,0 +1,293 @@
+"""Benchmark suite for serialization, expression evaluation and result I/O."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import tunits
+
+from measurement_config.core import Expression
+from measurement_config.models import (
+    DataAcquisitionConfig,
+    FrequencyConfig,
+    ParameterSweepConfig,
+    ParameterSweepContent,
+    ParametricSequenceConfig,
+    ParametricSequencePulseCommand,
+    SweepMeasurementConfig,
+    SweepMeasurementResult,
+)
+
+CONFIG_CHANNEL_COUNTS = [10, 100, 1_000, 10_000]
+RESULT_SIZES = {
+    "1KB": 2**10,
+    "1MB": 2**20,
+    "100MB": 100 * 2**20,
+    "1GB": 2**30,
+}
+EXPRESSION_ARRAY_SIZES = [1, 1_000, 1_000_000]
+
+
+def _measure(func: Callable[[], Any], repeat: int) -> dict[str, float | int]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "repeat": repeat,
+    }
+
+
+def _make_config(channel_count: int) -> SweepMeasurementConfig:
+    channels = [f"Q{i}" for i in range(channel_count)]
+    return SweepMeasurementConfig(
+        channel_list=channels,
+        sequence=ParametricSequenceConfig(
+            delta_time=tunits.Time(2.0, "ns"),
+            variable_list=["duration", "amplitude"],
+            command_list=[
+                ParametricSequencePulseCommand(
+                    name="Gaussian",
+                    channel_list=[channel],
+                    argument_list=["duration * 2", "amplitude", 0.5],
+                )
+                for channel in channels
+            ],
+        ),
+        frequency=FrequencyConfig(
+            channel_to_frequency={c: tunits.Frequency(5.0, "GHz") for c in channels},
+            channel_to_frequency_reference=dict.fromkeys(channels, channels[0]),
+            channel_to_frequency_shift={
+                c: tunits.Frequency(0, "MHz") for c in channels
+            },
+            keep_oscillator_relative_phase=True,
+        ),
+        data_acquisition=DataAcquisitionConfig(
+            shot_count=1000,
+            shot_repetition_margin=tunits.Time(500.0, "ns"),
+            data_acquisition_duration=tunits.Time(512.0, "ns"),
+            data_acquisition_delay=tunits.Time(100.0, "ns"),
+            data_acquisition_timeout=tunits.Time(2.0, "s"),
+            flag_average_waveform=True,
+            flag_average_shots=True,
+            delta_time=tunits.Time(8.0, "ns"),
+            channel_to_averaging_time={c: tunits.Time(200, "ns") for c in channels},
+            channel_to_averaging_window={
+                c: np.ones(16, dtype=complex) for c in channels
+            },
+        ),
+        sweep_parameter=ParameterSweepConfig(
+            sweep_content_list={
+                "duration_sweep": ParameterSweepContent(
+                    category="sequence_variable",
+                    sweep_target=["duration"],
+                    value_list=np.linspace(10, 1000, 100),
+                ),
+            },
+            sweep_axis=[["duration_sweep"]],
+        ),
+    )
+
+
+def _make_result(nbytes: int) -> SweepMeasurementResult:
+    count = max(nbytes // np.dtype(np.complex128).itemsize, 1)
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal(count) + 1j * rng.standard_normal(count)
+    return SweepMeasurementResult(
+        metadata={"experiment": "benchmark"},
+        data=data.reshape(count, 1),
+        data_shape=[count, 1],
+        sweep_key_list=["index"],
+        data_key_list=["Q0"],
+    )
+
+
+def bench_config(repeat: int, max_channels: int) -> dict[str, Any]:
+    """Benchmark SweepMeasurementConfig JSON round-trips."""
+    results = {}
+    for count in CONFIG_CHANNEL_COUNTS:
+        if count > max_channels:
+            continue
+        config = _make_config(count)
+        text = config.to_json()
+        results[f"config.to_json[{count}]"] = _measure(config.to_json, repeat)
+        results[f"config.from_json[{count}]"] = _measure(
+            lambda text=text: SweepMeasurementConfig.from_json(text), repeat
+        )
+    return results
+
+
+def bench_result(repeat: int, max_bytes: int, directory: Path) -> dict[str, Any]:
+    """Benchmark SweepMeasurementResult JSON and container round-trips."""
+    results = {}
+    for label, nbytes in RESULT_SIZES.items():
+        if nbytes > max_bytes:
+            continue
+        result = _make_result(nbytes)
+        text = result.to_json()
+        path = directory / f"result_{label}.bin"
+        results[f"result.to_json[{label}]"] = _measure(result.to_json, repeat)
+        results[f"result.from_json[{label}]"] = _measure(
+            lambda text=text: SweepMeasurementResult.from_json(text), repeat
+        )
+        del text
+        results[f"result.to_container[{label}]"] = _measure(
+            lambda path=path, result=result: result.to_container(path), repeat
+        )
+        results[f"result.from_container[{label}]"] = _measure(
+            lambda path=path: SweepMeasurementResult.from_container(path), repeat
+        )
+        path.unlink()
+    return results
+
+
+def bench_expression(repeat: int) -> dict[str, Any]:
+    """Benchmark Expression construction and evaluation."""
+    string = "amplitude * exp(-((t - t0) / sigma) ** 2 / 2)"
+
+    def construct_uncached() -> None:
+        Expression.cache_clear()
+        Expression(string)
+
+    results = {
+        "expression.construct[uncached]": _measure(construct_uncached, repeat),
+        "expression.construct[cached]": _measure(lambda: Expression(string), repeat),
+    }
+    expression = Expression(string)
+    for size in EXPRESSION_ARRAY_SIZES:
+        params = {
+            "amplitude": 0.5,
+            "t": np.linspace(0, 100, size) if size > 1 else 1.0,
+            "t0": 50.0,
+            "sigma": 10.0,
+        }
+        results[f"expression.resolve[{size}]"] = _measure(
+            lambda params=params: expression.resolve(params), repeat
+        )
+    return results
+
+
+def bench_import(repeat: int) -> dict[str, Any]:
+    """Benchmark cold import time in a fresh interpreter."""
+    results = {}
+    for module in ["measurement_config", "measurement_config.models"]:
+        command = [sys.executable, "-c", f"import {module}"]
+        results[f"import[{module}]"] = _measure(
+            lambda command=command: subprocess.run(command, check=True),  # noqa: S603
+            repeat,
+        )
+    return results
+
+
+def compare(
+    results: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float,
+) -> list[str]:
+    """
+    Compare benchmark medians against a baseline.
+
+    Parameters
+    ----------
+    results
+        Benchmarks of the current run.
+    baseline
+        Benchmarks of the baseline run.
+    tolerance
+        Allowed relative slowdown before a benchmark counts as a regression.
+
+    Returns
+    -------
+    list[str]
+        Names of the benchmarks that regressed.
+    """
+    regressions = []
+    print(f"{'benchmark':<44} {'baseline':>12} {'current':>12} {'ratio':>8}")
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            print(f"{name:<44} {'-':>12} {current['median']:>12.6f} {'new':>8}")
+            continue
+        ratio = current["median"] / reference["median"]
+        flag = " !" if ratio > 1 + tolerance else ""
+        print(
+            f"{name:<44} {reference['median']:>12.6f} "
+            f"{current['median']:>12.6f} {ratio:>8.2f}{flag}"
+        )
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> int:
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", type=Path, help="Write results as JSON.")
+    parser.add_argument("--baseline", type=Path, help="Compare with a results file.")
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Overwrite the baseline file with the results of this run.",
+    )
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-channels", type=int, default=max(CONFIG_CHANNEL_COUNTS))
+    parser.add_argument(
+        "--max-bytes",
+        type=int,
+        default=RESULT_SIZES["100MB"],
+        help="Largest result array in bytes (use 1073741824 for the 1GB case).",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        benchmarks = {
+            **bench_config(args.repeat, args.max_channels),
+            **bench_result(args.repeat, args.max_bytes, Path(directory)),
+            **bench_expression(args.repeat),
+            **bench_import(args.repeat),
+        }
+    report = {
+        "metadata": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+        },
+        "benchmarks": benchmarks,
+    }
+
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+    if args.baseline is not None and args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2))
+        return 0
+    if args.baseline is not None and args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())["benchmarks"]
+        regressions = compare(benchmarks, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) regressed: {regressions}")
+            return 1
+        return 0
+    print(json.dumps(benchmarks, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,39 @@
 """Core classes for measurement configuration."""
 
-from .expression import Expression
-from .model import Model, MutableModel
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from .model import ArrayEncoding, Model, MutableModel
+
+if TYPE_CHECKING:
+    from .bulk import BulkError
+    from .expression import Expression, ExpressionSet
+    from .store import ModelStore, StoreEntry
 
 __all__ = [
+    "ArrayEncoding",
+    "BulkError",
     "Expression",
+    "ExpressionSet",
     "Model",
+    "ModelStore",
     "MutableModel",
+    "StoreEntry",
 ]
+
+# Expressions depend on sympy, which is slow to import, bulk operations on
+# multiprocessing and the store on sqlite3, so they are loaded on first access.
+_LAZY_MODULES = {
+    "BulkError": "bulk",
+    "Expression": "expression",
+    "ExpressionSet": "expression",
+    "ModelStore": "store",
+    "StoreEntry": "store",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_MODULES:
+        module = importlib.import_module(f".{_LAZY_MODULES[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
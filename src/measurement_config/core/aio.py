@@ -0,0 +1,184 @@
+"""Asyncio helpers that keep model encoding and file I/O off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import os
+import tempfile
+import weakref
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Any, TypeVar
+
+from .files import set_default_mode
+from .model import Model
+
+ModelT = TypeVar("ModelT", bound=Model)
+T = TypeVar("T")
+
+DEFAULT_CONCURRENCY_LIMIT = 8
+DEFAULT_IO_CHUNK_SIZE = 1 << 20
+
+_concurrency_limit = DEFAULT_CONCURRENCY_LIMIT
+# asyncio primitives belong to one event loop, so each loop gets its own
+_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def set_concurrency_limit(limit: int) -> None:
+    """
+    Set the number of async saves and loads that may run at once.
+
+    Operations started while the limit is reached wait for a slot. The new
+    limit applies to operations started afterwards; operations that are
+    already running or waiting keep the previous limit, so both limits may be
+    in use until they finish.
+
+    Parameters
+    ----------
+    limit
+        Maximum number of concurrent operations per event loop.
+
+    Raises
+    ------
+    ValueError
+        If `limit` is not positive.
+    """
+    global _concurrency_limit
+    if limit <= 0:
+        raise ValueError("limit must be positive.")
+    _concurrency_limit = limit
+    _semaphores.clear()
+
+
+def get_concurrency_limit() -> int:
+    """Return the number of async saves and loads that may run at once."""
+    return _concurrency_limit
+
+
+@contextlib.asynccontextmanager
+async def _limited() -> AsyncIterator[None]:
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(_concurrency_limit)
+    async with semaphore:
+        yield
+
+
+async def _run(executor: Executor | None, func: Callable[..., T], *args: Any) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, func, *args)
+
+
+async def to_json(
+    model: Model,
+    indent: int | None = None,
+    executor: Executor | None = None,
+) -> str:
+    """Serialize a model to a JSON string in an executor."""
+    async with _limited():
+        return await _run(executor, functools.partial(model.to_json, indent=indent))
+
+
+async def from_json(
+    cls: type[ModelT],
+    data: str | bytes,
+    lazy: bool = False,
+    trusted: bool = False,
+    executor: Executor | None = None,
+) -> ModelT:
+    """Create a model instance from JSON in an executor."""
+    async with _limited():
+        return await _run(
+            executor, functools.partial(cls.from_json, lazy=lazy, trusted=trusted), data
+        )
+
+
+async def save_json(
+    model: Model,
+    path: str | os.PathLike[str],
+    indent: int | None = None,
+    executor: Executor | None = None,
+    chunk_size: int = DEFAULT_IO_CHUNK_SIZE,
+) -> None:
+    """
+    Write a model to a JSON file without blocking the event loop.
+
+    The model is encoded in an executor and written to a temporary file in
+    chunks, which is renamed to `path` once complete. If the coroutine is
+    cancelled or fails, the temporary file is removed and `path` is left
+    untouched.
+
+    Parameters
+    ----------
+    model
+        Model to save.
+    path
+        Destination file.
+    indent
+        Indentation of the JSON output.
+    executor
+        Executor for encoding and file I/O. Defaults to the event loop's
+        default executor.
+    chunk_size
+        Number of bytes written per executor call.
+    """
+    target = Path(path)
+    async with _limited():
+        data = await _run(
+            executor, functools.partial(model.to_json_bytes, indent=indent)
+        )
+        fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                set_default_mode(f.fileno())
+                view = memoryview(data)
+                for start in range(0, len(view), chunk_size):
+                    await _run(executor, f.write, view[start : start + chunk_size])
+            await _run(executor, os.replace, tmp, target)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp)
+            raise
+
+
+async def load_json(
+    cls: type[ModelT],
+    path: str | os.PathLike[str],
+    lazy: bool = False,
+    trusted: bool = False,
+    executor: Executor | None = None,
+) -> ModelT:
+    """
+    Read a model from a JSON file without blocking the event loop.
+
+    Parameters
+    ----------
+    cls
+        Model class.
+    path
+        File written by `save_json` or `Model.to_json`.
+    lazy
+        If True, array fields are decoded on first access.
+    trusted
+        If True, skip validation of data written with the current
+        serialization version.
+    executor
+        Executor for decoding and file I/O. Defaults to the event loop's
+        default executor.
+
+    Returns
+    -------
+    ModelT
+        Restored model.
+    """
+    async with _limited():
+        data = await _run(executor, Path(path).read_bytes)
+        return await _run(
+            executor, functools.partial(cls.from_json, lazy=lazy, trusted=trusted), data
+        )
@@ -0,0 +1,276 @@
+"""Parallel bulk serialization of models over a process pool."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import pickle
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .model import Model, is_buffer_array
+
+# Arrays at least this large are passed through shared memory, not pickled
+SHARED_MEMORY_THRESHOLD = 1 << 20
+DEFAULT_CHUNKSIZE = 8
+
+
+class BulkError(Exception):
+    """
+    Error raised when items of a bulk operation fail.
+
+    Attributes
+    ----------
+    errors
+        Exception raised for each failed item, keyed by input index.
+    results
+        Results in input order, with None for failed items.
+    """
+
+    def __init__(self, errors: dict[int, BaseException], results: list[Any]) -> None:
+        """Initialize the error from the failed items and partial results."""
+        first = min(errors)
+        super().__init__(
+            f"{len(errors)} of {len(results)} items failed; "
+            f"item {first}: {errors[first]!r}"
+        )
+        self.errors = errors
+        self.results = results
+
+
+# Per-thread state used while unpickling shared arrays
+_attach_state = threading.local()
+
+
+def _attach_shared_array(
+    name: str,
+    dtype: str,
+    shape: tuple[int, ...],
+) -> np.ndarray:
+    shm = SharedMemory(name=name)
+    view = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    if not _attach_state.copy:
+        # Zero-copy view; the block is closed once the task is done
+        _attach_state.blocks.append(shm)
+        return view
+    array = view.copy()
+    del view
+    shm.close()
+    shm.unlink()
+    return array
+
+
+class _SharedArrayPickler(pickle.Pickler):
+    """Pickler that moves large arrays into shared memory blocks."""
+
+    def __init__(self, file: io.BytesIO, blocks: list[SharedMemory]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._blocks = blocks
+
+    def reducer_override(self, obj: Any) -> Any:
+        if not is_buffer_array(obj) or obj.nbytes < SHARED_MEMORY_THRESHOLD:
+            return NotImplemented
+        shm = SharedMemory(create=True, size=obj.nbytes)
+        self._blocks.append(shm)
+        view = np.ndarray(obj.shape, dtype=obj.dtype, buffer=shm.buf)
+        view[...] = obj
+        del view
+        return _attach_shared_array, (shm.name, obj.dtype.str, obj.shape)
+
+
+def _dumps_shared(obj: Any, blocks: list[SharedMemory]) -> bytes:
+    file = io.BytesIO()
+    _SharedArrayPickler(file, blocks).dump(obj)
+    return file.getvalue()
+
+
+def _loads_shared(data: bytes, copy: bool) -> tuple[Any, list[SharedMemory]]:
+    _attach_state.copy = copy
+    _attach_state.blocks = []
+    try:
+        return pickle.loads(data), _attach_state.blocks  # noqa: S301
+    finally:
+        del _attach_state.blocks
+
+
+def _close_blocks(blocks: list[SharedMemory], unlink: bool) -> None:
+    for shm in blocks:
+        # A view that is still alive keeps the mapping until it is released
+        with contextlib.suppress(BufferError):
+            shm.close()
+        if unlink:
+            with contextlib.suppress(FileNotFoundError):
+                shm.unlink()
+
+
+def _picklable(exc: Exception) -> Exception:
+    try:
+        pickle.dumps(exc)
+    except Exception:
+        return RuntimeError(f"{type(exc).__name__}: {exc}")
+    return exc
+
+
+def _apply(func: Callable[[Any], Any], item: Any) -> tuple[bool, Any]:
+    try:
+        return True, func(item)
+    except Exception as exc:
+        return False, _picklable(exc)
+
+
+def _run_chunk(func: Callable[[Any], Any], payload: bytes) -> bytes:
+    items, blocks = _loads_shared(payload, copy=False)
+    outcomes = [_apply(func, item) for item in items]
+    # Drop the views into the input blocks before closing them
+    del items
+    _close_blocks(blocks, unlink=False)
+    # Output blocks are unlinked by the parent after copying them out
+    output_blocks: list[SharedMemory] = []
+    data = _dumps_shared(outcomes, output_blocks)
+    _close_blocks(output_blocks, unlink=False)
+    return data
+
+
+def run_bulk(
+    func: Callable[[Any], Any],
+    items: Sequence[Any],
+    max_workers: int | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    executor: Executor | None = None,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """
+    Apply a function to items in chunks over a process pool.
+
+    Parameters
+    ----------
+    func
+        Picklable function applied to each item.
+    items
+        Picklable inputs. Large NumPy arrays are passed through shared
+        memory in both directions.
+    max_workers
+        Number of worker processes. Defaults to the number of CPUs.
+    chunksize
+        Number of items sent to a worker at once.
+    executor
+        Existing process pool to use instead of starting a new one.
+    return_exceptions
+        If True, failed items hold their exception in the result list
+        instead of raising `BulkError`.
+
+    Returns
+    -------
+    list[Any]
+        Results in input order.
+
+    Raises
+    ------
+    BulkError
+        If an item fails and `return_exceptions` is False.
+    ValueError
+        If `chunksize` is not positive.
+    """
+    if chunksize <= 0:
+        raise ValueError("chunksize must be positive.")
+    results: list[Any] = [None] * len(items)
+    errors: dict[int, BaseException] = {}
+    max_workers = max_workers or os.cpu_count() or 1
+    owns_executor = executor is None
+    if executor is None:
+        if os.name == "posix":
+            # Workers must share the parent's tracker so that shared memory
+            # created by one process is not reported as leaked by another.
+            resource_tracker.ensure_running()
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    # Limit the chunks in flight so that shared memory use stays bounded
+    max_pending = 2 * max_workers
+    pending: dict[Future[bytes], tuple[int, int, list[SharedMemory]]] = {}
+
+    def collect(future: Future[bytes]) -> None:
+        start, stop, blocks = pending.pop(future)
+        _close_blocks(blocks, unlink=True)
+        try:
+            outcomes, _ = _loads_shared(future.result(), copy=True)
+        except Exception as exc:
+            outcomes = [(False, exc)] * (stop - start)
+        for index, (ok, value) in enumerate(outcomes, start):
+            if not ok:
+                errors[index] = value
+            if ok or return_exceptions:
+                results[index] = value
+
+    try:
+        for start in range(0, len(items), chunksize):
+            while len(pending) >= max_pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future)
+            chunk = list(items[start : start + chunksize])
+            blocks: list[SharedMemory] = []
+            try:
+                payload = _dumps_shared(chunk, blocks)
+            except BaseException:
+                _close_blocks(blocks, unlink=True)
+                raise
+            future = executor.submit(_run_chunk, func, payload)
+            pending[future] = (start, start + len(chunk), blocks)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                collect(future)
+    finally:
+        for future, (_, _, blocks) in pending.items():
+            future.cancel()
+            _close_blocks(blocks, unlink=True)
+        if owns_executor:
+            executor.shutdown(cancel_futures=True)
+    if errors and not return_exceptions:
+        raise BulkError(errors, results)
+    return results
+
+
+def to_json(model: Model, indent: int | None = None) -> str:
+    """Serialize a model to JSON; picklable helper for `run_bulk`."""
+    return model.to_json(indent=indent)
+
+
+def from_json(
+    data: str | bytes,
+    cls: type[Model],
+    trusted: bool = False,
+) -> Model:
+    """Restore a model from JSON; picklable helper for `run_bulk`."""
+    return cls.from_json(data, trusted=trusted)
+
+
+def to_json_file(
+    item: tuple[Model, str | os.PathLike[str]],
+    indent: int | None = None,
+) -> None:
+    """Write a model to a JSON file; picklable helper for `run_bulk`."""
+    model, path = item
+    Path(path).write_bytes(model.to_json_bytes(indent=indent))
+
+
+def from_json_file(
+    path: str | os.PathLike[str],
+    cls: type[Model],
+    trusted: bool = False,
+) -> Model:
+    """Read a model from a JSON file; picklable helper for `run_bulk`."""
+    return cls.from_json(Path(path).read_bytes(), trusted=trusted)
@@ -0,0 +1,100 @@
+"""Single-file container with a JSON header followed by raw array segments."""
+
+from __future__ import annotations
+
+import os
+import struct
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import numpy as np
+
+from .json_backend import get_json_backend
+
+CONTAINER_MAGIC = b"\x93MCFGBIN"
+CONTAINER_ALIGNMENT = 64
+
+_HEADER_LENGTH_FORMAT = "<Q"
+_PREAMBLE_SIZE = len(CONTAINER_MAGIC) + struct.calcsize(_HEADER_LENGTH_FORMAT)
+
+
+def aligned_size(nbytes: int) -> int:
+    """Return `nbytes` rounded up to the container alignment."""
+    return -(-nbytes // CONTAINER_ALIGNMENT) * CONTAINER_ALIGNMENT
+
+
+def array_bytes(array: np.ndarray) -> memoryview:
+    """Return the raw bytes of an array in C order as a flat byte buffer."""
+    # Flatten before viewing so that empty multi-dimensional arrays work too
+    return np.ascontiguousarray(array).reshape(-1).view(np.uint8).data
+
+
+def write_container(
+    path: str | os.PathLike[str],
+    header: Mapping[str, Any],
+    segments: Sequence[np.ndarray],
+    preallocate: bool = False,
+) -> None:
+    """
+    Write a container file.
+
+    Parameters
+    ----------
+    path
+        Destination file path.
+    header
+        JSON-serializable header.
+    segments
+        Arrays written after the header in order. Each segment starts at an
+        offset aligned to `CONTAINER_ALIGNMENT`, relative to the data section.
+    preallocate
+        If True, only reserve zero-filled space for the segments instead of
+        writing their contents.
+    """
+    header_bytes = get_json_backend().dumps_bytes(header)
+    data_offset = aligned_size(_PREAMBLE_SIZE + len(header_bytes))
+    with open(path, "wb") as f:
+        f.write(CONTAINER_MAGIC)
+        f.write(struct.pack(_HEADER_LENGTH_FORMAT, len(header_bytes)))
+        f.write(header_bytes)
+        f.write(b"\0" * (data_offset - f.tell()))
+        if preallocate:
+            # Extending the file leaves a sparse, zero-filled region
+            f.truncate(data_offset + sum(aligned_size(a.nbytes) for a in segments))
+            return
+        for segment in segments:
+            f.write(array_bytes(segment))
+            f.write(b"\0" * (aligned_size(segment.nbytes) - segment.nbytes))
+
+
+def read_container(path: str | os.PathLike[str]) -> tuple[dict[str, Any], int]:
+    """
+    Read the header of a container file.
+
+    Parameters
+    ----------
+    path
+        Container file path.
+
+    Returns
+    -------
+    tuple[dict[str, Any], int]
+        Decoded header and the absolute file offset of the data section.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a valid container.
+    """
+    with open(path, "rb") as f:
+        preamble = f.read(_PREAMBLE_SIZE)
+        if len(preamble) != _PREAMBLE_SIZE or not preamble.startswith(CONTAINER_MAGIC):
+            raise ValueError(f"Not a measurement_config container: {path}")
+        (header_length,) = struct.unpack_from(
+            _HEADER_LENGTH_FORMAT, preamble, len(CONTAINER_MAGIC)
+        )
+        header_bytes = f.read(header_length)
+    if len(header_bytes) != header_length:
+        raise ValueError(f"Truncated container header: {path}")
+    header = get_json_backend().loads(header_bytes)
+    return header, aligned_size(_PREAMBLE_SIZE + header_length)
@@ -1,9 +1,120 @@
 """Expression utilities for model evaluation."""
 
-from collections.abc import Mapping
-from typing import Any, cast
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping, Sequence
+from typing import Any, NamedTuple, cast
 
-from sympy import Symbol, lambdify, parse_expr
+from sympy import Basic, Symbol, lambdify, parse_expr
+
+DEFAULT_CACHE_MAXSIZE = 1024
+
+
+class ExpressionCacheInfo(NamedTuple):
+    """Statistics of the compiled-expression cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _CompiledExpression(NamedTuple):
+    expr: Basic
+    symbols: tuple[Symbol, ...]
+    func: Callable[..., Any]
+
+
+class _ExpressionCache:
+    """Thread-safe LRU cache of parsed and lambdified expressions."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._entries: OrderedDict[Hashable, _CompiledExpression] = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable) -> _CompiledExpression | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Hashable, entry: _CompiledExpression) -> None:
+        with self._lock:
+            if self._maxsize <= 0:
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def info(self) -> ExpressionCacheInfo:
+        with self._lock:
+            return ExpressionCacheInfo(
+                self._hits, self._misses, self._maxsize, len(self._entries)
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def _evict(self) -> None:
+        while len(self._entries) > max(self._maxsize, 0):
+            self._entries.popitem(last=False)
+
+
+_cache = _ExpressionCache(DEFAULT_CACHE_MAXSIZE)
+
+
+def _cache_key(
+    string: str,
+    symbol_dict: dict[str, Symbol] | None,
+    modules: str | list[str] | None,
+) -> Hashable | None:
+    symbols = tuple(sorted(symbol_dict.items())) if symbol_dict else None
+    backend = tuple(modules) if isinstance(modules, list) else modules
+    key = (string, symbols, backend)
+    try:
+        hash(key)
+    except TypeError:
+        # Symbol tables with unhashable entries are not cached
+        return None
+    return key
+
+
+def _parse(string: str, symbol_dict: dict[str, Symbol] | None) -> Basic:
+    try:
+        return parse_expr(string, local_dict=symbol_dict)
+    except Exception as e:
+        raise ValueError(f"Failed to parse expression string '{string}': {e}") from e
+
+
+def _sorted_symbols(symbols: set[Basic]) -> tuple[Symbol, ...]:
+    # Sort symbols by name to ensure deterministic order for lambdify
+    return tuple(sorted((cast(Symbol, s) for s in symbols), key=lambda s: s.name))
+
+
+def _compile(
+    string: str,
+    symbol_dict: dict[str, Symbol] | None,
+    modules: str | list[str] | None,
+) -> _CompiledExpression:
+    expr = _parse(string, symbol_dict)
+    symbols = _sorted_symbols(expr.free_symbols)
+    func = lambdify(symbols, expr, modules=modules)
+    return _CompiledExpression(expr, symbols, func)
 
 
 class Expression:
@@ -43,21 +154,38 @@ class Expression:
         ValueError
             If the expression string cannot be parsed.
         """
-        try:
-            self._expr = parse_expr(string, local_dict=symbol_dict)
-        except Exception as e:
-            raise ValueError(
-                f"Failed to parse expression string '{string}': {e}"
-            ) from e
-        self._symbols = tuple(
-            # Sort symbols by name to ensure deterministic order for lambdify
-            sorted(
-                (cast(Symbol, s) for s in self._expr.free_symbols),
-                key=lambda s: s.name,
-            )
-        )
+        key = _cache_key(string, symbol_dict, modules)
+        compiled = _cache.get(key) if key is not None else None
+        if compiled is None:
+            compiled = _compile(string, symbol_dict, modules)
+            if key is not None:
+                _cache.put(key, compiled)
+        self._expr = compiled.expr
+        self._symbols = compiled.symbols
         self._symbol_names = [s.name for s in self._symbols]
-        self._func = lambdify(self._symbols, self._expr, modules=modules)
+        self._func = compiled.func
+
+    @staticmethod
+    def cache_info() -> ExpressionCacheInfo:
+        """Return hit/miss statistics of the compiled-expression cache."""
+        return _cache.info()
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Remove all compiled expressions and reset the statistics."""
+        _cache.clear()
+
+    @staticmethod
+    def set_cache_maxsize(maxsize: int) -> None:
+        """
+        Set the maximum number of cached compiled expressions.
+
+        Parameters
+        ----------
+        maxsize
+            New cache size. Zero or a negative value disables caching.
+        """
+        _cache.resize(maxsize)
 
     def _repr_latex_(self) -> str:
         """Return LaTeX representation for rich display."""
@@ -94,3 +222,89 @@ class Expression:
                 f"Value for symbol '{e.args[0]}' not provided in params."
             ) from None
         return self._func(*values)
+
+
+class ExpressionSet:
+    """
+    Parse and evaluate several symbolic expressions together.
+
+    Common subexpressions are eliminated across all expressions, and the
+    result is compiled into a single function that returns every value.
+
+    Parameters
+    ----------
+    strings
+        Expression strings to parse.
+    symbol_dict
+        Optional symbol table used during parsing.
+    modules
+        Backend modules passed to `sympy.lambdify`.
+    """
+
+    def __init__(
+        self,
+        strings: Sequence[str],
+        symbol_dict: dict[str, Symbol] | None = None,
+        modules: str | list[str] | None = "numpy",
+    ) -> None:
+        """
+        Initialize an expression set evaluator.
+
+        Parameters
+        ----------
+        strings
+            Expression strings to parse.
+        symbol_dict
+            Optional symbol table used during parsing.
+        modules
+            Backend modules passed to `sympy.lambdify`.
+
+        Raises
+        ------
+        ValueError
+            If any expression string cannot be parsed.
+        """
+        self._exprs = tuple(_parse(string, symbol_dict) for string in strings)
+        self._symbols = _sorted_symbols(
+            set().union(*(expr.free_symbols for expr in self._exprs))
+        )
+        self._symbol_names = [s.name for s in self._symbols]
+        self._func = lambdify(
+            self._symbols, list(self._exprs), modules=modules, cse=True
+        )
+
+    def __len__(self) -> int:
+        """Return the number of expressions."""
+        return len(self._exprs)
+
+    @property
+    def symbols(self) -> tuple[Symbol, ...]:
+        """Symbols appearing in any of the expressions, sorted by name."""
+        return self._symbols
+
+    def resolve(self, params: Mapping[str, Any]) -> list[Any]:
+        """
+        Evaluate all expressions with provided parameter values.
+
+        Parameters
+        ----------
+        params : Mapping[str, Any]
+            Mapping from symbol names to values.
+
+        Returns
+        -------
+        list[Any]
+            Evaluated values, in the order of the expression strings.
+
+        Raises
+        ------
+        ValueError
+            If any required symbol is missing from `params`.
+        """
+        try:
+            values = [params[name] for name in self._symbol_names]
+        except KeyError as e:
+            raise ValueError(
+                f"Value for symbol '{e.args[0]}' not provided in params."
+            ) from None
+        return list(self._func(*values))
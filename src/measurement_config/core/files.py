@@ -0,0 +1,20 @@
+"""File system helpers shared by the serialization modules."""
+
+from __future__ import annotations
+
+import functools
+import os
+
+
+@functools.cache
+def _umask() -> int:
+    # The umask can only be read by setting it, so read it once
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
+
+
+def set_default_mode(fd: int) -> None:
+    """Give a file from `tempfile.mkstemp` the mode `open` would create."""
+    if hasattr(os, "fchmod"):
+        os.fchmod(fd, 0o666 & ~_umask())
@@ -0,0 +1,175 @@
+"""Pluggable JSON encoders and decoders for model serialization."""
+
+from __future__ import annotations
+
+import importlib
+import json
+import math
+from typing import Any
+
+# Optional dependency, imported dynamically so type checking does not need it
+try:
+    orjson: Any = importlib.import_module("orjson")
+except ImportError:
+    orjson = None
+
+
+class JsonBackend:
+    """
+    JSON backend based on the standard library.
+
+    This backend is the default, so serialized models do not depend on the
+    installed packages. Other backends must produce documents that decode to
+    the same values, but may format them differently, and are only used when
+    selected by name.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any, indent: int | None = None) -> str:
+        """Encode an object to a JSON string."""
+        return json.dumps(obj, ensure_ascii=False, indent=indent)
+
+    def dumps_bytes(self, obj: Any, indent: int | None = None) -> bytes:
+        """Encode an object to UTF-8 encoded JSON bytes."""
+        return self.dumps(obj, indent=indent).encode("utf-8")
+
+    def loads(self, data: str | bytes) -> Any:
+        """Decode a JSON string or UTF-8 encoded bytes."""
+        return json.loads(data)
+
+
+class OrjsonBackend(JsonBackend):
+    """
+    JSON backend based on `orjson`.
+
+    `orjson` only indents by two spaces and encodes `NaN` and infinities as
+    `null`, so such documents are encoded with the standard library. Documents
+    that `orjson` rejects when decoding, such as those containing `NaN`, are
+    decoded with the standard library.
+    """
+
+    name = "orjson"
+
+    def dumps(self, obj: Any, indent: int | None = None) -> str:
+        """Encode an object to a JSON string."""
+        return self.dumps_bytes(obj, indent=indent).decode("utf-8")
+
+    def dumps_bytes(self, obj: Any, indent: int | None = None) -> bytes:
+        """Encode an object to UTF-8 encoded JSON bytes."""
+        if orjson is None:
+            raise RuntimeError("orjson is not installed.")
+        if indent in (None, 2):
+            option = orjson.OPT_NON_STR_KEYS
+            if indent == 2:
+                option |= orjson.OPT_INDENT_2
+            try:
+                data = orjson.dumps(obj, option=option)
+            except orjson.JSONEncodeError:
+                pass
+            else:
+                # `null` is rare in payloads, so only then look for lost floats
+                if b"null" not in data or not _has_non_finite_float(obj):
+                    return data
+        return super().dumps(obj, indent=indent).encode("utf-8")
+
+    def loads(self, data: str | bytes) -> Any:
+        """Decode a JSON string or UTF-8 encoded bytes."""
+        if orjson is None:
+            raise RuntimeError("orjson is not installed.")
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return super().loads(data)
+
+
+def _has_non_finite_float(obj: Any) -> bool:
+    """Return whether a JSON-compatible object contains `NaN` or infinities."""
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+_backends: dict[str, JsonBackend] = {}
+_default_name = JsonBackend.name
+
+
+def register_json_backend(backend: JsonBackend, default: bool = False) -> None:
+    """
+    Register a JSON backend under its name.
+
+    Parameters
+    ----------
+    backend
+        Backend to register. A backend with the same name is replaced.
+    default
+        If True, use the backend when no backend is specified.
+    """
+    global _default_name
+    _backends[backend.name] = backend
+    if default:
+        _default_name = backend.name
+
+
+def set_default_json_backend(name: str) -> None:
+    """
+    Select the backend used when no backend is specified.
+
+    Parameters
+    ----------
+    name
+        Name of a registered backend.
+
+    Raises
+    ------
+    KeyError
+        If no backend is registered under `name`.
+    """
+    global _default_name
+    if name not in _backends:
+        raise KeyError(f"Unknown JSON backend: {name}")
+    _default_name = name
+
+
+def get_json_backend(name: str | None = None) -> JsonBackend:
+    """
+    Return a registered backend.
+
+    Parameters
+    ----------
+    name
+        Name of a registered backend, or None for the default backend.
+
+    Returns
+    -------
+    JsonBackend
+        The requested backend.
+
+    Raises
+    ------
+    KeyError
+        If no backend is registered under `name`.
+    """
+    key = _default_name if name is None else name
+    try:
+        return _backends[key]
+    except KeyError:
+        raise KeyError(f"Unknown JSON backend: {key}") from None
+
+
+def available_json_backends() -> list[str]:
+    """Return the names of the registered backends."""
+    return list(_backends)
+
+
+register_json_backend(JsonBackend(), default=True)
+if orjson is not None:
+    register_json_backend(OrjsonBackend())
@@ -2,29 +2,55 @@
 
 from __future__ import annotations
 
-import json
+import base64
+import contextlib
+import enum
+import functools
+import hashlib
+import importlib
 import logging
-from collections.abc import Mapping
-from typing import Any, TypeGuard
+import os
+import types
+import typing
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, TypeGuard, TypeVar
 
 import numpy as np
 import tunits
-from google.protobuf.json_format import MessageToDict, ParseDict
 from pydantic import (
     BaseModel,
     ConfigDict,
+    PrivateAttr,
+    SerializationInfo,
     SerializerFunctionWrapHandler,
+    TypeAdapter,
     model_serializer,
 )
 from pydantic.json_schema import GenerateJsonSchema, JsonSchemaValue
 from tunits.proto import tunits_pb2
 from typing_extensions import Self
 
-SERIALIZATION_VERSION = 0
+from .container import aligned_size, array_bytes, read_container, write_container
+from .json_backend import get_json_backend
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+T = TypeVar("T")
+
+SERIALIZATION_VERSION = 1
 
 _META_KEY = "__meta__"
 _META_VERSION_KEY = "version"
 
+_PATCH_BASE_KEY = "base"
+_PATCH_CHANGES_KEY = "changes"
+_PATCH_OP_KEY = "op"
+_PATCH_PATH_KEY = "path"
+_PATCH_VALUE_KEY = "value"
+_PATCH_OP_SET = "set"
+_PATCH_OP_REMOVE = "remove"
+
 _DATA_TYPE_KEY = "__type__"
 _DATA_NUMPY_PREFIX = "numpy."
 _DATA_TUNITS_PREFIX = "tunits."
@@ -32,6 +58,68 @@ _DATA_PYTHON_PREFIX = "python."
 _DATA_COMPLEX_REAL_KEY = "real"
 _DATA_COMPLEX_IMAG_KEY = "imag"
 
+_DATA_ENCODING_KEY = "__encoding__"
+_DATA_ENCODING_BUFFER = "buffer"
+_DATA_ENCODING_SEGMENT = "segment"
+_DATA_BUFFER_DTYPE_KEY = "dtype"
+_DATA_BUFFER_BYTEORDER_KEY = "byteorder"
+_DATA_BUFFER_SHAPE_KEY = "shape"
+_DATA_BUFFER_DATA_KEY = "data"
+_DATA_SEGMENT_OFFSET_KEY = "offset"
+_DATA_SEGMENT_NBYTES_KEY = "nbytes"
+_DATA_BUFFER_COMPRESSION_KEY = "compression"
+_DATA_BUFFER_SOURCE_DTYPE_KEY = "source_dtype"
+# dtype kinds that can be stored as a raw buffer: bool, int, uint, float, complex
+_BUFFER_DTYPE_KINDS = "biufc"
+
+# Serialization context key for a callable that may encode arrays out of band
+_CONTEXT_ARRAY_ENCODER_KEY = "array_encoder"
+
+# Mode of memory-mapped arrays: read-only, read-write or copy-on-write
+MmapMode = Literal["r", "r+", "c"]
+
+# Callable that stores an array out of band and returns its payload, or
+# returns None to store the array inline
+ArrayEncoder = Callable[[np.ndarray], "dict[str, Any] | None"]
+
+_PathKey = str | int
+
+CompressionCodec = Literal["zlib", "lzma", "bz2"]
+_COMPRESSION_CODECS = ("zlib", "lzma", "bz2")
+
+
+class ArrayEncoding(NamedTuple):
+    """
+    Options for storing NumPy arrays in serialized payloads.
+
+    Pass an instance to `Model.to_dict` or `Model.to_json` to apply it to
+    every array, or attach it to a field with `typing.Annotated` to apply it
+    to the arrays of that field only. The choices are recorded in the
+    payload, so decoding needs no options. Container files ignore these
+    options and keep arrays as raw bytes for memory mapping.
+
+    Attributes
+    ----------
+    compression
+        Standard library codec used to compress the array bytes.
+    level
+        Compression level passed to the codec. Defaults to the codec's own
+        default.
+    dtype
+        Smaller data type to store the array as, e.g. `"complex64"`. Arrays
+        are restored to their original data type when decoded.
+    lossy
+        If False, `dtype` is only applied when the conversion is exact, and
+        arrays are stored unchanged otherwise. If True, precision is
+        allowed to be lost.
+    """
+
+    compression: CompressionCodec | None = None
+    level: int | None = None
+    dtype: str | None = None
+    lossy: bool = False
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,6 +145,8 @@ def _complex_to_dict(value: complex) -> dict[str, Any]:
 
 
 def _tunits_to_dict(value: tunits.Value | tunits.ValueArray) -> dict[str, Any]:
+    from google.protobuf.json_format import MessageToDict
+
     class_name = value.__class__.__name__
     message = value.to_proto()
     data = MessageToDict(message, preserving_proto_field_name=True)
@@ -64,11 +154,105 @@ def _tunits_to_dict(value: tunits.Value | tunits.ValueArray) -> dict[str, Any]:
     return data
 
 
+def _numpy_layout_dict(value: np.ndarray) -> dict[str, Any]:
+    # dtype.str is e.g. "<c16": the first character is the byte order
+    dtype_str = value.dtype.str
+    return {
+        _DATA_BUFFER_DTYPE_KEY: dtype_str[1:],
+        _DATA_BUFFER_BYTEORDER_KEY: dtype_str[0],
+        _DATA_BUFFER_SHAPE_KEY: list(value.shape),
+    }
+
+
+def _compress(data: Any, codec: str, level: int | None) -> bytes:
+    if codec not in _COMPRESSION_CODECS:
+        raise ValueError(f"Unknown compression codec: {codec}")
+    module = importlib.import_module(codec)
+    if level is None:
+        return module.compress(data)
+    if codec == "lzma":
+        return module.compress(data, preset=level)
+    return module.compress(data, level)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec not in _COMPRESSION_CODECS:
+        raise TypeError(f"Unknown compression codec: {codec}")
+    module = importlib.import_module(codec)
+    try:
+        return module.decompress(data)
+    except Exception as exc:
+        raise TypeError(f"Invalid {codec} payload: {exc}") from exc
+
+
+def _reduce_dtype(value: np.ndarray, encoding: ArrayEncoding) -> np.ndarray:
+    if encoding.dtype is None:
+        return value
+    dtype = np.dtype(encoding.dtype)
+    if dtype == value.dtype or dtype.kind not in _BUFFER_DTYPE_KINDS:
+        return value
+    source = value
+    if value.dtype.kind == "c" and dtype.kind != "c":
+        if not encoding.lossy and np.any(value.imag):
+            return value
+        # Casting `.real` drops the imaginary part without a ComplexWarning
+        source = value.real
+    # Out-of-range values and NaN may not survive the trial cast, which the
+    # comparison below detects, so the floating point warnings are noise.
+    with np.errstate(invalid="ignore", over="ignore"):
+        reduced = source.astype(dtype)
+    if not encoding.lossy and not np.array_equal(
+        reduced.astype(value.dtype), value, equal_nan=value.dtype.kind in "fc"
+    ):
+        return value
+    return reduced
+
+
+def _numpy_to_buffer_dict(
+    value: np.ndarray,
+    encoding: ArrayEncoding | None = None,
+) -> dict[str, Any]:
+    source = value
+    extra = {}
+    if encoding is not None:
+        value = _reduce_dtype(value, encoding)
+        if value is not source:
+            extra[_DATA_BUFFER_SOURCE_DTYPE_KEY] = source.dtype.str
+    data = array_bytes(value)
+    if encoding is not None and encoding.compression is not None:
+        data = _compress(data, encoding.compression, encoding.level)
+        extra[_DATA_BUFFER_COMPRESSION_KEY] = encoding.compression
+    return {
+        **_numpy_layout_dict(value),
+        _DATA_BUFFER_DATA_KEY: base64.b64encode(data).decode("ascii"),
+        **extra,
+        _DATA_ENCODING_KEY: _DATA_ENCODING_BUFFER,
+        _DATA_TYPE_KEY: f"{_DATA_NUMPY_PREFIX}{source.__class__.__name__}",
+    }
+
+
+def _array_encoder_for(encoding: ArrayEncoding) -> ArrayEncoder:
+    """Return an array encoder that stores arrays as buffers with options."""
+    if encoding.compression not in (None, *_COMPRESSION_CODECS):
+        raise ValueError(f"Unknown compression codec: {encoding.compression}")
+
+    def encode(value: np.ndarray) -> dict[str, Any] | None:
+        if value.dtype.kind not in _BUFFER_DTYPE_KINDS:
+            return None
+        return _numpy_to_buffer_dict(value, encoding)
+
+    return encode
+
+
 def _numpy_to_dict(value: np.ndarray | np.generic) -> dict[str, Any]:
+    if isinstance(value, np.ndarray) and value.dtype.kind in _BUFFER_DTYPE_KINDS:
+        return _numpy_to_buffer_dict(value)
     if isinstance(value, np.ndarray):
         value_tunits = tunits.ValueArray(value)
     else:
         value_tunits = tunits.Value(value.item())
+    from google.protobuf.json_format import MessageToDict
+
     class_name = value.__class__.__name__
     message = value_tunits.to_proto()
     data = MessageToDict(message, preserving_proto_field_name=True)
@@ -76,23 +260,191 @@ def _numpy_to_dict(value: np.ndarray | np.generic) -> dict[str, Any]:
     return data
 
 
-def _serialize(obj: Any) -> Any:
+def _serialize(obj: Any, array_encoder: ArrayEncoder | None = None) -> Any:
     if _is_numpy(obj):
+        if array_encoder is not None and isinstance(obj, np.ndarray):
+            data = array_encoder(obj)
+            if data is not None:
+                return data
         return _numpy_to_dict(obj)
     if _is_complex(obj):
         return _complex_to_dict(obj)
     if _is_tunits(obj):
         return _tunits_to_dict(obj)
     if isinstance(obj, Mapping):
-        return {k: _serialize(v) for k, v in obj.items()}
+        return {k: _serialize(v, array_encoder) for k, v in obj.items()}
     if isinstance(obj, (list, tuple)):
-        return [_serialize(v) for v in obj]
+        return [_serialize(v, array_encoder) for v in obj]
+    return obj
+
+
+def is_buffer_array(value: Any) -> TypeGuard[np.ndarray]:
+    """Return whether `value` is a NumPy array stored as raw bytes."""
+    return isinstance(value, np.ndarray) and value.dtype.kind in _BUFFER_DTYPE_KINDS
+
+
+def external_array_dict(
+    value: np.ndarray, encoding: str, **fields: Any
+) -> dict[str, Any]:
+    """
+    Return the payload of an array whose bytes are stored out of band.
+
+    Parameters
+    ----------
+    value
+        Array for which `is_buffer_array` is True.
+    encoding
+        Name of the storage that holds the bytes, e.g. `"segment"`.
+    **fields
+        Extra keys needed to locate the bytes.
+
+    Returns
+    -------
+    dict
+        Payload with the data type, shape and encoding of the array.
+    """
+    return {
+        **_numpy_layout_dict(value),
+        **fields,
+        _DATA_ENCODING_KEY: encoding,
+        _DATA_TYPE_KEY: f"{_DATA_NUMPY_PREFIX}{value.__class__.__name__}",
+    }
+
+
+class _SegmentEncoder:
+    """Array encoder that collects arrays as raw container segments."""
+
+    def __init__(self) -> None:
+        self.segments: list[np.ndarray] = []
+        self._offset = 0
+
+    def __call__(self, value: np.ndarray) -> dict[str, Any] | None:
+        if value.dtype.kind not in _BUFFER_DTYPE_KINDS:
+            return None
+        data = external_array_dict(
+            value,
+            _DATA_ENCODING_SEGMENT,
+            **{
+                _DATA_SEGMENT_OFFSET_KEY: self._offset,
+                _DATA_SEGMENT_NBYTES_KEY: value.nbytes,
+            },
+        )
+        self.segments.append(value)
+        self._offset += aligned_size(value.nbytes)
+        return data
+
+
+def _numpy_layout_from_dict(
+    value: Mapping[str, Any],
+) -> tuple[np.dtype, tuple[int, ...]]:
+    try:
+        dtype = np.dtype(
+            value[_DATA_BUFFER_BYTEORDER_KEY] + value[_DATA_BUFFER_DTYPE_KEY]
+        )
+        shape = tuple(value[_DATA_BUFFER_SHAPE_KEY])
+    except (KeyError, TypeError, ValueError) as exc:
+        raise TypeError(f"Invalid numpy array layout: {exc}") from exc
+    return dtype, shape
+
+
+def external_array_layout(
+    value: Any, encoding: str
+) -> tuple[np.dtype, tuple[int, ...]] | None:
+    """
+    Return the data type and shape recorded by `external_array_dict`.
+
+    Parameters
+    ----------
+    value
+        Decoded payload value.
+    encoding
+        Name of the storage passed to `external_array_dict`.
+
+    Returns
+    -------
+    tuple[numpy.dtype, tuple[int, ...]] or None
+        Data type and shape, or None if `value` is not an array payload
+        with `encoding`.
+
+    Raises
+    ------
+    TypeError
+        If the recorded data type or shape is invalid.
+    """
+    if not isinstance(value, Mapping) or value.get(_DATA_ENCODING_KEY) != encoding:
+        return None
+    return _numpy_layout_from_dict(value)
+
+
+def _numpy_from_buffer_dict(value: Mapping[str, Any]) -> np.ndarray:
+    dtype, shape = _numpy_layout_from_dict(value)
+    codec = value.get(_DATA_BUFFER_COMPRESSION_KEY)
+    source_dtype = value.get(_DATA_BUFFER_SOURCE_DTYPE_KEY)
+    try:
+        buffer = base64.b64decode(value[_DATA_BUFFER_DATA_KEY])
+    except (KeyError, TypeError, ValueError) as exc:
+        raise TypeError(f"Invalid numpy buffer payload: {exc}") from exc
+    if codec is not None:
+        buffer = _decompress(buffer, codec)
+    if source_dtype is not None:
+        # astype copies, so the restored array is writable
+        return np.frombuffer(buffer, dtype=dtype).reshape(shape).astype(source_dtype)
+    # Copy into a bytearray so that the restored array is writable
+    return np.frombuffer(bytearray(buffer), dtype=dtype).reshape(shape)
+
+
+def _numpy_from_segment_dict(
+    value: Mapping[str, Any],
+    path: str | os.PathLike[str],
+    data_offset: int,
+    mmap_mode: MmapMode | None,
+) -> np.ndarray:
+    dtype, shape = _numpy_layout_from_dict(value)
+    try:
+        offset = data_offset + int(value[_DATA_SEGMENT_OFFSET_KEY])
+        nbytes = int(value[_DATA_SEGMENT_NBYTES_KEY])
+    except (KeyError, TypeError, ValueError) as exc:
+        raise TypeError(f"Invalid numpy segment payload: {exc}") from exc
+    if mmap_mode is None or nbytes == 0:
+        # Empty arrays cannot be memory-mapped
+        with open(path, "rb") as f:
+            f.seek(offset)
+            array = np.fromfile(f, dtype=dtype, count=nbytes // dtype.itemsize)
+        return array.reshape(shape)
+    return np.memmap(path, dtype=dtype, mode=mmap_mode, offset=offset, shape=shape)
+
+
+def _resolve_segments(
+    obj: Any,
+    path: str | os.PathLike[str],
+    data_offset: int,
+    mmap_mode: MmapMode | None,
+) -> Any:
+    if isinstance(obj, Mapping):
+        if obj.get(_DATA_ENCODING_KEY) == _DATA_ENCODING_SEGMENT:
+            return _numpy_from_segment_dict(obj, path, data_offset, mmap_mode)
+        return {
+            k: _resolve_segments(v, path, data_offset, mmap_mode)
+            for k, v in obj.items()
+        }
+    if isinstance(obj, list):
+        return [_resolve_segments(v, path, data_offset, mmap_mode) for v in obj]
     return obj
 
 
-def _numpy_from_dict(value: dict[str, Any]) -> np.ndarray | np.generic:
-    payload = dict(value)  # make a copy to avoid modifying the original
-    type_name: str = payload.pop(_DATA_TYPE_KEY)
+def _parse_proto(value: Mapping[str, Any], message: Any) -> Any:
+    from google.protobuf.json_format import ParseDict
+
+    # The type tag is the only key that is not a proto field. The copy is
+    # shallow, so long value lists are not copied.
+    js_dict = {k: v for k, v in value.items() if k != _DATA_TYPE_KEY}
+    return ParseDict(js_dict, message)
+
+
+def _numpy_from_dict(value: Mapping[str, Any]) -> np.ndarray | np.generic:
+    if value.get(_DATA_ENCODING_KEY) == _DATA_ENCODING_BUFFER:
+        return _numpy_from_buffer_dict(value)
+    type_name: str = value[_DATA_TYPE_KEY]
     class_name = type_name.removeprefix(_DATA_NUMPY_PREFIX)
     try:
         cls = getattr(np, class_name)
@@ -102,20 +454,21 @@ def _numpy_from_dict(value: dict[str, Any]) -> np.ndarray | np.generic:
         raise TypeError(f"Unknown numpy class: {class_name}")
     # Use tunits as an intermediary for deserialization
     if issubclass(cls, np.ndarray):
-        message = ParseDict(payload, tunits_pb2.ValueArray())
+        message = _parse_proto(value, tunits_pb2.ValueArray())
         value_tunits = tunits.ValueArray.from_proto(message)
         return value_tunits.value
     elif issubclass(cls, np.generic):
-        message = ParseDict(payload, tunits_pb2.Value())
+        message = _parse_proto(value, tunits_pb2.Value())
         value_tunits = tunits.Value.from_proto(message)
         return cls(value_tunits.value)
     else:
         raise TypeError(f"Unknown numpy class: {class_name}")
 
 
-def _tunits_from_dict(value: dict[str, Any]) -> tunits.Value | tunits.ValueArray:
-    payload = dict(value)  # make a copy to avoid modifying the original
-    type_name: str = payload.pop(_DATA_TYPE_KEY)
+def _tunits_from_dict(
+    value: Mapping[str, Any],
+) -> tunits.Value | tunits.ValueArray:
+    type_name: str = value[_DATA_TYPE_KEY]
     class_name = type_name.removeprefix(_DATA_TUNITS_PREFIX)
     try:
         cls = getattr(tunits, class_name)
@@ -124,40 +477,54 @@ def _tunits_from_dict(value: dict[str, Any]) -> tunits.Value | tunits.ValueArray
     if not isinstance(cls, type):
         raise TypeError(f"Unknown tunits class: {class_name}")
     if issubclass(cls, tunits.Value):
-        message = ParseDict(payload, tunits_pb2.Value())
+        message = _parse_proto(value, tunits_pb2.Value())
         return cls.from_proto(message)
     elif issubclass(cls, tunits.ValueArray):
-        message = ParseDict(payload, tunits_pb2.ValueArray())
+        message = _parse_proto(value, tunits_pb2.ValueArray())
         return cls.from_proto(message)
     else:
         raise TypeError(f"Unknown tunits class: {class_name}")
 
 
-def _complex_from_dict(value: dict[str, Any]) -> complex:
-    payload = dict(value)  # make a copy to avoid modifying the original
-    type_name: str = payload.pop(_DATA_TYPE_KEY)
+def _complex_from_dict(value: Mapping[str, Any]) -> complex:
+    type_name: str = value[_DATA_TYPE_KEY]
     class_name = type_name.removeprefix(_DATA_PYTHON_PREFIX)
     if class_name == "complex":
-        return complex(payload[_DATA_COMPLEX_REAL_KEY], payload[_DATA_COMPLEX_IMAG_KEY])
+        return complex(value[_DATA_COMPLEX_REAL_KEY], value[_DATA_COMPLEX_IMAG_KEY])
     raise TypeError(f"Unknown complex class: {type_name}")
 
 
 def _deserialize(obj: Any) -> Any:
+    # Containers are only rebuilt when one of their items is decoded, so plain
+    # subtrees are returned as-is and the input is never modified.
     if isinstance(obj, Mapping):
         type_tag = obj.get(_DATA_TYPE_KEY)
         if isinstance(type_tag, str):
-            payload = dict(obj)
             if type_tag.startswith(_DATA_NUMPY_PREFIX):
-                return _numpy_from_dict(payload)
+                return _numpy_from_dict(obj)
             elif type_tag.startswith(_DATA_TUNITS_PREFIX):
-                return _tunits_from_dict(payload)
+                return _tunits_from_dict(obj)
             elif type_tag.startswith(_DATA_PYTHON_PREFIX):
-                return _complex_from_dict(payload)
+                return _complex_from_dict(obj)
             else:
                 logger.warning(f"Unknown type during deserialization: {type_tag}")
-        return {k: _deserialize(v) for k, v in obj.items()}
+        result = None
+        for k, v in obj.items():
+            decoded = _deserialize(v)
+            if decoded is not v:
+                if result is None:
+                    result = dict(obj)
+                result[k] = decoded
+        return obj if result is None else result
     if isinstance(obj, (list, tuple)):
-        return [_deserialize(v) for v in obj]
+        items = None
+        for i, v in enumerate(obj):
+            decoded = _deserialize(v)
+            if decoded is not v:
+                if items is None:
+                    items = list(obj)
+                items[i] = decoded
+        return obj if items is None else items
     return obj
 
 
@@ -174,6 +541,588 @@ def _is_custom_class(cls: type[Any]) -> bool:
     )
 
 
+def _is_array_annotation(annotation: Any) -> bool:
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union or origin is types.UnionType:
+        return any(_is_array_annotation(arg) for arg in typing.get_args(annotation))
+    if origin is typing.Annotated:
+        return _is_array_annotation(typing.get_args(annotation)[0])
+    cls = origin or annotation
+    return isinstance(cls, type) and issubclass(cls, (np.ndarray, tunits.ValueArray))
+
+
+@functools.cache
+def _array_field_names(cls: type[BaseModel]) -> frozenset[str]:
+    return frozenset(
+        name
+        for name, field in cls.model_fields.items()
+        if _is_array_annotation(field.annotation)
+    )
+
+
+_PLAIN_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+def _may_hold_custom_value(annotation: Any) -> bool:
+    """Return whether a field with this annotation may need `_serialize`."""
+    if annotation is None or annotation is type(None):
+        return False
+    origin = typing.get_origin(annotation)
+    if origin is typing.Literal:
+        return False
+    if origin is typing.Annotated:
+        return _may_hold_custom_value(typing.get_args(annotation)[0])
+    if origin is not None and not (
+        isinstance(origin, type) and issubclass(origin, np.ndarray)
+    ):
+        args = typing.get_args(annotation)
+        # Bare containers such as `dict` or `list` may hold anything
+        return not args or any(
+            _may_hold_custom_value(arg) for arg in args if arg is not Ellipsis
+        )
+    cls = origin or annotation
+    if not isinstance(cls, type):
+        # Any, TypeVar, unresolved forward references, ...
+        return True
+    if issubclass(cls, Model):
+        # Nested models are serialized by their own serializer
+        return False
+    if issubclass(cls, BaseModel):
+        return True
+    return _is_custom_class(cls) or not issubclass(cls, _PLAIN_TYPES)
+
+
+@functools.cache
+def _custom_field_keys(cls: type[BaseModel], by_alias: bool) -> tuple[str, ...]:
+    keys = [
+        (field.serialization_alias or field.alias or name) if by_alias else name
+        for name, field in cls.model_fields.items()
+        if _may_hold_custom_value(field.annotation)
+    ]
+    keys.extend(
+        (field.alias or name) if by_alias else name
+        for name, field in cls.model_computed_fields.items()
+        if _may_hold_custom_value(field.return_type)
+    )
+    return tuple(keys)
+
+
+@functools.cache
+def _field_array_encoders(
+    cls: type[BaseModel],
+    by_alias: bool,
+) -> dict[str, ArrayEncoder]:
+    encoders = {}
+    for name, field in cls.model_fields.items():
+        for metadata in field.metadata:
+            if isinstance(metadata, ArrayEncoding):
+                key = (
+                    (field.serialization_alias or field.alias or name)
+                    if by_alias
+                    else name
+                )
+                encoders[key] = _array_encoder_for(metadata)
+    return encoders
+
+
+def _is_tagged(value: Any) -> bool:
+    return isinstance(value, Mapping) and _DATA_TYPE_KEY in value
+
+
+def _needs_construction(annotation: Any) -> bool:
+    """Return whether decoded JSON data differs in type from validated data."""
+    if isinstance(annotation, type) and issubclass(
+        annotation, (BaseModel, enum.Enum, tuple)
+    ):
+        return True
+    origin = typing.get_origin(annotation)
+    if origin is tuple:
+        return True
+    return any(_needs_construction(arg) for arg in typing.get_args(annotation))
+
+
+@functools.cache
+def _constructed_field_annotations(
+    cls: type[BaseModel],
+) -> tuple[tuple[str, Any], ...]:
+    return tuple(
+        (name, field.annotation)
+        for name, field in cls.model_fields.items()
+        if _needs_construction(field.annotation)
+    )
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return (
+                _construct_model(annotation, value)
+                if isinstance(value, Mapping)
+                else value
+            )
+        if issubclass(annotation, enum.Enum):
+            try:
+                return annotation(value)
+            except ValueError:
+                # Another member of a union, e.g. `Color | str`
+                return value
+        if issubclass(annotation, tuple) and isinstance(value, list):
+            if hasattr(annotation, "_fields"):
+                # Named tuples take their items as separate arguments
+                return annotation(*value)
+            return annotation(value)
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is typing.Annotated:
+        return _construct_value(args[0], value)
+    if origin is typing.Union or origin is types.UnionType:
+        if value is None:
+            return value
+        # Assume the first union member that needs construction; data written
+        # by this library is not ambiguous in practice.
+        for arg in args:
+            if _needs_construction(arg):
+                return _construct_value(arg, value)
+        return value
+    if isinstance(origin, type) and issubclass(origin, Mapping):
+        if isinstance(value, Mapping) and len(args) == 2:
+            return {
+                _construct_value(args[0], k): _construct_value(args[1], v)
+                for k, v in value.items()
+            }
+        return value
+    if not isinstance(value, (list, tuple)):
+        return value
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            return tuple(_construct_value(args[0], v) for v in value)
+        if len(args) == len(value):
+            return tuple(
+                _construct_value(arg, v) for arg, v in zip(args, value, strict=True)
+            )
+        return tuple(value)
+    if args:
+        return [_construct_value(args[0], v) for v in value]
+    return value
+
+
+def _construct_model(cls: type[BaseModel], data: Mapping[str, Any]) -> Any:
+    """Build a model tree from decoded data without validation."""
+    nested = {
+        name: _construct_value(annotation, data[name])
+        for name, annotation in _constructed_field_annotations(cls)
+        if name in data
+    }
+    return cls.model_construct(**{**data, **nested})
+
+
+# Key in `__dict__` of the values memoized by `Model._cached`. Pydantic
+# compares, serializes and iterates over fields only, so the entry does not
+# change equality or output; copies drop it.
+_CACHE_KEY = "_model_cache"
+
+# Changes deferred by `MutableModel.batch`, keyed by `id()` of the model
+_batch_changes: dict[int, list[tuple[tuple[_PathKey, ...], Any]]] = {}
+
+
+def _fingerprint_array(digest: Any, value: np.ndarray) -> None:
+    digest.update(f"{value.shape}".encode())
+    if value.dtype.kind not in _BUFFER_DTYPE_KINDS:
+        digest.update(b"O")
+        for item in value.flat:
+            _fingerprint_update(digest, item)
+        return
+    # Hash little-endian bytes so that the digest does not depend on byte order
+    if value.dtype.byteorder == ">":
+        value = value.astype(value.dtype.newbyteorder("<"))
+    digest.update(value.dtype.str.encode())
+    digest.update(array_bytes(value))
+
+
+def _fingerprint_update(digest: Any, value: Any) -> None:
+    if isinstance(value, Model):
+        digest.update(b"M")
+        digest.update(value.fingerprint().encode())
+    elif isinstance(value, BaseModel):
+        digest.update(f"B{type(value).__qualname__}".encode())
+        _fingerprint_update(digest, dict(value))
+    elif value is None or isinstance(value, (bool, int, float, complex, str)):
+        digest.update(f"{type(value).__name__}:{value!r};".encode())
+    elif isinstance(value, bytes):
+        digest.update(f"bytes:{len(value)}:".encode())
+        digest.update(value)
+    elif isinstance(value, np.ndarray):
+        digest.update(b"A")
+        _fingerprint_array(digest, value)
+    elif isinstance(value, np.generic):
+        digest.update(b"S")
+        _fingerprint_array(digest, np.asarray(value))
+    elif isinstance(value, tunits.ValueArray):
+        # tunits stores magnitudes as floating point, so integer inputs are
+        # normalized to match values restored from their proto form.
+        magnitude = np.asarray(value.value)
+        if magnitude.dtype.kind != "c":
+            magnitude = magnitude.astype(np.float64)
+        digest.update(f"U{type(value).__name__}:{value.unit}:".encode())
+        _fingerprint_array(digest, magnitude)
+    elif isinstance(value, tunits.Value):
+        magnitude = complex(value.value)
+        digest.update(f"V{type(value).__name__}:{value.unit}:{magnitude!r};".encode())
+    elif isinstance(value, Mapping):
+        # Hash every entry separately and sort the digests for key order
+        # independence.
+        entries = []
+        for k, v in value.items():
+            entry = hashlib.sha256()
+            _fingerprint_update(entry, k)
+            _fingerprint_update(entry, v)
+            entries.append(entry.digest())
+        digest.update(f"D{len(entries)}:".encode())
+        for entry in sorted(entries):
+            digest.update(entry)
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"L{len(value)}:".encode())
+        for item in value:
+            _fingerprint_update(digest, item)
+    elif isinstance(value, (set, frozenset)):
+        entries = []
+        for item in value:
+            entry = hashlib.sha256()
+            _fingerprint_update(entry, item)
+            entries.append(entry.digest())
+        digest.update(f"E{len(entries)}:".encode())
+        for entry in sorted(entries):
+            digest.update(entry)
+    else:
+        raise TypeError(f"Cannot fingerprint value of type {type(value).__name__}")
+
+
+def _values_equal(a: Any, b: Any) -> bool:
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, np.ndarray):
+        return (
+            a.dtype == b.dtype
+            and a.shape == b.shape
+            and bool(np.array_equal(a, b, equal_nan=a.dtype.kind in "fc"))
+        )
+    if isinstance(a, tunits.ValueArray):
+        return str(a.unit) == str(b.unit) and _values_equal(
+            np.asarray(a.value), np.asarray(b.value)
+        )
+    if isinstance(a, tunits.Value):
+        return str(a.unit) == str(b.unit) and _values_equal(a.value, b.value)
+    if isinstance(a, (float, complex, np.inexact)):
+        # NaN is equal to itself so that identical models have no changes
+        return bool(np.array_equal(a, b, equal_nan=True))
+    try:
+        return bool(a == b)
+    except ValueError:
+        # Containers holding arrays compare element-wise
+        return False
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, Mapping):
+        return {k: _encode_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode_value(v) for v in value]
+    return _serialize(value)
+
+
+def _diff_values(
+    old: Any,
+    new: Any,
+    path: list[_PathKey],
+    changes: list[dict[str, Any]],
+) -> None:
+    if old is new:
+        return
+    if isinstance(old, Model) and type(old) is type(new):
+        for name in type(old).model_fields:
+            _diff_values(getattr(old, name), getattr(new, name), [*path, name], changes)
+        return
+    if isinstance(old, Mapping) and isinstance(new, Mapping):
+        changes.extend(
+            {_PATCH_OP_KEY: _PATCH_OP_REMOVE, _PATCH_PATH_KEY: [*path, key]}
+            for key in old
+            if key not in new
+        )
+        for key, value in new.items():
+            if key in old:
+                _diff_values(old[key], value, [*path, key], changes)
+            else:
+                changes.append(
+                    {
+                        _PATCH_OP_KEY: _PATCH_OP_SET,
+                        _PATCH_PATH_KEY: [*path, key],
+                        _PATCH_VALUE_KEY: _encode_value(value),
+                    }
+                )
+        return
+    if (
+        isinstance(old, (list, tuple))
+        and type(old) is type(new)
+        and len(old) == len(new)
+    ):
+        for index, (old_item, new_item) in enumerate(zip(old, new, strict=True)):
+            _diff_values(old_item, new_item, [*path, index], changes)
+        return
+    if not _values_equal(old, new):
+        changes.append(
+            {
+                _PATCH_OP_KEY: _PATCH_OP_SET,
+                _PATCH_PATH_KEY: path,
+                _PATCH_VALUE_KEY: _encode_value(new),
+            }
+        )
+
+
+# Marks a path as removed in `_replace_paths`
+_REMOVE = object()
+_UNCHANGED = object()
+# Item annotation of a container whose items cannot be validated one by one
+_UNKNOWN = object()
+
+_ADAPTER_CONFIG = ConfigDict(arbitrary_types_allowed=True)
+
+
+@functools.cache
+def _cached_type_adapter(annotation: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(annotation, config=_ADAPTER_CONFIG)
+
+
+def _validate_as(annotation: Any, value: Any) -> Any:
+    """Validate a value against a type annotation outside of a model."""
+    if annotation is Any:
+        return value
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if isinstance(value, annotation):
+            return value
+        return annotation.model_validate(value)
+    try:
+        adapter = _cached_type_adapter(annotation)
+    except TypeError:
+        # Annotations with unhashable metadata are not cached
+        adapter = TypeAdapter(annotation, config=_ADAPTER_CONFIG)
+    return adapter.validate_python(value)
+
+
+def _item_annotations(annotation: Any, key: _PathKey) -> tuple[Any, Any]:
+    """Return the key and item annotations of one entry of a container."""
+    if annotation is Any:
+        return Any, Any
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    cls = origin or annotation
+    if not isinstance(cls, type):
+        return Any, _UNKNOWN
+    if issubclass(cls, Mapping):
+        if not args:
+            return Any, Any
+        return (args[0], args[1]) if len(args) == 2 else (Any, _UNKNOWN)
+    if issubclass(cls, tuple):
+        if not args:
+            return Any, Any
+        # Fixed-length tuples are validated as a whole
+        return Any, args[0] if len(args) == 2 and args[1] is Ellipsis else _UNKNOWN
+    if issubclass(cls, list):
+        return Any, args[0] if args else Any
+    return Any, _UNKNOWN
+
+
+def _replace_child(
+    node: Any,
+    key: _PathKey,
+    changes: list[tuple[Any, Any]],
+    annotation: Any,
+    prefix: tuple[_PathKey, ...] = (),
+) -> tuple[Any, bool]:
+    """
+    Return the new value of `node[key]` after applying `changes` in order.
+
+    The flag is True if the value was replaced and must still be validated
+    as a whole. Otherwise only the changed items inside it were replaced,
+    and they are validated against `annotation`.
+    """
+    child = _UNCHANGED
+    nested: list[tuple[Any, Any]] = []
+    for rest, value in changes:
+        if rest:
+            nested.append((rest, value))
+            continue
+        # Replacing the child discards nested changes made before
+        nested.clear()
+        child = value
+    replaced = child is not _UNCHANGED
+    if nested:
+        if not replaced:
+            child = getattr(node, str(key)) if isinstance(node, Model) else node[key]
+        # Items of a replaced child are validated with the child as a whole
+        child = _replace_paths(
+            child, nested, Any if replaced else annotation, (*prefix, key)
+        )
+    return child, replaced
+
+
+@functools.cache
+def _has_custom_validators(cls: type[BaseModel]) -> bool:
+    decorators = cls.__pydantic_decorators__
+    return bool(
+        decorators.validators
+        or decorators.field_validators
+        or decorators.root_validators
+        or decorators.model_validators
+    )
+
+
+def _format_path(path: Sequence[_PathKey]) -> str:
+    """Return `path` as a dotted string."""
+    return ".".join(map(str, path))
+
+
+def _replace_model(
+    node: Model,
+    groups: Mapping[_PathKey, list[tuple[Any, Any]]],
+    prefix: tuple[_PathKey, ...] = (),
+) -> Model:
+    """Return a copy of `node` with fields replaced, validated on the final state."""
+    cls = type(node)
+    fields = cls.model_fields
+    children: dict[str, tuple[Any, bool]] = {}
+    for key, group in groups.items():
+        if not isinstance(key, str) or key not in fields:
+            raise KeyError(f"Unknown field: {_format_path((*prefix, key))!r}")
+        field = fields[key]
+        # Constraints on a field apply to its value as a whole
+        annotation = Any if field.metadata else field.annotation
+        child, replaced = _replace_child(node, key, group, annotation, prefix)
+        if child is _REMOVE:
+            raise KeyError(f"Cannot remove field: {_format_path((*prefix, key))!r}")
+        children[key] = (child, replaced or bool(field.metadata))
+    if _has_custom_validators(cls):
+        # Validators may relate several fields, so they run once on the
+        # complete new state rather than after every replaced field.
+        data = {}
+        for name, field in fields.items():
+            alias = (
+                field.validation_alias
+                if isinstance(field.validation_alias, str)
+                else field.alias or name
+            )
+            data[alias] = children[name][0] if name in children else getattr(node, name)
+        data.update(node.__pydantic_extra__ or {})
+        model = cls.model_validate(data)
+        fields_set = node.__pydantic_fields_set__ | children.keys()
+        object.__setattr__(model, "__pydantic_fields_set__", fields_set)
+        return model
+    copy = node.model_copy()
+    private = copy.__pydantic_private__
+    lazy_payload = private.get("_lazy_payload") if private else None
+    if private is not None and lazy_payload:
+        # Untouched lazy fields stay lazy
+        remaining = {k: v for k, v in lazy_payload.items() if k not in children}
+        private["_lazy_payload"] = remaining or None
+    for key, (child, validate) in children.items():
+        if validate:
+            # Without model validators this validates the replaced field only
+            copy.__pydantic_validator__.validate_assignment(copy, key, child)
+        else:
+            # Only the changed items were replaced, and they are validated
+            vars(copy)[key] = child
+            copy.__pydantic_fields_set__.add(key)
+    return copy
+
+
+def _replace_paths(
+    node: Any,
+    changes: Sequence[tuple[Sequence[_PathKey], Any]],
+    annotation: Any = Any,
+    prefix: tuple[_PathKey, ...] = (),
+) -> Any:
+    """
+    Return a copy of `node` with several paths replaced.
+
+    Changes are applied in order. Every node on a changed path is copied
+    once, and all other children are shared with `node`. Models are
+    validated once on their final state. Items replaced in a mapping or list
+    are validated one by one against the item type of `annotation`, so the
+    cost does not depend on the size of the container. A value of `_REMOVE`
+    deletes a mapping key or list item. `prefix` is the path of `node`,
+    used in error messages.
+    """
+    groups: dict[_PathKey, list[tuple[Any, Any]]] = {}
+    for path, value in changes:
+        groups.setdefault(path[0], []).append((path[1:], value))
+    if isinstance(node, Model):
+        return _replace_model(node, groups, prefix)
+    items: Any
+    if isinstance(node, Mapping):
+        items = dict(node)
+    elif isinstance(node, (list, tuple)):
+        items = list(node)
+    else:
+        path = _format_path((*prefix, next(iter(groups))))
+        raise KeyError(f"Cannot index {type(node).__name__} at {path!r}")
+    removed = []
+    validate_whole = False
+    for key, group in groups.items():
+        if not isinstance(node, Mapping):
+            path = _format_path((*prefix, key))
+            if not isinstance(key, int):
+                raise KeyError(f"Cannot index {type(node).__name__} at {path!r}")
+            if not -len(items) <= key < len(items):
+                raise KeyError(f"Index out of range: {path!r}")
+        key_annotation, item_annotation = _item_annotations(annotation, key)
+        if item_annotation is _UNKNOWN:
+            validate_whole = True
+            item_annotation = Any
+        child, replaced = _replace_child(node, key, group, item_annotation, prefix)
+        if child is _REMOVE:
+            if isinstance(node, Mapping):
+                del items[key]
+            else:
+                # Items are deleted once all others are replaced
+                removed.append(range(len(items))[int(key)])
+            continue
+        if replaced:
+            child = _validate_as(item_annotation, child)
+        if isinstance(node, Mapping) and key not in node:
+            key = _validate_as(key_annotation, key)
+        items[key] = child
+    if isinstance(items, list):
+        for index in sorted(removed, reverse=True):
+            del items[index]
+        if isinstance(node, tuple):
+            items = type(node)(items)
+    if validate_whole:
+        items = _validate_as(annotation, items)
+    return items
+
+
+def _parse_paths(
+    changes: Mapping[str | tuple[_PathKey, ...], Any] | None,
+    fields: Mapping[str, Any],
+) -> list[tuple[tuple[_PathKey, ...], Any]]:
+    """Convert dotted-string and tuple paths to key tuples, in order."""
+    return [
+        (tuple(key.split(".")) if isinstance(key, str) else key, value)
+        for key, value in {**(changes or {}), **fields}.items()
+    ]
+
+
+def _replace_path(
+    node: Any,
+    path: Sequence[_PathKey],
+    value: Any,
+    remove: bool = False,
+) -> Any:
+    """Return a copy of `node` with `path` replaced, sharing untouched children."""
+    return _replace_paths(node, [(path, _REMOVE if remove else value)])
+
+
 class NumpyTunitsJsonSchema(GenerateJsonSchema):
     """JSON schema generator that supports NumPy and tunits types."""
 
@@ -198,14 +1147,320 @@ class Model(BaseModel):
         arbitrary_types_allowed=True,
     )
 
+    # Undecoded payloads of array fields for instances loaded with lazy=True
+    _lazy_payload: dict[str, Any] | None = PrivateAttr(default=None)
+
+    if not TYPE_CHECKING:
+        # Hidden from type checkers so that unknown attributes are still reported
+        def __getattr__(self, name: str) -> Any:
+            """Decode a lazy field on first access."""
+            private = object.__getattribute__(self, "__pydantic_private__")
+            lazy_payload = private.get("_lazy_payload") if private else None
+            if lazy_payload and name in lazy_payload:
+                self._load_lazy_field(name)
+                return self.__dict__[name]
+            return super().__getattr__(name)
+
+    def _load_lazy_field(self, name: str) -> None:
+        payload = self._lazy_payload
+        if payload is None or name not in payload:
+            return
+        # Fields set after loading, e.g. by `model_copy(update=...)`, win
+        if name not in vars(self):
+            value = _deserialize(payload[name])
+            self.__pydantic_validator__.validate_assignment(self, name, value)
+        del payload[name]
+        if not payload:
+            self._lazy_payload = None
+
+    def _load_lazy_fields(self) -> None:
+        if self._lazy_payload:
+            for name in list(self._lazy_payload):
+                self._load_lazy_field(name)
+
+    def __copy__(self) -> Self:
+        """Return a shallow copy that decodes its lazy fields independently."""
+        copy = super().__copy__()
+        # `model_copy(update=...)` changes fields of the copy afterwards
+        vars(copy).pop(_CACHE_KEY, None)
+        private = copy.__pydantic_private__
+        if private is not None and private.get("_lazy_payload"):
+            private["_lazy_payload"] = dict(private["_lazy_payload"])
+        return copy
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> Self:
+        """Return a deep copy without memoized values."""
+        copy = super().__deepcopy__(memo)
+        vars(copy).pop(_CACHE_KEY, None)
+        return copy
+
+    def _cached(self, key: str, compute: Callable[[], T]) -> T:
+        """Return `compute()`, memoized per instance for frozen models."""
+        if not self.model_config.get("frozen"):
+            return compute()
+        cache = vars(self).setdefault(_CACHE_KEY, {})
+        if key not in cache:
+            cache[key] = compute()
+        return cache[key]
+
+    def __eq__(self, other: object) -> bool:
+        """Compare field values, decoding lazy fields first."""
+        if isinstance(other, Model):
+            self._load_lazy_fields()
+            other._load_lazy_fields()
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        """Hash field values, decoding lazy fields first."""
+        self._load_lazy_fields()
+        return hash(tuple(vars(self).get(name) for name in type(self).model_fields))
+
+    def __iter__(self) -> Any:
+        """Iterate over field names and values, decoding lazy fields first."""
+        self._load_lazy_fields()
+        return super().__iter__()
+
+    def __repr_args__(self) -> Any:
+        """Return the fields shown by `repr`, decoding lazy fields first."""
+        self._load_lazy_fields()
+        return super().__repr_args__()
+
+    @classmethod
+    def _from_payload(
+        cls,
+        data: Mapping[str, Any],
+        lazy: bool = False,
+        trusted: bool = False,
+    ) -> Self:
+        meta = data.get(_META_KEY)
+        trusted = (
+            trusted
+            and isinstance(meta, Mapping)
+            and meta.get(_META_VERSION_KEY) == SERIALIZATION_VERSION
+        )
+        payload = {k: v for k, v in data.items() if k != _META_KEY}
+        deferred = {}
+        # Fields are validated one at a time when loading lazily, so models
+        # whose validators may read several fields, and payloads with extra
+        # keys, go through regular validation instead.
+        lazy = (
+            lazy
+            and not _has_custom_validators(cls)
+            and payload.keys() <= cls.model_fields.keys()
+        )
+        if lazy:
+            deferred = {
+                name: payload.pop(name)
+                for name in _array_field_names(cls)
+                if _is_tagged(payload.get(name))
+            }
+            missing = any(
+                field.is_required() and name not in payload and name not in deferred
+                for name, field in cls.model_fields.items()
+            )
+            if missing:
+                # Let regular validation report the error
+                payload.update(deferred)
+                deferred = {}
+        if trusted:
+            model = _construct_model(cls, _deserialize(payload))
+        elif deferred:
+            model = cls.model_construct()
+            for name, value in payload.items():
+                if name in cls.model_fields:
+                    cls.__pydantic_validator__.validate_assignment(
+                        model, name, _deserialize(value)
+                    )
+        else:
+            return cls.model_validate(_deserialize(payload))
+        # model_construct initializes the private attribute storage
+        if deferred and model.__pydantic_private__ is not None:
+            model.__pydantic_private__["_lazy_payload"] = deferred
+            # Drop defaults filled in by model_construct so that `__getattr__`
+            # is reached for every deferred field
+            for name in deferred:
+                vars(model).pop(name, None)
+            model.__pydantic_fields_set__.update(deferred)
+        return model
+
     @model_serializer(mode="wrap")
     def _serialize_model(
         self,
         handler: SerializerFunctionWrapHandler,
+        info: SerializationInfo,
     ) -> Any:
         """Serialize the model with custom value handling."""
+        self._load_lazy_fields()
         data = handler(self)
-        return _serialize(data)
+        context = info.context
+        array_encoder = (
+            context.get(_CONTEXT_ARRAY_ENCODER_KEY)
+            if isinstance(context, Mapping)
+            else None
+        )
+        if not isinstance(data, dict):
+            return _serialize(data, array_encoder)
+        by_alias = bool(info.by_alias)
+        # Encoders passed by the caller take precedence over field options
+        field_encoders = (
+            {}
+            if array_encoder is not None
+            else _field_array_encoders(type(self), by_alias)
+        )
+        # Only fields whose annotation admits NumPy, tunits or complex values
+        # are walked; everything else is already in its final form.
+        for key in _custom_field_keys(type(self), by_alias):
+            if key in data:
+                encoder = field_encoders.get(key, array_encoder)
+                data[key] = _serialize(data[key], encoder)
+        # Extra attributes have no annotation, so they are always walked
+        for key in self.__pydantic_extra__ or ():
+            if key in data:
+                data[key] = _serialize(data[key], array_encoder)
+        return data
+
+    def fingerprint(self) -> str:
+        """
+        Return a stable digest of the model content.
+
+        The digest covers the class name and every field value. Mapping key
+        order does not matter, arrays are hashed by dtype, shape and raw
+        bytes, and tunits values by value and unit. Frozen models compute
+        the digest once and nested models reuse their own cached digests.
+
+        Returns
+        -------
+        str
+            Hexadecimal SHA-256 digest.
+
+        Raises
+        ------
+        TypeError
+            If a field holds a value of an unsupported type.
+        """
+        return self._cached("fingerprint", self._compute_fingerprint)
+
+    def _compute_fingerprint(self) -> str:
+        self._load_lazy_fields()
+        digest = hashlib.sha256()
+        cls = type(self)
+        digest.update(f"{cls.__module__}.{cls.__qualname__}".encode())
+        for name in sorted(cls.model_fields):
+            digest.update(f"{name}=".encode())
+            _fingerprint_update(digest, getattr(self, name))
+        return digest.hexdigest()
+
+    def diff(self, other: Self) -> dict[str, Any]:
+        """
+        Return a patch that turns this model into another one.
+
+        Parameters
+        ----------
+        other
+            Target model of the same class.
+
+        Returns
+        -------
+        dict[str, Any]
+            JSON-serializable patch listing the changed paths. Changed values
+            use the same tagged encoding as `to_dict`.
+
+        Raises
+        ------
+        TypeError
+            If `other` is not an instance of the same class.
+        """
+        if type(other) is not type(self):
+            raise TypeError(
+                f"Cannot diff {type(self).__name__} with {type(other).__name__}."
+            )
+        changes: list[dict[str, Any]] = []
+        _diff_values(self, other, [], changes)
+        return {
+            _META_KEY: {_META_VERSION_KEY: SERIALIZATION_VERSION},
+            _PATCH_BASE_KEY: self.fingerprint(),
+            _PATCH_CHANGES_KEY: changes,
+        }
+
+    def apply_patch(self, patch: Mapping[str, Any]) -> Self:
+        """
+        Create a new model by applying a patch returned by `diff`.
+
+        Only the nodes on changed paths are copied and validated; all other
+        nested models and arrays are shared with this model.
+
+        Parameters
+        ----------
+        patch
+            Patch created by `diff` on a model equal to this one.
+
+        Returns
+        -------
+        Self
+            Patched model.
+
+        Raises
+        ------
+        ValueError
+            If the patch was created from a model with different content.
+        KeyError
+            If a patch path does not exist in the model.
+        """
+        base = patch.get(_PATCH_BASE_KEY)
+        if base is not None and base != self.fingerprint():
+            raise ValueError("Patch was created from a different model.")
+        changes = [
+            (
+                change[_PATCH_PATH_KEY],
+                _REMOVE
+                if change[_PATCH_OP_KEY] == _PATCH_OP_REMOVE
+                else _deserialize(change[_PATCH_VALUE_KEY]),
+            )
+            for change in patch[_PATCH_CHANGES_KEY]
+        ]
+        if not changes:
+            return self
+        return _replace_paths(self, changes)
+
+    def derive(
+        self,
+        changes: Mapping[str | tuple[_PathKey, ...], Any] | None = None,
+        /,
+        **fields: Any,
+    ) -> Self:
+        """
+        Create a variant of this model with some nested values replaced.
+
+        Only the models, mappings and lists on changed paths are copied, and
+        only the replaced fields are validated. Every untouched child model
+        and array is shared with this model by reference, so the cost of a
+        variant scales with the size of the change.
+
+        Parameters
+        ----------
+        changes
+            New values keyed by path. A path is a field name, a dotted string
+            such as `"frequency.channel_to_frequency.q0"`, or a tuple of keys
+            that may include list indices.
+        **fields
+            New values of top-level fields.
+
+        Returns
+        -------
+        Self
+            Derived model.
+
+        Raises
+        ------
+        pydantic.ValidationError
+            If a new value is invalid.
+        KeyError
+            If a path does not exist in the model.
+        """
+        paths = _parse_paths(changes, fields)
+        if not paths:
+            return self
+        return _replace_paths(self, paths)
 
     @classmethod
     def json_schema(cls, **kwargs) -> dict[str, Any]:
@@ -214,34 +1469,494 @@ class Model(BaseModel):
         return cls.model_json_schema(**kwargs)
 
     @classmethod
-    def from_dict(cls, data: dict) -> Self:
-        """Create a model instance from a dictionary."""
-        payload = dict(data)
-        payload.pop(_META_KEY, None)
-        return cls.model_validate(_deserialize(payload))
+    def from_dict(
+        cls,
+        data: dict,
+        lazy: bool = False,
+        trusted: bool = False,
+    ) -> Self:
+        """
+        Create a model instance from a dictionary.
+
+        Parameters
+        ----------
+        data
+            Serialized model.
+        lazy
+            If True, NumPy and tunits array fields are decoded and validated
+            on first access instead of while loading. Models with custom
+            validators are always loaded eagerly.
+        trusted
+            If True and `data` was written with the current serialization
+            version, build the model with `model_construct` and skip
+            validation. Nested models, tuples and Enum members are
+            rebuilt from the field annotations; other values keep their
+            decoded JSON form. Only use this for data written by this library.
+
+        Returns
+        -------
+        Self
+            Restored model.
+        """
+        return cls._from_payload(data, lazy=lazy, trusted=trusted)
 
     @classmethod
-    def from_json(cls, data: str) -> Self:
-        """Create a model instance from a JSON string."""
-        payload = json.loads(data)
+    def from_json(
+        cls,
+        data: str | bytes,
+        lazy: bool = False,
+        trusted: bool = False,
+        backend: str | None = None,
+    ) -> Self:
+        """
+        Create a model instance from a JSON string or UTF-8 encoded bytes.
+
+        Parameters
+        ----------
+        data
+            Serialized model.
+        lazy
+            If True, NumPy and tunits array fields are decoded and validated
+            on first access instead of while loading. Models with custom
+            validators are always loaded eagerly.
+        trusted
+            If True and `data` was written with the current serialization
+            version, build the model with `model_construct` and skip
+            validation. Nested models, tuples and Enum members are
+            rebuilt from the field annotations; other values keep their
+            decoded JSON form. Only use this for data written by this library.
+        backend
+            Name of the JSON backend. Defaults to the fastest installed one.
+
+        Returns
+        -------
+        Self
+            Restored model.
+        """
+        payload = get_json_backend(backend).loads(data)
         if isinstance(payload, dict):
-            payload = dict(payload)
-            payload.pop(_META_KEY, None)
+            return cls._from_payload(payload, lazy=lazy, trusted=trusted)
         return cls.model_validate(_deserialize(payload))
 
-    def to_dict(self) -> dict:
-        """Serialize the model to a dictionary."""
-        data = self.model_dump()
+    @classmethod
+    def from_container(
+        cls,
+        path: str | os.PathLike[str],
+        mmap_mode: MmapMode | None = "r",
+        trusted: bool = False,
+    ) -> Self:
+        """
+        Create a model instance from a container file.
+
+        Parameters
+        ----------
+        path
+            Container file written by `to_container`.
+        mmap_mode
+            Mode passed to `numpy.memmap` for array segments ("r", "r+" or
+            "c"). If None, arrays are read into memory instead.
+        trusted
+            If True and the file was written with the current serialization
+            version, build the model with `model_construct` and skip
+            validation. See `from_dict`.
+
+        Returns
+        -------
+        Self
+            Restored model. Array fields are memory-mapped views of the file
+            unless `mmap_mode` is None.
+        """
+        header, data_offset = read_container(path)
+        payload = _resolve_segments(header, path, data_offset, mmap_mode)
+        return cls._from_payload(payload, trusted=trusted)
+
+    def to_dict(
+        self, array_encoding: ArrayEncoding | ArrayEncoder | None = None
+    ) -> dict:
+        """
+        Serialize the model to a dictionary.
+
+        Parameters
+        ----------
+        array_encoding
+            Compression and data type options for every NumPy array, or an
+            `ArrayEncoder` that may store arrays out of band. If None,
+            options attached to fields with `typing.Annotated` apply.
+
+        Returns
+        -------
+        dict
+            Serialized model.
+        """
+        context = None
+        if isinstance(array_encoding, ArrayEncoding):
+            context = {_CONTEXT_ARRAY_ENCODER_KEY: _array_encoder_for(array_encoding)}
+        elif array_encoding is not None:
+            context = {_CONTEXT_ARRAY_ENCODER_KEY: array_encoding}
+        data = self.model_dump(context=context)
         if isinstance(data, dict):
             data[_META_KEY] = {_META_VERSION_KEY: SERIALIZATION_VERSION}
         return data
 
-    def to_json(self, indent: int | None = None) -> str:
+    def to_json(
+        self,
+        indent: int | None = None,
+        backend: str | None = None,
+        array_encoding: ArrayEncoding | None = None,
+    ) -> str:
         """Serialize the model to a JSON string."""
         # NOTE: Pydantic's built-in model_dump_json does not support custom serialization well.
         # return self.model_dump_json(indent=indent)
-        data = self.to_dict()
-        return json.dumps(data, ensure_ascii=False, indent=indent)
+        data = self.to_dict(array_encoding)
+        return get_json_backend(backend).dumps(data, indent=indent)
+
+    def to_json_bytes(
+        self,
+        indent: int | None = None,
+        backend: str | None = None,
+        array_encoding: ArrayEncoding | None = None,
+    ) -> bytes:
+        """Serialize the model to UTF-8 encoded JSON bytes."""
+        data = self.to_dict(array_encoding)
+        return get_json_backend(backend).dumps_bytes(data, indent=indent)
+
+    def to_container(
+        self,
+        path: str | os.PathLike[str],
+        preallocate: bool = False,
+    ) -> None:
+        """
+        Serialize the model to a container file.
+
+        The file holds a JSON header with all non-array fields, followed by
+        the raw bytes of every NumPy array aligned for memory mapping.
+
+        Parameters
+        ----------
+        path
+            Destination file path.
+        preallocate
+            If True, array contents are not written. Their segments are
+            zero-filled so that they can be filled in later through
+            `from_container(path, mmap_mode="r+")`.
+        """
+        encoder = _SegmentEncoder()
+        header = self.to_dict(encoder)
+        write_container(path, header, encoder.segments, preallocate=preallocate)
+
+    async def to_json_async(
+        self,
+        indent: int | None = None,
+        executor: Executor | None = None,
+    ) -> str:
+        """
+        Serialize the model to a JSON string without blocking the event loop.
+
+        Encoding runs in `executor`, or in the event loop's default executor
+        if None. The number of concurrent async operations is limited; see
+        `measurement_config.core.aio.set_concurrency_limit`.
+        """
+        from . import aio
+
+        return await aio.to_json(self, indent=indent, executor=executor)
+
+    @classmethod
+    async def from_json_async(
+        cls,
+        data: str | bytes,
+        lazy: bool = False,
+        trusted: bool = False,
+        executor: Executor | None = None,
+    ) -> Self:
+        """
+        Create a model instance from JSON without blocking the event loop.
+
+        Decoding runs in `executor`, or in the event loop's default executor
+        if None. See `from_json` for the other parameters.
+        """
+        from . import aio
+
+        return await aio.from_json(
+            cls, data, lazy=lazy, trusted=trusted, executor=executor
+        )
+
+    async def save_json_async(
+        self,
+        path: str | os.PathLike[str],
+        indent: int | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        """
+        Write the model to a JSON file without blocking the event loop.
+
+        The file is written in chunks to a temporary file that replaces
+        `path` only once complete, so cancelling the coroutine never leaves
+        a partial file behind.
+
+        Parameters
+        ----------
+        path
+            Destination file.
+        indent
+            Indentation of the JSON output.
+        executor
+            Executor for encoding and file I/O. Defaults to the event loop's
+            default executor.
+        """
+        from . import aio
+
+        await aio.save_json(self, path, indent=indent, executor=executor)
+
+    @classmethod
+    async def load_json_async(
+        cls,
+        path: str | os.PathLike[str],
+        lazy: bool = False,
+        trusted: bool = False,
+        executor: Executor | None = None,
+    ) -> Self:
+        """
+        Read a model from a JSON file without blocking the event loop.
+
+        Parameters
+        ----------
+        path
+            File written by `save_json_async` or `to_json`.
+        lazy
+            If True, array fields are decoded on first access.
+        trusted
+            If True, skip validation of data written with the current
+            serialization version. See `from_dict`.
+        executor
+            Executor for decoding and file I/O. Defaults to the event loop's
+            default executor.
+
+        Returns
+        -------
+        Self
+            Restored model.
+        """
+        from . import aio
+
+        return await aio.load_json(
+            cls, path, lazy=lazy, trusted=trusted, executor=executor
+        )
+
+    @classmethod
+    def to_json_many(
+        cls,
+        models: Sequence[Model],
+        indent: int | None = None,
+        max_workers: int | None = None,
+        chunksize: int = 8,
+        executor: Executor | None = None,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Serialize many models to JSON strings in parallel.
+
+        Models are sent to worker processes in chunks. Large arrays are
+        passed through shared memory instead of being pickled.
+
+        Parameters
+        ----------
+        models
+            Models to serialize.
+        indent
+            Indentation of the JSON output.
+        max_workers
+            Number of worker processes. Defaults to the number of CPUs.
+        chunksize
+            Number of models sent to a worker at once.
+        executor
+            Existing process pool to use instead of starting a new one.
+        return_exceptions
+            If True, failed items hold their exception in the result list
+            instead of raising `BulkError`.
+
+        Returns
+        -------
+        list[Any]
+            JSON strings in input order.
+
+        Raises
+        ------
+        BulkError
+            If a model fails to serialize and `return_exceptions` is False.
+            The error maps input indices to exceptions.
+        """
+        from .bulk import run_bulk, to_json
+
+        return run_bulk(
+            functools.partial(to_json, indent=indent),
+            models,
+            max_workers=max_workers,
+            chunksize=chunksize,
+            executor=executor,
+            return_exceptions=return_exceptions,
+        )
+
+    @classmethod
+    def from_json_many(
+        cls,
+        data: Sequence[str | bytes],
+        trusted: bool = False,
+        max_workers: int | None = None,
+        chunksize: int = 8,
+        executor: Executor | None = None,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Create many model instances from JSON in parallel.
+
+        Parameters
+        ----------
+        data
+            Serialized models.
+        trusted
+            If True, skip validation of data written with the current
+            serialization version. See `from_dict`.
+        max_workers
+            Number of worker processes. Defaults to the number of CPUs.
+        chunksize
+            Number of documents sent to a worker at once.
+        executor
+            Existing process pool to use instead of starting a new one.
+        return_exceptions
+            If True, failed items hold their exception in the result list
+            instead of raising `BulkError`.
+
+        Returns
+        -------
+        list[Any]
+            Restored models in input order.
+
+        Raises
+        ------
+        BulkError
+            If a document fails to load and `return_exceptions` is False.
+        """
+        from .bulk import from_json, run_bulk
+
+        return run_bulk(
+            functools.partial(from_json, cls=cls, trusted=trusted),
+            data,
+            max_workers=max_workers,
+            chunksize=chunksize,
+            executor=executor,
+            return_exceptions=return_exceptions,
+        )
+
+    @classmethod
+    def to_json_files(
+        cls,
+        models: Sequence[Model],
+        paths: Sequence[str | os.PathLike[str]],
+        indent: int | None = None,
+        max_workers: int | None = None,
+        chunksize: int = 8,
+        executor: Executor | None = None,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Write many models to JSON files in parallel.
+
+        Each worker writes its files directly, so the JSON text is never
+        sent back to the calling process.
+
+        Parameters
+        ----------
+        models
+            Models to serialize.
+        paths
+            Destination file for each model.
+        indent
+            Indentation of the JSON output.
+        max_workers
+            Number of worker processes. Defaults to the number of CPUs.
+        chunksize
+            Number of models sent to a worker at once.
+        executor
+            Existing process pool to use instead of starting a new one.
+        return_exceptions
+            If True, failed items hold their exception in the result list
+            instead of raising `BulkError`.
+
+        Returns
+        -------
+        list[Any]
+            None for each written file, in input order.
+
+        Raises
+        ------
+        BulkError
+            If a file fails to be written and `return_exceptions` is False.
+        ValueError
+            If `models` and `paths` have different lengths.
+        """
+        from .bulk import run_bulk, to_json_file
+
+        if len(models) != len(paths):
+            raise ValueError("models and paths must have the same length.")
+        return run_bulk(
+            functools.partial(to_json_file, indent=indent),
+            list(zip(models, paths, strict=True)),
+            max_workers=max_workers,
+            chunksize=chunksize,
+            executor=executor,
+            return_exceptions=return_exceptions,
+        )
+
+    @classmethod
+    def from_json_files(
+        cls,
+        paths: Sequence[str | os.PathLike[str]],
+        trusted: bool = False,
+        max_workers: int | None = None,
+        chunksize: int = 8,
+        executor: Executor | None = None,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Read many models from JSON files in parallel.
+
+        Parameters
+        ----------
+        paths
+            Files written by `to_json` or `to_json_files`.
+        trusted
+            If True, skip validation of data written with the current
+            serialization version. See `from_dict`.
+        max_workers
+            Number of worker processes. Defaults to the number of CPUs.
+        chunksize
+            Number of files sent to a worker at once.
+        executor
+            Existing process pool to use instead of starting a new one.
+        return_exceptions
+            If True, failed items hold their exception in the result list
+            instead of raising `BulkError`.
+
+        Returns
+        -------
+        list[Any]
+            Restored models in input order.
+
+        Raises
+        ------
+        BulkError
+            If a file fails to load and `return_exceptions` is False.
+        """
+        from .bulk import from_json_file, run_bulk
+
+        return run_bulk(
+            functools.partial(from_json_file, cls=cls, trusted=trusted),
+            paths,
+            max_workers=max_workers,
+            chunksize=chunksize,
+            executor=executor,
+            return_exceptions=return_exceptions,
+        )
 
 
 class MutableModel(Model):
@@ -251,3 +1966,95 @@ class MutableModel(Model):
         frozen=False,
         validate_assignment=True,
     )
+
+    if not TYPE_CHECKING:
+        # Hidden from type checkers so that unknown attributes are still reported
+        def __setattr__(self, name: str, value: Any) -> None:
+            """Assign a field, deferring validation inside `batch`."""
+            pending = _batch_changes.get(id(self))
+            if pending is None or name not in type(self).model_fields:
+                super().__setattr__(name, value)
+                return
+            pending.append(((name,), value))
+            self.__dict__[name] = value
+
+    def update(
+        self,
+        changes: Mapping[str | tuple[_PathKey, ...], Any] | None = None,
+        /,
+        **fields: Any,
+    ) -> None:
+        """
+        Apply several changes and validate them together.
+
+        Changes are applied in order to a copy of the changed fields, which
+        replaces them only if the result validates. Validation runs once, on
+        the final state, so validators that relate several fields see all
+        changes together. Nested models that no change touches are not
+        validated again, and nested models on a changed path are replaced by
+        updated copies.
+
+        Parameters
+        ----------
+        changes
+            New values keyed by path. A path is a field name, a dotted string
+            such as `"frequency.channel_to_frequency.q0"`, or a tuple of keys
+            that may include list indices.
+        **fields
+            New values of top-level fields.
+
+        Raises
+        ------
+        pydantic.ValidationError
+            If a new value is invalid. The model is left unchanged.
+        KeyError
+            If a path does not exist in the model.
+        """
+        paths = _parse_paths(changes, fields)
+        pending = _batch_changes.get(id(self))
+        if pending is not None:
+            pending.extend(paths)
+        else:
+            self._apply_changes(paths)
+
+    def _apply_changes(self, paths: list[tuple[tuple[_PathKey, ...], Any]]) -> None:
+        if not paths:
+            return
+        updated = _replace_paths(self, paths)
+        vars(self).update(vars(updated))
+        self.__pydantic_fields_set__.update(updated.__pydantic_fields_set__)
+        if self.__pydantic_private__ is not None and updated.__pydantic_private__:
+            self.__pydantic_private__.update(updated.__pydantic_private__)
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[Self]:
+        """
+        Defer validation of field changes until the end of a `with` block.
+
+        Field assignments inside the block take effect immediately without
+        validation; changes made with `update` are applied when the block
+        exits. All of them are then validated as by a single `update` call.
+        If the block raises or validation fails, the model is restored to its
+        state before the block. Nested `batch` blocks join the outer one.
+
+        Yields
+        ------
+        Self
+            This model.
+        """
+        if id(self) in _batch_changes:
+            yield self
+            return
+        state = dict(vars(self))
+        fields_set = set(self.__pydantic_fields_set__)
+        pending: list[tuple[tuple[_PathKey, ...], Any]] = []
+        _batch_changes[id(self)] = pending
+        try:
+            yield self
+        finally:
+            del _batch_changes[id(self)]
+            vars(self).clear()
+            vars(self).update(state)
+            self.__pydantic_fields_set__.clear()
+            self.__pydantic_fields_set__.update(fields_set)
+        self._apply_changes(pending)
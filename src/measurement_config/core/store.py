@@ -0,0 +1,437 @@
+"""Content-addressed local store for models with an embedded index."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import tempfile
+import time
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, NamedTuple, TypeVar, cast
+
+import numpy as np
+from typing_extensions import Self
+
+from .container import array_bytes
+from .files import set_default_mode
+from .json_backend import get_json_backend
+from .model import (
+    MmapMode,
+    Model,
+    external_array_dict,
+    external_array_layout,
+    is_buffer_array,
+)
+
+ModelT = TypeVar("ModelT", bound=Model)
+
+TagValue = str | int | float | bool
+
+DEFAULT_BLOB_THRESHOLD = 4096
+
+_DATA_ENCODING_BLOB = "blob"
+_DATA_BLOB_DIGEST_KEY = "digest"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    digest TEXT PRIMARY KEY,
+    class TEXT NOT NULL,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS objects_class_created ON objects (class, created);
+CREATE INDEX IF NOT EXISTS objects_created ON objects (created);
+CREATE TABLE IF NOT EXISTS tags (
+    digest TEXT NOT NULL REFERENCES objects (digest),
+    key TEXT NOT NULL,
+    value,
+    PRIMARY KEY (digest, key, value)
+);
+CREATE INDEX IF NOT EXISTS tags_key_value ON tags (key, value);
+"""
+
+
+class StoreEntry(NamedTuple):
+    """Handle to a model in a `ModelStore`; the model is loaded on demand."""
+
+    store: ModelStore
+    digest: str
+    class_name: str
+    created: float
+
+    def load(
+        self,
+        cls: type[ModelT] | None = None,
+        mmap_mode: MmapMode | None = "r",
+        trusted: bool = False,
+    ) -> ModelT:
+        """
+        Load the model.
+
+        Parameters
+        ----------
+        cls
+            Model class. Defaults to the class recorded when the model was
+            stored.
+        mmap_mode
+            Mode passed to `numpy.memmap` for shared array blobs. If None,
+            arrays are read into memory instead.
+        trusted
+            If True, skip validation. See `ModelStore.get`.
+
+        Returns
+        -------
+        ModelT
+            Stored model.
+        """
+        return self.store.get(
+            self.digest, cls=cls, mmap_mode=mmap_mode, trusted=trusted
+        )
+
+
+def _class_name(cls: type[Model]) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _resolve_class(name: str) -> type[Model]:
+    """Return the loaded model class recorded as `name` in the index."""
+    # Only classes that are already defined are considered, so a tampered
+    # index cannot make the store import arbitrary modules
+    found = None
+    pending = [Model]
+    while pending:
+        cls = pending.pop()
+        if _class_name(cls) == name:
+            found = cls
+        pending.extend(cls.__subclasses__())
+    if found is None:
+        raise TypeError(
+            f"Unknown model class: {name}. Import the module that defines it "
+            "or pass `cls`."
+        )
+    return found
+
+
+def _write_atomic(path: Path, chunks: Sequence[bytes | memoryview]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            set_default_mode(f.fileno())
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _object_path(root: Path, digest: str) -> Path:
+    return root / "objects" / digest[:2] / f"{digest}.json"
+
+
+def _blob_path(root: Path, digest: str) -> Path:
+    return root / "blobs" / digest[:2] / digest
+
+
+def _tag_value(value: Any) -> TagValue:
+    if isinstance(value, Model):
+        return value.fingerprint()
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    raise TypeError(f"Unsupported tag value type: {type(value).__name__}")
+
+
+def _index_value(model: Model, path: str) -> TagValue | None:
+    """Return the tag value at a dotted path, or None if it cannot be indexed."""
+    value: Any = model
+    try:
+        for part in path.split("."):
+            value = value[part] if isinstance(value, Mapping) else getattr(value, part)
+        return _tag_value(value)
+    except (AttributeError, KeyError, TypeError):
+        return None
+
+
+class _BlobEncoder:
+    """Array encoder that moves large arrays into content-addressed blobs."""
+
+    def __init__(self, root: Path, threshold: int) -> None:
+        self._root = root
+        self._threshold = threshold
+
+    def __call__(self, value: np.ndarray) -> dict[str, Any] | None:
+        if not is_buffer_array(value) or value.nbytes < self._threshold:
+            return None
+        array = np.ascontiguousarray(value)
+        buffer = array_bytes(array)
+        digest = hashlib.sha256(buffer).hexdigest()
+        path = _blob_path(self._root, digest)
+        if not path.exists():
+            _write_atomic(path, [buffer])
+        return external_array_dict(
+            value, _DATA_ENCODING_BLOB, **{_DATA_BLOB_DIGEST_KEY: digest}
+        )
+
+
+class ModelStore:
+    """
+    Content-addressed store for models on the local file system.
+
+    Models are saved under their fingerprint, so storing an identical model
+    twice keeps a single copy. Arrays of at least `blob_threshold` bytes are
+    written as separate blobs addressed by the hash of their bytes and are
+    shared between models. A SQLite index records the class, creation time
+    and tags of every model so that queries do not read model files.
+
+    Parameters
+    ----------
+    root
+        Store directory. Created if it does not exist.
+    index_fields
+        Dotted attribute paths (e.g. `"metadata.experiment"`) recorded as
+        tags for every stored model that has them.
+    blob_threshold
+        Minimum array size in bytes for storage as a shared blob.
+    """
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str],
+        index_fields: Sequence[str] = (),
+        blob_threshold: int = DEFAULT_BLOB_THRESHOLD,
+    ) -> None:
+        """
+        Open or create a store.
+
+        Parameters
+        ----------
+        root
+            Store directory. Created if it does not exist.
+        index_fields
+            Dotted attribute paths (e.g. `"metadata.experiment"`) recorded as
+            tags for every stored model that has them.
+        blob_threshold
+            Minimum array size in bytes for storage as a shared blob.
+        """
+        self.root = Path(root)
+        self.index_fields = tuple(index_fields)
+        self.blob_threshold = blob_threshold
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.root / "index.sqlite")
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> Self:
+        """Return the store for use in a `with` block."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the store when leaving a `with` block."""
+        self.close()
+
+    def __contains__(self, model: Model | str) -> bool:
+        """Return whether a model or fingerprint is in the store."""
+        digest = model.fingerprint() if isinstance(model, Model) else model
+        row = self._connection.execute(
+            "SELECT 1 FROM objects WHERE digest = ?", (digest,)
+        ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        """Return the number of stored models."""
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM objects").fetchone()
+        return count
+
+    def close(self) -> None:
+        """Close the index database."""
+        self._connection.close()
+
+    def put(
+        self,
+        model: Model,
+        tags: Mapping[str, Any] | None = None,
+    ) -> StoreEntry:
+        """
+        Store a model.
+
+        Parameters
+        ----------
+        model
+            Model to store. If an identical model is already stored, only
+            the tags are added.
+        tags
+            Additional index entries. Values must be strings, numbers,
+            booleans or models; models are recorded by their fingerprint.
+
+        Returns
+        -------
+        StoreEntry
+            Handle to the stored model.
+
+        Raises
+        ------
+        TypeError
+            If a tag value has an unsupported type.
+        """
+        digest = model.fingerprint()
+        entries = {
+            path: value
+            for path in self.index_fields
+            if (value := _index_value(model, path)) is not None
+        }
+        entries.update({k: _tag_value(v) for k, v in (tags or {}).items()})
+
+        class_name = _class_name(type(model))
+        row = self._connection.execute(
+            "SELECT created FROM objects WHERE digest = ?", (digest,)
+        ).fetchone()
+        if row is None:
+            payload = model.to_dict(_BlobEncoder(self.root, self.blob_threshold))
+            _write_atomic(
+                _object_path(self.root, digest),
+                [get_json_backend().dumps_bytes(payload)],
+            )
+            created = time.time()
+        else:
+            (created,) = row
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR IGNORE INTO objects VALUES (?, ?, ?)",
+                (digest, class_name, created),
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO tags VALUES (?, ?, ?)",
+                [(digest, key, value) for key, value in entries.items()],
+            )
+        return StoreEntry(self, digest, class_name, created)
+
+    def get(
+        self,
+        digest: str,
+        cls: type[ModelT] | None = None,
+        mmap_mode: MmapMode | None = "r",
+        trusted: bool = False,
+    ) -> ModelT:
+        """
+        Load a model by its fingerprint.
+
+        Parameters
+        ----------
+        digest
+            Fingerprint of the model.
+        cls
+            Model class. Defaults to the class recorded when the model was
+            stored.
+        mmap_mode
+            Mode passed to `numpy.memmap` for shared array blobs. If None,
+            arrays are read into memory instead.
+        trusted
+            If True, skip validation of models stored with the current
+            serialization version. Only use this for stores that no other
+            program writes to. See `Model.from_dict`.
+
+        Returns
+        -------
+        ModelT
+            Stored model.
+
+        Raises
+        ------
+        KeyError
+            If no model with this fingerprint is stored.
+        TypeError
+            If `cls` is None and the recorded class is not defined in this
+            process.
+        """
+        model_cls: type[Model]
+        if cls is None:
+            row = self._connection.execute(
+                "SELECT class FROM objects WHERE digest = ?", (digest,)
+            ).fetchone()
+            if row is None:
+                raise KeyError(f"Model not found: {digest}")
+            model_cls = _resolve_class(row[0])
+        else:
+            model_cls = cls
+        try:
+            data = _object_path(self.root, digest).read_bytes()
+        except FileNotFoundError:
+            raise KeyError(f"Model not found: {digest}") from None
+        payload = self._resolve_blobs(get_json_backend().loads(data), mmap_mode)
+        return cast(ModelT, model_cls.from_dict(payload, trusted=trusted))
+
+    def find(
+        self,
+        cls: type[Model] | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        tags: Mapping[str, Any] | None = None,
+    ) -> list[StoreEntry]:
+        """
+        Find stored models from the index without loading them.
+
+        Parameters
+        ----------
+        cls
+            Only return models of this class.
+        since
+            Only return models stored at or after this POSIX timestamp.
+        until
+            Only return models stored before this POSIX timestamp.
+        tags
+            Only return models with these tag values, including indexed
+            fields. Model values match their fingerprint.
+
+        Returns
+        -------
+        list[StoreEntry]
+            Matching models in the order they were stored.
+        """
+        clauses = []
+        params: list[Any] = []
+        if cls is not None:
+            clauses.append("class = ?")
+            params.append(_class_name(cls))
+        if since is not None:
+            clauses.append("created >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("created < ?")
+            params.append(until)
+        for key, value in (tags or {}).items():
+            clauses.append(
+                "digest IN (SELECT digest FROM tags WHERE key = ? AND value = ?)"
+            )
+            params.extend([key, _tag_value(value)])
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._connection.execute(
+            f"SELECT digest, class, created FROM objects {where} ORDER BY created",  # noqa: S608
+            params,
+        ).fetchall()
+        return [StoreEntry(self, *row) for row in rows]
+
+    def tags(self, digest: str) -> dict[str, list[TagValue]]:
+        """Return the tags recorded for a stored model."""
+        result: dict[str, list[TagValue]] = {}
+        for key, value in self._connection.execute(
+            "SELECT key, value FROM tags WHERE digest = ? ORDER BY key", (digest,)
+        ):
+            result.setdefault(key, []).append(value)
+        return result
+
+    def _resolve_blobs(self, obj: Any, mmap_mode: MmapMode | None) -> Any:
+        if isinstance(obj, dict):
+            layout = external_array_layout(obj, _DATA_ENCODING_BLOB)
+            if layout is not None:
+                dtype, shape = layout
+                path = _blob_path(self.root, obj[_DATA_BLOB_DIGEST_KEY])
+                if mmap_mode is None or 0 in shape:
+                    return np.fromfile(path, dtype=dtype).reshape(shape)
+                return np.memmap(path, dtype=dtype, mode=mmap_mode, shape=shape)
+            return {k: self._resolve_blobs(v, mmap_mode) for k, v in obj.items()}
+        if isinstance(obj, list):
+            return [self._resolve_blobs(v, mmap_mode) for v in obj]
+        return obj
@@ -1,5 +1,6 @@
 """Measurement configuration models."""
 
+from .shot_averager import ShotAverager
 from .sweep_measurement_config import (
     DataAcquisitionConfig,
     FrequencyConfig,
@@ -7,9 +8,13 @@ from .sweep_measurement_config import (
     ParameterSweepContent,
     ParametricSequenceConfig,
     ParametricSequencePulseCommand,
+    ResolvedSweep,
+    SweepChunk,
     SweepMeasurementConfig,
+    SweepShard,
 )
 from .sweep_measurement_result import SweepMeasurementResult
+from .sweep_measurement_writer import SweepMeasurementWriter
 
 __all__ = [
     "DataAcquisitionConfig",
@@ -18,6 +23,11 @@ __all__ = [
     "ParameterSweepContent",
     "ParametricSequenceConfig",
     "ParametricSequencePulseCommand",
+    "ResolvedSweep",
+    "ShotAverager",
+    "SweepChunk",
     "SweepMeasurementConfig",
     "SweepMeasurementResult",
+    "SweepMeasurementWriter",
+    "SweepShard",
 ]
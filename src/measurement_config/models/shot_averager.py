@@ -0,0 +1,243 @@
+"""Streaming shot averaging for sweep measurements."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, Literal
+
+import numpy as np
+import numpy.typing as npt
+
+from .sweep_measurement_config import SweepMeasurementConfig
+from .sweep_measurement_result import SweepMeasurementResult
+
+ShotStatistic = Literal["mean", "variance", "stderr"]
+
+
+def _abs2(value: np.ndarray) -> np.ndarray:
+    if np.iscomplexobj(value):
+        return value.real**2 + value.imag**2
+    return value**2
+
+
+class ShotAverager:
+    """
+    Accumulate per-shot data into running averages over a sweep.
+
+    Shots are merged block by block into a running mean and sum of squared
+    deviations for every sweep point and data key (Welford's algorithm,
+    generalized to blocks). For complex data the variance is that of the
+    complex values, i.e. the mean of `|x - mean|**2`. Memory use depends on
+    the number of sweep points only, not on the number of shots.
+
+    Parameters
+    ----------
+    config
+        Sweep configuration that defines the sweep axes.
+    data_key_list
+        Labels of the data recorded at each sweep point. Defaults to the
+        channels of `config`.
+    point_shape
+        Shape of the data recorded for each data key and shot.
+    dtype
+        Data type of the running mean.
+    metadata
+        Metadata stored in the emitted results.
+    """
+
+    def __init__(
+        self,
+        config: SweepMeasurementConfig,
+        data_key_list: Sequence[str] | None = None,
+        point_shape: Sequence[int] = (),
+        dtype: npt.DTypeLike = np.complex128,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Initialize empty running statistics for every sweep point.
+
+        Parameters
+        ----------
+        config
+            Sweep configuration that defines the sweep axes.
+        data_key_list
+            Labels of the data recorded at each sweep point. Defaults to the
+            channels of `config`.
+        point_shape
+            Shape of the data recorded for each data key and shot.
+        dtype
+            Data type of the running mean.
+        metadata
+            Metadata stored in the emitted results.
+
+        Raises
+        ------
+        ValueError
+            If the sweep contents on an axis have different lengths.
+        """
+        sweep_parameter = config.sweep_parameter
+        if data_key_list is None:
+            data_key_list = config.channel_list
+        self._sweep_shape = sweep_parameter.shape
+        self._sweep_key_list = [axis[0] for axis in sweep_parameter.sweep_axis]
+        self._data_key_list = list(data_key_list)
+        self._point_shape = (len(self._data_key_list), *point_shape)
+        self._metadata = dict(metadata or {})
+        size = sweep_parameter.size
+        self._count = np.zeros(size, dtype=np.int64)
+        self._mean = np.zeros((size, *self._point_shape), dtype=dtype)
+        self._m2 = np.zeros((size, *self._point_shape), dtype=np.float64)
+
+    @property
+    def sweep_shape(self) -> tuple[int, ...]:
+        """Number of points along each sweep axis."""
+        return self._sweep_shape
+
+    @property
+    def size(self) -> int:
+        """Total number of sweep points."""
+        return self._count.shape[0]
+
+    @property
+    def shot_count(self) -> np.ndarray:
+        """Number of shots accumulated at each sweep point."""
+        return self._count.reshape(self._sweep_shape)
+
+    def add(
+        self, index: int | np.integer | Sequence[int | np.integer], shots: npt.ArrayLike
+    ) -> None:
+        """
+        Accumulate a block of shots for a single sweep point.
+
+        Parameters
+        ----------
+        index
+            Flat index in C order, or one index per sweep axis.
+        shots
+            Data with one leading entry per shot, followed by the data keys
+            and `point_shape`.
+        """
+        if not isinstance(index, (int, np.integer)):
+            index = int(np.ravel_multi_index(tuple(index), self._sweep_shape))
+        self.add_chunk(int(index), np.asarray(shots)[np.newaxis])
+
+    def add_chunk(self, start: int, shots: npt.ArrayLike) -> None:
+        """
+        Accumulate blocks of shots for consecutive sweep points.
+
+        Parameters
+        ----------
+        start
+            Flat index in C order of the first sweep point in the chunk.
+        shots
+            Data of shape `(points, shots, data keys, *point_shape)`.
+
+        Raises
+        ------
+        ValueError
+            If the chunk extends past the last sweep point or has the wrong
+            shape.
+        """
+        block = np.asarray(shots)
+        stop = start + block.shape[0]
+        if start < 0 or stop > self.size:
+            raise ValueError(
+                f"Chunk [{start}, {stop}) is out of range for {self.size} sweep points."
+            )
+        if block.ndim < 2 or block.shape[2:] != self._point_shape:
+            raise ValueError(
+                f"Expected shots of shape (points, shots, *{self._point_shape}), "
+                f"got {block.shape}."
+            )
+        n_b = block.shape[1]
+        if n_b == 0:
+            return
+        mean_b = block.mean(axis=1)
+        m2_b = _abs2(block - mean_b[:, np.newaxis]).sum(axis=1)
+
+        n_a = self._count[start:stop]
+        n = n_a + n_b
+        # Weights broadcast over the data key and point axes
+        expand = (slice(None), *([np.newaxis] * len(self._point_shape)))
+        delta = mean_b - self._mean[start:stop]
+        self._mean[start:stop] += delta * (n_b / n)[expand]
+        self._m2[start:stop] += m2_b + _abs2(delta) * (n_a * n_b / n)[expand]
+        self._count[start:stop] = n
+
+    def mean(self) -> np.ndarray:
+        """Return a copy of the running mean with the sweep axes unraveled."""
+        return self._mean.reshape(*self._sweep_shape, *self._point_shape).copy()
+
+    def variance(self, ddof: int = 1) -> np.ndarray:
+        """
+        Return the variance of the accumulated shots.
+
+        Parameters
+        ----------
+        ddof
+            Delta degrees of freedom. Points with no more than `ddof` shots
+            are NaN.
+
+        Returns
+        -------
+        np.ndarray
+            Variance with the sweep axes unraveled.
+        """
+        expand = (slice(None), *([np.newaxis] * len(self._point_shape)))
+        dof = (self._count - ddof).astype(np.float64)
+        dof[dof <= 0] = np.nan
+        variance = self._m2 / dof[expand]
+        return variance.reshape(*self._sweep_shape, *self._point_shape)
+
+    def stderr(self, ddof: int = 1) -> np.ndarray:
+        """Return the standard error of the mean at every sweep point."""
+        count = self._count.astype(np.float64).reshape(
+            *self._sweep_shape, *([1] * len(self._point_shape))
+        )
+        return np.sqrt(self.variance(ddof) / count)
+
+    def snapshot(
+        self,
+        statistic: ShotStatistic = "mean",
+        ddof: int = 1,
+    ) -> SweepMeasurementResult:
+        """
+        Return the current statistics as a sweep measurement result.
+
+        Parameters
+        ----------
+        statistic
+            Statistic stored as the result data.
+        ddof
+            Delta degrees of freedom for the variance and standard error.
+
+        Returns
+        -------
+        SweepMeasurementResult
+            Result independent of later accumulation. Its metadata records
+            the statistic and the number of shots at each sweep point.
+
+        Raises
+        ------
+        ValueError
+            If `statistic` is unknown.
+        """
+        if statistic == "mean":
+            data = self.mean()
+        elif statistic == "variance":
+            data = self.variance(ddof)
+        elif statistic == "stderr":
+            data = self.stderr(ddof)
+        else:
+            raise ValueError(f"Unknown statistic: {statistic}")
+        return SweepMeasurementResult(
+            metadata={
+                **self._metadata,
+                "statistic": statistic,
+                "shot_count": self.shot_count.copy(),
+            },
+            data=data,
+            data_shape=list(data.shape),
+            sweep_key_list=list(self._sweep_key_list),
+            data_key_list=list(self._data_key_list),
+        )
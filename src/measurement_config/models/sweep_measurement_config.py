@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
-from typing import Literal
+import itertools
+import math
+from collections.abc import Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
 
+import numpy as np
 import tunits
 
 from measurement_config.core import Model
 from measurement_config.typing import ValueArrayLike
 
+if TYPE_CHECKING:
+    from measurement_config.core import Expression
+
+SweepCategory = Literal["frequency_shift", "sequence_variable"]
+
 
 class ParametricSequencePulseCommand(Model):
     """Pulse command used in parametric sequences."""
@@ -50,13 +59,34 @@ class DataAcquisitionConfig(Model):
     channel_to_averaging_window: dict[str, ValueArrayLike]
 
 
+def _broadcast_to_grid(value: Any, shape: tuple[int, ...]) -> Any:
+    # tunits arrays cannot wrap broadcast views, so they are materialized
+    if isinstance(value, (tunits.Value, tunits.ValueArray)):
+        return value * np.ones(shape)
+    return np.broadcast_to(value, shape)
+
+
+class SweepChunk(NamedTuple):
+    """Block of consecutive sweep points in C order."""
+
+    start: int
+    stop: int
+    values: dict[str, Any]
+
+
 class ParameterSweepContent(Model):
     """Definition of a sweep dimension."""
 
-    category: Literal["frequency_shift", "sequence_variable"]
+    category: SweepCategory
     sweep_target: list[str]
     value_list: ValueArrayLike
 
+    def indexable_values(self) -> Any:
+        """Return `value_list` as an array that supports NumPy indexing."""
+        if isinstance(self.value_list, (list, tuple)):
+            return np.asarray(self.value_list)
+        return self.value_list
+
 
 class ParameterSweepConfig(Model):
     """Collection of sweep contents and axes."""
@@ -64,6 +94,332 @@ class ParameterSweepConfig(Model):
     sweep_content_list: dict[str, ParameterSweepContent]
     sweep_axis: list[list[str]]
 
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """
+        Number of points along each sweep axis.
+
+        Raises
+        ------
+        ValueError
+            If the sweep contents on an axis have different lengths.
+        """
+        shape = []
+        for axis in self.sweep_axis:
+            lengths = {len(self.sweep_content_list[key].value_list) for key in axis}
+            if len(lengths) != 1:
+                raise ValueError(
+                    f"Sweep contents on the same axis must have equal lengths: {axis}"
+                )
+            shape.append(lengths.pop())
+        return tuple(shape)
+
+    @property
+    def size(self) -> int:
+        """Total number of sweep points."""
+        return math.prod(self.shape)
+
+    def ravel_index(self, index: Sequence[int | np.integer]) -> int:
+        """
+        Convert per-axis indices to a flat index in C order.
+
+        Parameters
+        ----------
+        index
+            One index per sweep axis.
+
+        Returns
+        -------
+        int
+            Flat index of the sweep point.
+        """
+        return int(np.ravel_multi_index(tuple(index), self.shape))
+
+    def unravel_index(self, index: int | np.integer) -> tuple[int, ...]:
+        """
+        Convert a flat index in C order to per-axis indices.
+
+        Parameters
+        ----------
+        index
+            Flat index of the sweep point.
+
+        Returns
+        -------
+        tuple[int, ...]
+            One index per sweep axis.
+        """
+        return tuple(int(i) for i in np.unravel_index(index, self.shape))
+
+    def point(
+        self, index: int | np.integer | Sequence[int | np.integer]
+    ) -> dict[str, Any]:
+        """
+        Return the value of every sweep content at a sweep point.
+
+        Parameters
+        ----------
+        index
+            Flat index in C order, or one index per sweep axis.
+
+        Returns
+        -------
+        dict[str, Any]
+            Mapping from sweep content name to its value at the point.
+        """
+        if isinstance(index, (int, np.integer)):
+            index = self.unravel_index(index)
+        return {
+            name: self.sweep_content_list[name].indexable_values()[i]
+            for axis, i in zip(self.sweep_axis, index, strict=True)
+            for name in axis
+        }
+
+    def iter_points(self) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over sweep points in C order.
+
+        Yields
+        ------
+        dict[str, Any]
+            Mapping from sweep content name to its value at each point.
+        """
+        axis_values = self._axis_values()
+        for index in np.ndindex(*self.shape):
+            yield {
+                name: values[i]
+                for contents, i in zip(axis_values, index, strict=True)
+                for name, values in contents.items()
+            }
+
+    def iter_chunks(self, chunk_size: int) -> Iterator[SweepChunk]:
+        """
+        Iterate over blocks of consecutive sweep points in C order.
+
+        Parameters
+        ----------
+        chunk_size
+            Maximum number of sweep points per block.
+
+        Yields
+        ------
+        SweepChunk
+            Flat index range of the block and, for every sweep content, an
+            array of its values at each point in the block.
+
+        Raises
+        ------
+        ValueError
+            If `chunk_size` is not positive.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive.")
+        shape = self.shape
+        size = math.prod(shape)
+        axis_values = self._axis_values()
+        for start in range(0, size, chunk_size):
+            stop = min(start + chunk_size, size)
+            flat = np.arange(start, stop)
+            # np.unravel_index does not accept arrays for an empty shape
+            indices = np.unravel_index(flat, shape) if shape else ()
+            values = {
+                name: array[axis_index]
+                for contents, axis_index in zip(axis_values, indices, strict=True)
+                for name, array in contents.items()
+            }
+            yield SweepChunk(start, stop, values)
+
+    def axis_index(self, axis: int | str) -> int:
+        """
+        Return the position of a sweep axis.
+
+        Parameters
+        ----------
+        axis
+            Axis position, or the name of a sweep content on the axis.
+
+        Returns
+        -------
+        int
+            Position of the axis in `sweep_axis`.
+
+        Raises
+        ------
+        ValueError
+            If there is no such axis.
+        """
+        if isinstance(axis, int):
+            if not -len(self.sweep_axis) <= axis < len(self.sweep_axis):
+                raise ValueError(f"Sweep axis {axis} is out of range.")
+            return axis % len(self.sweep_axis)
+        for index, names in enumerate(self.sweep_axis):
+            if axis in names:
+                return index
+        raise ValueError(f"Unknown sweep content: {axis}")
+
+    def subset(self, region: Sequence[slice]) -> ParameterSweepConfig:
+        """
+        Return the sweep restricted to a block of the sweep grid.
+
+        Parameters
+        ----------
+        region
+            One slice per sweep axis.
+
+        Returns
+        -------
+        ParameterSweepConfig
+            Sweep whose contents hold only the values inside `region`.
+            Contents of axes that are not restricted are shared with this
+            sweep.
+        """
+        contents = dict(self.sweep_content_list)
+        for axis, key, length in zip(self.sweep_axis, region, self.shape, strict=True):
+            if key.indices(length) == (0, length, 1):
+                continue
+            for name in axis:
+                content = contents[name]
+                contents[name] = content.model_copy(
+                    update={"value_list": content.value_list[key]}
+                )
+        return self.model_copy(update={"sweep_content_list": contents})
+
+    def _axis_values(self) -> list[dict[str, Any]]:
+        return [
+            {name: self.sweep_content_list[name].indexable_values() for name in axis}
+            for axis in self.sweep_axis
+        ]
+
+    def broadcast_values(self, category: SweepCategory) -> dict[str, Any]:
+        """
+        Return the swept values of every target in a category.
+
+        Parameters
+        ----------
+        category
+            Category of the sweep contents to collect.
+
+        Returns
+        -------
+        dict[str, Any]
+            Mapping from sweep target to its values. The values of a content
+            on axis `k` have length `shape[k]` along dimension `k` and length
+            one along every other dimension, so that they broadcast over the
+            sweep grid without copying.
+
+        Raises
+        ------
+        ValueError
+            If a target is swept by more than one content.
+        """
+        ndim = len(self.sweep_axis)
+        values: dict[str, Any] = {}
+        for index, axis in enumerate(self.sweep_axis):
+            key = (None,) * index + (slice(None),) + (None,) * (ndim - index - 1)
+            for name in axis:
+                content = self.sweep_content_list[name]
+                if content.category != category:
+                    continue
+                value_list = content.indexable_values()
+                for target in content.sweep_target:
+                    if target in values:
+                        raise ValueError(f"Sweep target '{target}' is swept twice.")
+                    values[target] = value_list[key]
+        return values
+
+    def resolve(
+        self,
+        expression: Expression | str,
+        params: Mapping[str, Any] | None = None,
+    ) -> Any:
+        """
+        Evaluate an expression over the whole sweep grid.
+
+        Sequence variables swept on the same axis vary together, and
+        variables on different axes are broadcast against each other.
+
+        Parameters
+        ----------
+        expression
+            Expression, or expression string, to evaluate.
+        params
+            Values of symbols that are not swept. Swept sequence variables
+            take precedence over entries with the same name.
+
+        Returns
+        -------
+        Any
+            Evaluated value with shape `shape`. NumPy results are read-only
+            broadcast views.
+        """
+        if isinstance(expression, str):
+            from measurement_config.core.expression import Expression
+
+            expression = Expression(expression)
+        values = {**(params or {}), **self.broadcast_values("sequence_variable")}
+        return _broadcast_to_grid(expression.resolve(values), self.shape)
+
+
+def _split_counts(count: int, lengths: Sequence[int]) -> list[int]:
+    """Factor `count` over axes so that the largest block is as small as possible."""
+    if count <= 0:
+        raise ValueError("count must be positive.")
+    # Candidates come with larger factors on outer axes first, so `min` keeps
+    # the outermost split among equally balanced ones.
+    candidates = _factorizations(count, tuple(lengths))
+    best = min(
+        candidates,
+        key=lambda parts: math.prod(
+            -(-length // part) for length, part in zip(lengths, parts, strict=True)
+        ),
+        default=None,
+    )
+    if best is None:
+        raise ValueError(
+            f"Cannot split sweep axes of lengths {list(lengths)} into {count} shards."
+        )
+    return list(best)
+
+
+def _factorizations(count: int, lengths: tuple[int, ...]) -> Iterator[tuple[int, ...]]:
+    """Yield the ways to write `count` as one part per axis, within its length."""
+    if not lengths:
+        if count == 1:
+            yield ()
+        return
+    divisors = [part for part in range(1, math.isqrt(count) + 1) if count % part == 0]
+    divisors += [count // part for part in reversed(divisors)]
+    for part in sorted(set(divisors), reverse=True):
+        if part <= lengths[0]:
+            for rest in _factorizations(count // part, lengths[1:]):
+                yield (part, *rest)
+
+
+def _split_bounds(length: int, parts: int) -> list[slice]:
+    quotient, remainder = divmod(length, parts)
+    bounds = []
+    start = 0
+    for i in range(parts):
+        stop = start + quotient + (i < remainder)
+        bounds.append(slice(start, stop))
+        start = stop
+    return bounds
+
+
+class SweepShard(NamedTuple):
+    """Block of a sweep created by `SweepMeasurementConfig.shard`."""
+
+    config: SweepMeasurementConfig
+    region: tuple[slice, ...]
+    sweep_shape: tuple[int, ...]
+
+
+class ResolvedSweep(NamedTuple):
+    """Sequence arguments and frequency shifts evaluated over the sweep grid."""
+
+    argument_list: list[list[Any]]
+    channel_to_frequency_shift: dict[str, np.ndarray]
+
 
 class SweepMeasurementConfig(Model):
     """Top-level configuration for sweep measurements."""
@@ -73,3 +429,123 @@ class SweepMeasurementConfig(Model):
     frequency: FrequencyConfig
     data_acquisition: DataAcquisitionConfig
     sweep_parameter: ParameterSweepConfig
+
+    def shard(
+        self,
+        count: int,
+        axes: Sequence[int | str] = (0,),
+    ) -> list[SweepShard]:
+        """
+        Split the sweep into balanced blocks along chosen axes.
+
+        `count` is factored over the chosen axes so that the largest block is
+        as small as possible, splitting outer axes first among equally good
+        factorizations. Each axis is cut into contiguous ranges whose lengths
+        differ by at most one.
+
+        Parameters
+        ----------
+        count
+            Number of shards.
+        axes
+            Axes to split, by position or by the name of a sweep content on
+            the axis. Defaults to the outermost axis.
+
+        Returns
+        -------
+        list[SweepShard]
+            Sub-configurations in C order of their blocks, with the region of
+            the full sweep grid each one covers. Everything but the sweep
+            values is shared with this configuration.
+
+        Raises
+        ------
+        ValueError
+            If an axis is unknown or listed twice, or the axes are too short
+            for `count` shards.
+        """
+        sweep = self.sweep_parameter
+        shape = sweep.shape
+        indices = [sweep.axis_index(axis) for axis in axes] if shape else []
+        if len(set(indices)) != len(indices):
+            raise ValueError(f"Sweep axes are listed more than once: {list(axes)}")
+        indices.sort()
+        parts = _split_counts(count, [shape[i] for i in indices])
+        axis_bounds = [[slice(0, length)] for length in shape]
+        for index, part in zip(indices, parts, strict=True):
+            axis_bounds[index] = _split_bounds(shape[index], part)
+        return [
+            SweepShard(
+                self.model_copy(update={"sweep_parameter": sweep.subset(region)}),
+                region,
+                shape,
+            )
+            for region in itertools.product(*axis_bounds)
+        ]
+
+    def resolve_sweep(
+        self,
+        params: Mapping[str, Any] | None = None,
+        frequency_unit: str = "Hz",
+    ) -> ResolvedSweep:
+        """
+        Evaluate the sequence and frequency shifts at every sweep point.
+
+        String arguments of all commands are compiled together and evaluated
+        once over the sweep grid, with swept sequence variables substituted.
+        Swept frequency shifts replace the configured shift of their target
+        channels.
+
+        Parameters
+        ----------
+        params
+            Values of sequence variables that are not swept.
+        frequency_unit
+            Unit of the returned frequency shifts. Swept shifts given without
+            units are assumed to be in this unit.
+
+        Returns
+        -------
+        ResolvedSweep
+            One array with the sweep shape per command argument and per
+            channel frequency shift. Constant values are read-only broadcast
+            views rather than copies.
+        """
+        sweep = self.sweep_parameter
+        shape = sweep.shape
+
+        positions = []
+        strings = []
+        argument_list: list[list[Any]] = []
+        for i, command in enumerate(self.sequence.command_list):
+            arguments = []
+            for j, argument in enumerate(command.argument_list):
+                if isinstance(argument, str):
+                    positions.append((i, j))
+                    strings.append(argument)
+                    arguments.append(None)
+                else:
+                    arguments.append(np.broadcast_to(argument, shape))
+            argument_list.append(arguments)
+        if strings:
+            from measurement_config.core.expression import ExpressionSet
+
+            values = {**(params or {}), **sweep.broadcast_values("sequence_variable")}
+            results = ExpressionSet(strings).resolve(values)
+            for (i, j), result in zip(positions, results, strict=True):
+                argument_list[i][j] = _broadcast_to_grid(result, shape)
+
+        shifts: dict[str, Any] = {
+            channel: shift[frequency_unit]
+            for channel, shift in self.frequency.channel_to_frequency_shift.items()
+        }
+        for channel, shift in sweep.broadcast_values("frequency_shift").items():
+            shifts[channel] = (
+                shift[frequency_unit]
+                if isinstance(shift, tunits.ValueArray)
+                else np.asarray(shift)
+            )
+        channel_to_frequency_shift = {
+            channel: np.broadcast_to(shift, shape) for channel, shift in shifts.items()
+        }
+        return ResolvedSweep(argument_list, channel_to_frequency_shift)
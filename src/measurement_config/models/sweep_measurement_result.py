@@ -2,16 +2,376 @@
 
 from __future__ import annotations
 
+import itertools
+import operator
+import os
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeAlias
+
+import numpy as np
+import numpy.typing as npt
 from numpy.typing import NDArray
+from typing_extensions import Self
 
 from measurement_config.core.model import Model
 
+if TYPE_CHECKING:
+    from .sweep_measurement_config import SweepShard
+
+SweepIndexer: TypeAlias = int | slice | Sequence[int]
+
+
+class _ResultLayout(NamedTuple):
+    sweep_shape: tuple[int, ...]
+    point_shape: tuple[int, ...]
+    sweep_axis: dict[str, int]
+    data_key_index: dict[str, int]
+
+
+def _as_index(indexer: SweepIndexer, length: int) -> int | slice | np.ndarray:
+    """Convert an indexer to a basic index whenever the selection allows it."""
+    if isinstance(indexer, slice):
+        return indexer
+    if isinstance(indexer, (int, np.integer)):
+        return operator.index(indexer)
+    positions = [operator.index(i) for i in indexer]
+    for position in positions:
+        if not -length <= position < length:
+            raise IndexError(f"Index {position} is out of range for length {length}.")
+    positions = [position % length for position in positions]
+    if not positions:
+        return slice(0, 0)
+    step = positions[1] - positions[0] if len(positions) > 1 else 1
+    if step != 0 and all(b - a == step for a, b in itertools.pairwise(positions)):
+        # Evenly spaced positions are a slice, which indexes without copying
+        stop = positions[-1] + step
+        return slice(positions[0], stop if stop >= 0 else None, step)
+    return np.asarray(positions, dtype=np.intp)
+
 
 class SweepMeasurementResult(Model):
-    """Container for sweep measurement result data."""
+    """
+    Container for sweep measurement result data.
+
+    `data` has shape `data_shape`. Its leading axes follow the sweep axes of
+    the measurement, each labeled in `sweep_key_list` by the first sweep
+    content of the axis. The next axis runs over `data_key_list`, and any
+    remaining axes hold the data recorded per key and sweep point.
+    """
 
     metadata: dict
     data: NDArray
     data_shape: list[int]
     sweep_key_list: list[str]
     data_key_list: list[str]
+
+    @property
+    def sweep_shape(self) -> tuple[int, ...]:
+        """Number of points along each sweep axis."""
+        return self._layout().sweep_shape
+
+    @property
+    def point_shape(self) -> tuple[int, ...]:
+        """Shape of the data recorded for each data key and sweep point."""
+        return self._layout().point_shape
+
+    def sweep_axis(self, key: str) -> int:
+        """
+        Return the position of a sweep axis in `data`.
+
+        Parameters
+        ----------
+        key
+            Label of the axis in `sweep_key_list`.
+
+        Returns
+        -------
+        int
+            Axis of `data` that runs over the sweep axis.
+
+        Raises
+        ------
+        ValueError
+            If `key` is not a sweep key.
+        """
+        axis = self._layout().sweep_axis.get(key)
+        if axis is None:
+            raise ValueError(f"Unknown sweep key: {key}")
+        return axis
+
+    def select(
+        self,
+        data_key: str | Sequence[str] | None = None,
+        **indexers: SweepIndexer,
+    ) -> SweepMeasurementResult:
+        """
+        Select data by data key and by position along sweep axes.
+
+        Integer indexers drop their sweep axis. Slices, evenly spaced
+        positions and a single data key keep `data` a view of this result;
+        other position lists copy the selected data.
+
+        Parameters
+        ----------
+        data_key
+            Data key or keys to keep. Defaults to all of them.
+        **indexers
+            Index, slice or list of positions for each sweep key to select.
+
+        Returns
+        -------
+        SweepMeasurementResult
+            Result with the selected data and matching labels and shape.
+
+        Raises
+        ------
+        ValueError
+            If a sweep key or data key is unknown.
+        """
+        layout = self._layout()
+        index: list[Any] = [slice(None)] * (len(layout.sweep_shape) + 1)
+        for key, indexer in indexers.items():
+            axis = self.sweep_axis(key)
+            index[axis] = _as_index(indexer, layout.sweep_shape[axis])
+        data_key_list = list(self.data_key_list)
+        if data_key is not None:
+            keys = [data_key] if isinstance(data_key, str) else list(data_key)
+            positions = []
+            for key in keys:
+                position = layout.data_key_index.get(key)
+                if position is None:
+                    raise ValueError(f"Unknown data key: {key}")
+                positions.append(position)
+            index[-1] = _as_index(positions, len(data_key_list))
+            data_key_list = keys
+        sweep_key_list = [
+            key
+            for key, key_index in zip(self.sweep_key_list, index, strict=False)
+            if not isinstance(key_index, int)
+        ]
+        # Mixing index arrays with basic indices moves the array axes to the
+        # front, so arrays are applied one axis at a time.
+        basic = tuple(slice(None) if isinstance(i, np.ndarray) else i for i in index)
+        data = self.data[basic]
+        axis = 0
+        for key_index in index:
+            if isinstance(key_index, np.ndarray):
+                data = np.take(data, key_index, axis=axis)
+            if not isinstance(key_index, int):
+                axis += 1
+        return self.model_copy(
+            update={
+                "data": data,
+                "data_shape": list(data.shape),
+                "sweep_key_list": sweep_key_list,
+                "data_key_list": data_key_list,
+            }
+        )
+
+    def reduce(
+        self,
+        func: Callable[..., Any],
+        over: str | Sequence[str],
+        **kwargs: Any,
+    ) -> SweepMeasurementResult:
+        """
+        Reduce the data over sweep axes.
+
+        Parameters
+        ----------
+        func
+            NumPy-style reduction that accepts an `axis` tuple, e.g.
+            `np.mean`.
+        over
+            Sweep key or keys of the axes to reduce.
+        **kwargs
+            Extra keyword arguments passed to `func`.
+
+        Returns
+        -------
+        SweepMeasurementResult
+            Result without the reduced sweep axes.
+
+        Raises
+        ------
+        ValueError
+            If a sweep key is unknown.
+        """
+        keys = [over] if isinstance(over, str) else list(over)
+        axes = tuple(self.sweep_axis(key) for key in keys)
+        data = np.asarray(func(self.data, axis=axes, **kwargs))
+        return self.model_copy(
+            update={
+                "data": data,
+                "data_shape": list(data.shape),
+                "sweep_key_list": [
+                    key for key in self.sweep_key_list if key not in keys
+                ],
+            }
+        )
+
+    def _layout(self) -> _ResultLayout:
+        return self._cached("layout", self._compute_layout)
+
+    def _compute_layout(self) -> _ResultLayout:
+        sweep_count = len(self.sweep_key_list)
+        if len(self.data_shape) <= sweep_count or self.data_shape[sweep_count] != len(
+            self.data_key_list
+        ):
+            raise ValueError(
+                f"data_shape {self.data_shape} does not match "
+                f"{sweep_count} sweep keys and {len(self.data_key_list)} data keys."
+            )
+        return _ResultLayout(
+            sweep_shape=tuple(self.data_shape[:sweep_count]),
+            point_shape=tuple(self.data_shape[sweep_count + 1 :]),
+            sweep_axis={key: i for i, key in enumerate(self.sweep_key_list)},
+            data_key_index={key: i for i, key in enumerate(self.data_key_list)},
+        )
+
+    @classmethod
+    def preallocate(
+        cls,
+        path: str | os.PathLike[str],
+        shape: Sequence[int],
+        dtype: npt.DTypeLike,
+        sweep_key_list: Sequence[str],
+        data_key_list: Sequence[str],
+        metadata: dict[str, Any] | None = None,
+    ) -> Self:
+        """
+        Create a container file for a result whose data is written later.
+
+        The data is zero-filled on disk without being built in memory.
+
+        Parameters
+        ----------
+        path
+            Destination container file.
+        shape
+            Shape of the result data.
+        dtype
+            Data type of the result data.
+        sweep_key_list
+            Label of each sweep axis.
+        data_key_list
+            Labels of the data recorded at each sweep point.
+        metadata
+            Metadata stored in the result.
+
+        Returns
+        -------
+        Self
+            Result whose data is memory-mapped read-write from the file.
+            Empty data is read into memory instead.
+        """
+        template = cls(
+            metadata=dict(metadata or {}),
+            # Zero-strided placeholder: only its shape and dtype are used
+            data=np.broadcast_to(np.zeros((), dtype=dtype), tuple(shape)),
+            data_shape=list(shape),
+            sweep_key_list=list(sweep_key_list),
+            data_key_list=list(data_key_list),
+        )
+        template.to_container(path, preallocate=True)
+        return cls.from_container(path, mmap_mode="r+")
+
+    @classmethod
+    def merge_shards(
+        cls,
+        shards: Sequence[SweepShard],
+        results: Sequence[SweepMeasurementResult],
+        metadata: dict[str, Any] | None = None,
+        path: str | os.PathLike[str] | None = None,
+    ) -> SweepMeasurementResult:
+        """
+        Assemble the results of sweep shards into one result.
+
+        Every shard result is copied once into a buffer allocated for the
+        whole sweep.
+
+        Parameters
+        ----------
+        shards
+            Shards created by `SweepMeasurementConfig.shard`.
+        results
+            Result of each shard, in the same order.
+        metadata
+            Metadata of the merged result. Defaults to that of the first
+            result.
+        path
+            Optional container file that holds the merged data. The buffer
+            is then memory-mapped from the file instead of held in memory.
+
+        Returns
+        -------
+        SweepMeasurementResult
+            Result covering the full sweep. If `path` is given, its data is
+            memory-mapped read-only from the file.
+
+        Raises
+        ------
+        ValueError
+            If there are no shards, the results do not match the shards or
+            each other, or the shards do not cover the sweep exactly once.
+        """
+        if not shards:
+            raise ValueError("No shards to merge.")
+        if len(shards) != len(results):
+            raise ValueError(f"Got {len(results)} results for {len(shards)} shards.")
+        first = results[0]
+        sweep_shape = shards[0].sweep_shape
+        point_shape = tuple(first.data.shape[len(sweep_shape) :])
+        for shard, result in zip(shards, results, strict=True):
+            if shard.sweep_shape != sweep_shape:
+                raise ValueError("Shards belong to different sweeps.")
+            if (
+                result.data_key_list != first.data_key_list
+                or result.sweep_key_list != first.sweep_key_list
+            ):
+                raise ValueError("Shard results have different keys.")
+            expected = tuple(
+                len(range(*key.indices(length)))
+                for key, length in zip(shard.region, sweep_shape, strict=True)
+            )
+            if result.data.shape != (*expected, *point_shape):
+                raise ValueError(
+                    f"Expected shard data of shape {(*expected, *point_shape)}, "
+                    f"got {result.data.shape}."
+                )
+        coverage = np.zeros(sweep_shape, dtype=np.int64)
+        for shard in shards:
+            coverage[shard.region] += 1
+        if not (coverage == 1).all():
+            raise ValueError("Shards do not cover the sweep exactly once.")
+
+        shape = (*sweep_shape, *point_shape)
+        dtype = np.result_type(*(result.data.dtype for result in results))
+        merged_metadata = first.metadata if metadata is None else metadata
+        if path is None:
+            data = np.empty(shape, dtype=dtype)
+            for shard, result in zip(shards, results, strict=True):
+                data[shard.region] = result.data
+            return cls(
+                metadata=dict(merged_metadata),
+                data=data,
+                data_shape=list(shape),
+                sweep_key_list=list(first.sweep_key_list),
+                data_key_list=list(first.data_key_list),
+            )
+
+        target = cls.preallocate(
+            path,
+            shape,
+            dtype,
+            sweep_key_list=first.sweep_key_list,
+            data_key_list=first.data_key_list,
+            metadata=merged_metadata,
+        )
+        data = target.data
+        for shard, result in zip(shards, results, strict=True):
+            data[shard.region] = result.data
+        if isinstance(data, np.memmap):
+            data.flush()
+        del target, data
+        return cls.from_container(path)
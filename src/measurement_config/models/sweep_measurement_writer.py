@@ -0,0 +1,193 @@
+"""Incremental writer for sweep measurement results."""
+
+from __future__ import annotations
+
+import math
+import os
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+from typing_extensions import Self
+
+from .sweep_measurement_config import SweepMeasurementConfig
+from .sweep_measurement_result import SweepMeasurementResult
+
+
+class SweepMeasurementWriter:
+    """
+    Write a sweep measurement result to disk while it is being acquired.
+
+    The output is a container file preallocated for the whole sweep, so
+    memory use does not depend on the sweep size and the data written so far
+    remains on disk if the process stops early. Points that have not been
+    written read back as zero, or as `fill_value` if given.
+
+    Parameters
+    ----------
+    path
+        Destination container file.
+    config
+        Sweep configuration that defines the sweep axes.
+    data_key_list
+        Labels of the data recorded at each sweep point.
+    point_shape
+        Shape of the data recorded for each data key at each sweep point.
+    dtype
+        Data type of the result array.
+    metadata
+        Metadata stored in the result.
+    fill_value
+        Optional value written to every point before acquisition starts.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        config: SweepMeasurementConfig,
+        data_key_list: Sequence[str],
+        point_shape: Sequence[int] = (),
+        dtype: npt.DTypeLike = np.complex128,
+        metadata: dict[str, Any] | None = None,
+        fill_value: Any = None,
+    ) -> None:
+        """
+        Initialize the writer and preallocate the output file.
+
+        Parameters
+        ----------
+        path
+            Destination container file.
+        config
+            Sweep configuration that defines the sweep axes.
+        data_key_list
+            Labels of the data recorded at each sweep point.
+        point_shape
+            Shape of the data recorded for each data key at each sweep point.
+        dtype
+            Data type of the result array.
+        metadata
+            Metadata stored in the result.
+        fill_value
+            Optional value written to every point before acquisition starts.
+
+        Raises
+        ------
+        ValueError
+            If the sweep contents on an axis have different lengths.
+        """
+        sweep_parameter = config.sweep_parameter
+        self._sweep_shape = sweep_parameter.shape
+        self._point_shape = (len(data_key_list), *point_shape)
+        self._path = path
+        self._result = SweepMeasurementResult.preallocate(
+            path,
+            (*self._sweep_shape, *self._point_shape),
+            dtype,
+            sweep_key_list=[axis[0] for axis in sweep_parameter.sweep_axis],
+            data_key_list=data_key_list,
+            metadata=metadata,
+        )
+        # Zero-size arrays are read back as plain arrays rather than memmaps
+        self._data = self._result.data
+        self._flat_data = self._data.reshape(
+            math.prod(self._sweep_shape), *self._point_shape
+        )
+        if fill_value is not None:
+            self._data[...] = fill_value
+        self._closed = False
+
+    def __enter__(self) -> Self:
+        """Return the writer for use in a `with` block."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the writer when leaving a `with` block."""
+        self.close()
+
+    @property
+    def sweep_shape(self) -> tuple[int, ...]:
+        """Number of points along each sweep axis."""
+        return self._sweep_shape
+
+    @property
+    def size(self) -> int:
+        """Total number of sweep points."""
+        return self._flat_data.shape[0]
+
+    def write(
+        self, index: int | np.integer | Sequence[int | np.integer], data: npt.ArrayLike
+    ) -> None:
+        """
+        Write the data of a single sweep point.
+
+        Parameters
+        ----------
+        index
+            Flat index in C order, or one index per sweep axis.
+        data
+            Data for every data key at the sweep point.
+        """
+        self._check_open()
+        if not isinstance(index, (int, np.integer)):
+            index = int(np.ravel_multi_index(tuple(index), self._sweep_shape))
+        self._flat_data[index] = data
+
+    def write_chunk(self, start: int, data: npt.ArrayLike) -> None:
+        """
+        Write the data of consecutive sweep points.
+
+        Parameters
+        ----------
+        start
+            Flat index in C order of the first sweep point in the chunk.
+        data
+            Data with one leading entry per sweep point.
+
+        Raises
+        ------
+        ValueError
+            If the chunk extends past the last sweep point.
+        """
+        self._check_open()
+        chunk = np.asarray(data)
+        stop = start + chunk.shape[0]
+        if start < 0 or stop > self.size:
+            raise ValueError(
+                f"Chunk [{start}, {stop}) is out of range for {self.size} sweep points."
+            )
+        self._flat_data[start:stop] = chunk
+
+    def flush(self) -> None:
+        """Flush written data to disk."""
+        self._check_open()
+        self._flush_data()
+
+    def close(self) -> None:
+        """Flush written data and release the file."""
+        if self._closed:
+            return
+        self._flush_data()
+        self._closed = True
+        del self._flat_data, self._data, self._result
+
+    def finalize(self) -> SweepMeasurementResult:
+        """
+        Close the writer and load the written result.
+
+        Returns
+        -------
+        SweepMeasurementResult
+            Result whose data is memory-mapped read-only from the file.
+        """
+        self.close()
+        return SweepMeasurementResult.from_container(self._path)
+
+    def _flush_data(self) -> None:
+        if isinstance(self._data, np.memmap):
+            self._data.flush()
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise ValueError("Writer is closed.")
@@ -0,0 +1,118 @@
+"""Tests for asyncio save and load helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from measurement_config.core import Model, aio
+
+
+class AsyncExample(Model):
+    """Model with an array payload."""
+
+    label: str
+    data: npt.NDArray[np.float64]
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Thread pool that records the peak number of running tasks."""
+
+    def __init__(self) -> None:
+        super().__init__(max_workers=8)
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def submit(self, fn, /, *args, **kwargs):
+        """Run the task and track how many tasks are running."""
+
+        def run():
+            with self._lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            try:
+                time.sleep(0.01)
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.active -= 1
+
+        return super().submit(run)
+
+
+def test_async_save_and_load_roundtrip(tmp_path):
+    """Models saved asynchronously load back unchanged."""
+    model = AsyncExample(label="a", data=np.arange(1000, dtype=np.float64))
+    path = tmp_path / "model.json"
+
+    async def main() -> AsyncExample:
+        await model.save_json_async(path)
+        text = await model.to_json_async()
+        assert text == path.read_text()
+        assert (await AsyncExample.from_json_async(text)).label == "a"
+        return await AsyncExample.load_json_async(path, lazy=True)
+
+    restored = asyncio.run(main())
+    np.testing.assert_array_equal(restored.data, model.data)
+
+
+def test_async_save_creates_files_with_default_mode(tmp_path):
+    """Saved files get the same permissions as files created with `open`."""
+    reference = tmp_path / "reference.json"
+    reference.write_text("")
+    path = tmp_path / "model.json"
+    asyncio.run(AsyncExample(label="a", data=np.zeros(2)).save_json_async(path))
+    assert stat.S_IMODE(path.stat().st_mode) == stat.S_IMODE(reference.stat().st_mode)
+
+
+def test_async_operations_respect_concurrency_limit(tmp_path):
+    """No more operations than the limit run in the executor at once."""
+    models = [AsyncExample(label=str(i), data=np.zeros(4)) for i in range(6)]
+    executor = CountingExecutor()
+
+    async def main() -> None:
+        await asyncio.gather(
+            *(
+                model.save_json_async(tmp_path / f"{i}.json", executor=executor)
+                for i, model in enumerate(models)
+            )
+        )
+
+    aio.set_concurrency_limit(2)
+    try:
+        asyncio.run(main())
+    finally:
+        aio.set_concurrency_limit(aio.DEFAULT_CONCURRENCY_LIMIT)
+        executor.shutdown()
+    assert executor.peak == 2
+    assert len(list(tmp_path.glob("*.json"))) == 6
+    with pytest.raises(ValueError, match="positive"):
+        aio.set_concurrency_limit(0)
+
+
+def test_cancelled_save_leaves_no_file(tmp_path):
+    """Cancelling a save removes the partial output."""
+    model = AsyncExample(label="a", data=np.zeros(100))
+    path = tmp_path / "model.json"
+    executor = CountingExecutor()
+
+    async def main() -> None:
+        task = asyncio.create_task(
+            aio.save_json(model, path, executor=executor, chunk_size=16)
+        )
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    executor.shutdown()
+    assert list(tmp_path.iterdir()) == []
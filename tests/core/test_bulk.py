@@ -0,0 +1,67 @@
+"""Tests for parallel bulk serialization."""
+
+from __future__ import annotations
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from measurement_config.core import BulkError, Model
+from measurement_config.core.bulk import SHARED_MEMORY_THRESHOLD
+
+
+class BulkExample(Model):
+    """Model with a label and an array."""
+
+    label: str
+    data: npt.NDArray[np.float64]
+
+
+def _make_models(count: int) -> list[BulkExample]:
+    # The first model carries an array large enough for shared memory
+    large = np.arange(SHARED_MEMORY_THRESHOLD // 8 + 1, dtype=np.float64)
+    return [
+        BulkExample(label=f"m{i}", data=large if i == 0 else np.full(3, i, float))
+        for i in range(count)
+    ]
+
+
+def test_json_many_roundtrip_preserves_order():
+    """Bulk results come back in input order, including shared arrays."""
+    models = _make_models(7)
+    texts = BulkExample.to_json_many(models, max_workers=2, chunksize=2)
+    assert texts == [model.to_json() for model in models]
+
+    restored = BulkExample.from_json_many(texts, max_workers=2, chunksize=3)
+    assert [model.label for model in restored] == [m.label for m in models]
+    np.testing.assert_array_equal(restored[0].data, models[0].data)
+    assert restored[0].data.flags.writeable
+
+
+def test_from_json_many_reports_errors_per_item():
+    """Failed items are reported by index without losing the others."""
+    texts = [model.to_json() for model in _make_models(3)]
+    texts[1] = '{"label": "broken"}'
+
+    with pytest.raises(BulkError) as info:
+        BulkExample.from_json_many(texts, max_workers=2, chunksize=1)
+    assert list(info.value.errors) == [1]
+    assert info.value.results[1] is None
+    assert info.value.results[2].label == "m2"
+
+    results = BulkExample.from_json_many(texts, max_workers=2, return_exceptions=True)
+    assert isinstance(results[1], Exception)
+    assert results[0].label == "m0"
+
+
+def test_json_files_roundtrip(tmp_path):
+    """File variants read and write in the workers."""
+    models = _make_models(4)
+    paths = [tmp_path / f"{model.label}.json" for model in models]
+    assert BulkExample.to_json_files(models, paths, max_workers=2) == [None] * 4
+    assert paths[2].read_text() == models[2].to_json()
+
+    restored = BulkExample.from_json_files(paths, max_workers=2, trusted=True)
+    assert [model.fingerprint() for model in restored] == [
+        model.fingerprint() for model in models
+    ]
@@ -0,0 +1,37 @@
+"""Tests for the single-file container format."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from measurement_config.core.container import (
+    CONTAINER_ALIGNMENT,
+    read_container,
+    write_container,
+)
+
+
+def test_container_roundtrip_header_and_segments(tmp_path):
+    """Header is restored and segments start at aligned offsets."""
+    path = tmp_path / "data.bin"
+    first = np.arange(5, dtype=np.int16)
+    second = np.arange(6, dtype=np.complex128).reshape(2, 3)
+    write_container(path, {"label": "test"}, [first, second])
+
+    header, data_offset = read_container(path)
+    assert header == {"label": "test"}
+    assert data_offset % CONTAINER_ALIGNMENT == 0
+
+    raw = path.read_bytes()
+    assert raw[data_offset : data_offset + first.nbytes] == first.tobytes()
+    second_offset = data_offset + CONTAINER_ALIGNMENT
+    assert raw[second_offset : second_offset + second.nbytes] == second.tobytes()
+
+
+def test_read_container_rejects_other_files(tmp_path):
+    """Raise when the file does not start with the container magic."""
+    path = tmp_path / "data.json"
+    path.write_text("{}")
+    with pytest.raises(ValueError, match="Not a measurement_config container"):
+        read_container(path)
@@ -3,7 +3,8 @@
 import numpy as np
 import pytest
 
-from measurement_config.core import Expression
+from measurement_config.core import Expression, ExpressionSet
+from measurement_config.core.expression import DEFAULT_CACHE_MAXSIZE
 
 
 def test_expression_basic():
@@ -44,3 +45,61 @@ def test_deterministic_symbol_order():
     symbol_names = [s.name for s in expr.symbols]
     # Check that symbols are sorted regardless of appearance order
     assert symbol_names == ["a", "b", "c"]
+
+
+def test_expression_cache_reuses_compiled_function():
+    """Repeated expressions reuse the cached parse and lambdify result."""
+    Expression.cache_clear()
+    first = Expression("2 * duration + 1")
+    second = Expression("2 * duration + 1")
+    info = Expression.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+    assert info.currsize == 1
+    assert second.resolve({"duration": 3}) == first.resolve({"duration": 3}) == 7
+
+    Expression("2 * duration + 1", modules="math")
+    assert Expression.cache_info().currsize == 2
+
+
+def test_expression_cache_size_is_bounded():
+    """The cache evicts least recently used entries beyond its size."""
+    Expression.cache_clear()
+    try:
+        Expression.set_cache_maxsize(2)
+        Expression("a + 1")
+        Expression("a + 2")
+        Expression("a + 1")
+        Expression("a + 3")
+        assert Expression.cache_info().currsize == 2
+        Expression("a + 1")
+        Expression("a + 2")
+        info = Expression.cache_info()
+        assert info.maxsize == 2
+        assert info.hits == 2
+        assert info.misses == 4
+    finally:
+        Expression.set_cache_maxsize(DEFAULT_CACHE_MAXSIZE)
+        Expression.cache_clear()
+
+
+def test_expression_set_resolves_all_expressions():
+    """Resolve several expressions with shared subterms in one call."""
+    expr_set = ExpressionSet(["sin(a * t) + 1", "2 * sin(a * t)", "b", "3"])
+    assert len(expr_set) == 4
+    assert [s.name for s in expr_set.symbols] == ["a", "b", "t"]
+
+    a = np.array([1.0, 2.0])
+    first, second, third, fourth = expr_set.resolve({"a": a, "b": 5, "t": 0.5})
+    np.testing.assert_allclose(first, np.sin(a * 0.5) + 1)
+    np.testing.assert_allclose(second, 2 * np.sin(a * 0.5))
+    assert third == 5
+    assert fourth == 3
+
+
+def test_expression_set_errors():
+    """Raise on invalid syntax and missing symbol values."""
+    with pytest.raises(ValueError, match="Failed to parse expression"):
+        ExpressionSet(["x", "x + +"])
+    with pytest.raises(ValueError, match="Value for symbol 'y' not provided"):
+        ExpressionSet(["x", "y"]).resolve({"x": 1})
@@ -0,0 +1,118 @@
+"""Tests for pluggable JSON backends."""
+
+from __future__ import annotations
+
+import json
+import math
+
+import numpy as np
+import pytest
+
+from measurement_config.core import Model
+from measurement_config.core.json_backend import (
+    JsonBackend,
+    OrjsonBackend,
+    available_json_backends,
+    get_json_backend,
+    register_json_backend,
+    set_default_json_backend,
+)
+
+
+class JsonExample(Model):
+    """Model with an array and plain fields."""
+
+    name: str
+    value: float
+    array: np.ndarray
+
+
+def _make_model() -> JsonExample:
+    return JsonExample(name="ü", value=1e-05, array=np.arange(4.0))
+
+
+def test_stdlib_backend_is_always_available():
+    """The standard library backend is registered by default."""
+    assert "json" in available_json_backends()
+    assert isinstance(get_json_backend("json"), JsonBackend)
+    with pytest.raises(KeyError, match="Unknown JSON backend"):
+        get_json_backend("missing")
+
+
+def test_default_backend_output_matches_stdlib():
+    """The default output does not depend on optional JSON packages."""
+    assert get_json_backend().name == "json"
+    model = _make_model()
+    expected = json.dumps(model.to_dict(), ensure_ascii=False)
+    assert model.to_json() == expected
+    assert model.to_json_bytes() == expected.encode("utf-8")
+
+
+def test_json_bytes_roundtrip():
+    """Bytes output matches the string output and can be loaded directly."""
+    model = _make_model()
+    data = model.to_json_bytes(backend="json")
+    assert data == model.to_json(backend="json").encode("utf-8")
+
+    restored = JsonExample.from_json(data)
+    assert restored.name == model.name
+    np.testing.assert_array_equal(restored.array, model.array)
+
+
+@pytest.fixture
+def restore_json_backends(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Restore the registered backends and the default after the test."""
+    module = "measurement_config.core.json_backend"
+    backends = {name: get_json_backend(name) for name in available_json_backends()}
+    monkeypatch.setattr(f"{module}._backends", backends)
+    monkeypatch.setattr(f"{module}._default_name", get_json_backend().name)
+
+
+@pytest.mark.usefixtures("restore_json_backends")
+def test_custom_backend_registration():
+    """Registered backends can be selected by name or as the default."""
+
+    class CountingBackend(JsonBackend):
+        name = "counting"
+        calls = 0
+
+        def loads(self, data):
+            type(self).calls += 1
+            return super().loads(data)
+
+    default = get_json_backend().name
+    register_json_backend(CountingBackend())
+    model = _make_model()
+    JsonExample.from_json(model.to_json(), backend="counting")
+    assert CountingBackend.calls == 1
+    assert get_json_backend().name == default
+
+    set_default_json_backend("counting")
+    JsonExample.from_json(model.to_json())
+    assert CountingBackend.calls == 2
+
+
+def test_orjson_backend_encodes_with_orjson():
+    """The orjson backend encodes with orjson and keeps non-finite floats."""
+    pytest.importorskip("orjson")
+    backend = OrjsonBackend()
+    obj = {"name": "ü", "values": [1, 2.5], "none": None, 0: True}
+    assert (
+        backend.dumps_bytes(obj)
+        == '{"name":"ü","values":[1,2.5],"none":null,"0":true}'.encode()
+    )
+    assert backend.dumps(obj, indent=2) == json.dumps(obj, ensure_ascii=False, indent=2)
+    assert backend.dumps(obj, indent=4) == json.dumps(obj, ensure_ascii=False, indent=4)
+
+    data = backend.dumps_bytes({"value": math.nan, "none": None})
+    assert math.isnan(backend.loads(data)["value"])
+    assert backend.loads(data)["none"] is None
+
+    model = _make_model()
+    assert json.loads(model.to_json_bytes(backend="orjson")) == json.loads(
+        model.to_json_bytes(backend="json")
+    )
+    restored = JsonExample.from_json(
+        model.model_copy(update={"value": math.inf}).to_json_bytes(backend="orjson")
+    )
+    assert restored.value == math.inf
@@ -2,13 +2,27 @@
 
 from __future__ import annotations
 
-from typing import Any
+import copy
+import enum
+import json
+import typing
+from typing import Annotated, Any
 
 import numpy as np
 import numpy.typing as npt
+import pytest
 import tunits
+from google.protobuf import json_format
+from pydantic import (
+    AfterValidator,
+    ConfigDict,
+    ValidationError,
+    computed_field,
+    model_validator,
+)
 
-from measurement_config.core import Model, MutableModel
+from measurement_config.core import ArrayEncoding, Model, MutableModel
+from measurement_config.core.model import external_array_dict, external_array_layout
 
 
 class ExampleModel(Model):
@@ -34,12 +48,70 @@ class SchemaModel(Model):
     unit_value: tunits.Value
 
 
+class ArrayModel(Model):
+    """Model holding a single NumPy array."""
+
+    array: npt.NDArray
+
+
 class MutableExample(MutableModel):
     """Simple mutable model for assignment tests."""
 
     value: int
 
 
+class RangeExample(MutableModel):
+    """Mutable model with a cross-field constraint."""
+
+    lo: int
+    hi: int
+
+    validation_count: typing.ClassVar[int] = 0
+
+    @model_validator(mode="after")
+    def _check_range(self) -> RangeExample:
+        type(self).validation_count += 1
+        if self.lo >= self.hi:
+            raise ValueError("lo must be below hi")
+        return self
+
+
+_entry_validations: list[int] = []
+
+
+def _count_entry(value: int) -> int:
+    _entry_validations.append(value)
+    return value
+
+
+class EntryExample(Model):
+    """Model whose mapping entries record their validation."""
+
+    entries: dict[str, Annotated[int, AfterValidator(_count_entry)]]
+    bounds: RangeExample
+
+
+class FrozenRangeExample(Model):
+    """Frozen model with a cross-field constraint."""
+
+    lo: int
+    hi: int
+
+    @model_validator(mode="after")
+    def _check_range(self) -> FrozenRangeExample:
+        if self.lo >= self.hi:
+            raise ValueError("lo must be below hi")
+        return self
+
+
+class CalibrationExample(MutableModel):
+    """Mutable model with nested fields for bulk update tests."""
+
+    frequency: dict[str, float]
+    inner: ArrayModel
+    label: str
+
+
 def test_model_roundtrip_with_custom_types():
     """Roundtrip JSON/dict serialization for NumPy, tunits, and complex values."""
     model = ExampleModel(
@@ -57,7 +129,7 @@ def test_model_roundtrip_with_custom_types():
     )
 
     data = model.to_dict()
-    assert data["__meta__"]["version"] == 0
+    assert data["__meta__"]["version"] == 1
     assert data["array"]["__type__"].startswith("numpy.")
     assert data["complex_array"]["__type__"].startswith("numpy.")
     assert data["scalar"]["__type__"].startswith("numpy.")
@@ -89,7 +161,7 @@ def test_model_roundtrip_with_custom_types():
 
     json_str = model.to_json(indent=2)
     assert '"__meta__"' in json_str
-    assert '"version": 0' in json_str
+    assert '"version": 1' in json_str
     restored_from_json = ExampleModel.from_json(json_str)
     np.testing.assert_array_equal(restored_from_json.array, model.array)
     np.testing.assert_array_equal(
@@ -116,6 +188,55 @@ def test_model_roundtrip_with_custom_types():
     assert restored_from_json.complex_list == model.complex_list
 
 
+def test_numpy_array_uses_buffer_encoding():
+    """NumPy arrays are stored as a base64 raw buffer with dtype and shape."""
+    array = np.arange(12, dtype=np.complex64).reshape(3, 4) * (1 + 2j)
+    data = ArrayModel(array=array).to_dict()
+
+    payload = data["array"]
+    assert payload["__type__"] == "numpy.ndarray"
+    assert payload["__encoding__"] == "buffer"
+    assert payload["dtype"] == "c8"
+    assert payload["shape"] == [3, 4]
+    assert isinstance(payload["data"], str)
+
+    restored = ArrayModel.from_json(ArrayModel(array=array).to_json())
+    assert restored.array.dtype == np.complex64
+    assert restored.array.flags.writeable
+    np.testing.assert_array_equal(restored.array, array)
+
+
+def test_numpy_array_buffer_encoding_preserves_byte_order():
+    """Non-native byte order and non-contiguous layouts survive a roundtrip."""
+    big_endian = np.arange(6, dtype=">i4").reshape(2, 3)
+    restored = ArrayModel.from_dict(ArrayModel(array=big_endian).to_dict())
+    assert restored.array.dtype == np.dtype(">i4")
+    np.testing.assert_array_equal(restored.array, big_endian)
+
+    transposed = np.arange(6.0).reshape(2, 3).T
+    restored = ArrayModel.from_dict(ArrayModel(array=transposed).to_dict())
+    np.testing.assert_array_equal(restored.array, transposed)
+
+
+def test_numpy_array_legacy_proto_payload_is_readable():
+    """Payloads written with serialization version 0 can still be loaded."""
+    data = {
+        "array": {
+            "complexes": {
+                "values": [
+                    {"real": 1.0, "imaginary": 2.0},
+                    {"real": 3.0, "imaginary": 0.0},
+                ]
+            },
+            "shape": [1, 2],
+            "__type__": "numpy.ndarray",
+        },
+        "__meta__": {"version": 0},
+    }
+    restored = ArrayModel.from_dict(data)
+    np.testing.assert_array_equal(restored.array, np.array([[1 + 2j, 3 + 0j]]))
+
+
 def test_json_schema_supports_custom_types():
     """Ensure JSON schema generation succeeds for NumPy and tunits types."""
     schema = SchemaModel.json_schema()
@@ -129,3 +250,575 @@ def test_mutable_model_allows_assignment():
     model.value = 2
     assert model.value == 2
     assert MutableExample.model_config.get("frozen") is False
+
+
+def test_mutable_model_update_validates_once_and_rolls_back():
+    """Bulk updates apply together, share untouched subtrees and roll back."""
+    inner = ArrayModel(array=np.arange(3))
+    model = CalibrationExample(frequency={"q0": 1.0, "q1": 2.0}, inner=inner, label="a")
+
+    model.update({"frequency.q0": 1.5, ("frequency", "q2"): "3"}, label="b")
+    assert model.frequency == {"q0": 1.5, "q1": 2.0, "q2": 3.0}
+    assert model.label == "b"
+    assert model.inner is inner
+
+    with pytest.raises(ValueError, match="valid"):
+        model.update({"frequency.q0": 9.0}, label=["not", "a", "string"])
+    assert model.frequency["q0"] == 1.5
+    assert model.label == "b"
+
+
+def test_mutable_model_batch_defers_validation():
+    """Changes inside a batch are validated once when it exits."""
+    model = MutableExample(value=1)
+    with model.batch():
+        model.value = 2
+        model.update(value="3")
+        assert model.value == 2
+    assert model.value == 3
+
+    with pytest.raises(ValueError, match="valid"), model.batch():
+        model.update(value="not an int")
+    assert model.value == 3
+
+    def fail() -> None:
+        with model.batch():
+            model.value = 4
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        fail()
+    assert model.value == 3
+
+
+def test_mutable_model_update_validates_final_state_once():
+    """Cross-field validators run once and only on the final state."""
+    model = RangeExample(lo=0, hi=1)
+    RangeExample.validation_count = 0
+
+    model.update(lo=5, hi=10)
+    assert (model.lo, model.hi) == (5, 10)
+    assert RangeExample.validation_count == 1
+
+    with model.batch():
+        model.lo = 20
+        model.hi = 30
+    assert (model.lo, model.hi) == (20, 30)
+    assert RangeExample.validation_count == 2
+
+    with pytest.raises(ValueError, match="lo must be below hi"):
+        model.update(lo=40)
+    assert (model.lo, model.hi) == (20, 30)
+
+
+def test_model_derive_validates_only_replaced_entries():
+    """Deriving revalidates changed mapping entries, not the whole mapping."""
+    model = EntryExample(
+        entries={f"q{i}": i for i in range(100)}, bounds=RangeExample(lo=0, hi=1)
+    )
+    _entry_validations.clear()
+
+    variant = model.derive({"entries.q1": "7", ("entries", "new"): 8})
+    assert variant.entries["q1"] == 7
+    assert variant.entries["new"] == 8
+    assert sorted(_entry_validations) == [7, 8]
+    assert variant.bounds is model.bounds
+    assert model.entries["q1"] == 1
+
+    with pytest.raises(ValidationError):
+        model.derive({"entries.q1": "not an int"})
+
+    frozen = FrozenRangeExample(lo=0, hi=1)
+    assert frozen.derive(lo=5, hi=10) == FrozenRangeExample(lo=5, hi=10)
+
+
+def test_model_container_roundtrip_with_custom_types(tmp_path):
+    """Models with nested custom types survive a container roundtrip."""
+    model = ExampleModel(
+        array=np.array([1.0, 2.0, 3.0]),
+        complex_array=np.array([], dtype=np.complex128),
+        scalar=np.float64(1.25),
+        complex_scalar=np.complex128(2 + 3j),
+        unit_value=tunits.Value(5.0, "GHz"),
+        unit_array=tunits.ValueArray([1, 2, 3], "ns"),
+        time_value=tunits.Time(12.5, "ns"),
+        frequency_array=tunits.FrequencyArray([1, 2, 3], "GHz"),
+        complex_list=[1 + 2j],
+        complex_value=3 + 4j,
+        metadata={"window": np.arange(3)},
+    )
+    path = tmp_path / "model.bin"
+    model.to_container(path)
+
+    restored = ExampleModel.from_container(path)
+    np.testing.assert_array_equal(restored.array, model.array)
+    assert restored.complex_array.shape == (0,)
+    assert restored.complex_array.dtype == np.complex128
+    assert restored.scalar == model.scalar
+    assert restored.unit_value == model.unit_value
+    assert restored.time_value == model.time_value
+    assert restored.complex_list == model.complex_list
+    np.testing.assert_array_equal(restored.metadata["window"], np.arange(3))
+
+
+def test_to_dict_accepts_out_of_band_array_encoder():
+    """Array encoders passed to `to_dict` may store arrays elsewhere."""
+    stored: dict[str, np.ndarray] = {}
+
+    def encode(value: np.ndarray) -> dict | None:
+        stored["array"] = value
+        return external_array_dict(value, "test", ref="array")
+
+    data = ArrayModel(array=np.arange(6.0).reshape(2, 3)).to_dict(encode)
+    assert data["array"]["ref"] == "array"
+    layout = external_array_layout(data["array"], "test")
+    assert layout == (np.dtype(np.float64), (2, 3))
+    assert external_array_layout(data["array"], "other") is None
+    assert stored["array"].shape == (2, 3)
+
+
+def test_empty_multidimensional_arrays_roundtrip(tmp_path):
+    """Empty arrays keep their shape through every encoding."""
+    model = ArrayModel(array=np.zeros((0, 3)))
+    compressed = ArrayEncoding(compression="zlib")
+    path = tmp_path / "model.bin"
+    model.to_container(path)
+    for restored in (
+        ArrayModel.from_json(model.to_json()),
+        ArrayModel.from_dict(model.to_dict(array_encoding=compressed)),
+        ArrayModel.from_container(path),
+    ):
+        assert restored.array.shape == (0, 3)
+        assert restored.fingerprint() == model.fingerprint()
+    assert model.fingerprint() != ArrayModel(array=np.zeros((3, 0))).fingerprint()
+
+
+def test_lazy_loading_decodes_array_fields_on_access():
+    """Array fields are decoded on first access and then cached."""
+    model = ExampleModel(
+        array=np.array([1.0, 2.0, 3.0]),
+        complex_array=np.array([1 + 2j, 3 + 4j]),
+        scalar=np.float64(1.25),
+        complex_scalar=np.complex128(2 + 3j),
+        unit_value=tunits.Value(5.0, "GHz"),
+        unit_array=tunits.ValueArray([1, 2, 3], "ns"),
+        time_value=tunits.Time(12.5, "ns"),
+        frequency_array=tunits.FrequencyArray([1, 2, 3], "GHz"),
+        complex_list=[1 + 2j],
+        complex_value=3 + 4j,
+        metadata={"label": "test"},
+    )
+
+    restored = ExampleModel.from_json(model.to_json(), lazy=True)
+    assert restored.metadata == {"label": "test"}
+    assert restored.unit_value == model.unit_value
+    assert "array" not in restored.__dict__
+    assert "frequency_array" not in restored.__dict__
+
+    np.testing.assert_array_equal(restored.array, model.array)
+    assert "array" in restored.__dict__
+    assert restored.array is restored.array
+    assert isinstance(restored.frequency_array, tunits.FrequencyArray)
+
+    restored = ExampleModel.from_dict(model.to_dict(), lazy=True)
+    assert restored.to_dict() == model.to_dict()
+
+
+class ValidatedArrayExample(Model):
+    """Model with an array field and a validator reading several fields."""
+
+    low: int
+    array: npt.NDArray
+    high: int
+
+    @model_validator(mode="after")
+    def _check_bounds(self) -> ValidatedArrayExample:
+        if self.low > self.high:
+            raise ValueError("low must not exceed high")
+        return self
+
+
+def test_lazy_loading_keeps_validators_copies_and_equality():
+    """Lazy instances validate, copy and compare like eager ones."""
+    model = ValidatedArrayExample(low=0, array=np.array([1.5]), high=1)
+    restored = ValidatedArrayExample.from_json(model.to_json(), lazy=True)
+    assert restored.high == 1
+    np.testing.assert_array_equal(restored.array, model.array)
+    invalid = {**model.to_dict(), "high": -1}
+    with pytest.raises(ValueError, match="low must not exceed high"):
+        ValidatedArrayExample.from_dict(invalid, lazy=True)
+
+    restored = ArrayModel.from_json(ArrayModel(array=np.arange(1)).to_json(), lazy=True)
+    copy = restored.model_copy()
+    np.testing.assert_array_equal(copy.array, np.arange(1))
+    np.testing.assert_array_equal(restored.array, np.arange(1))
+
+    eager = ArrayModel(array=np.arange(1))
+    lazy = ArrayModel.from_json(eager.to_json(), lazy=True)
+    assert "array=" in repr(ArrayModel.from_json(eager.to_json(), lazy=True))
+    assert lazy == eager
+
+
+class DefaultedArrayExample(Model):
+    """Model with an optional array field."""
+
+    count: int
+    array: npt.NDArray | None = None
+
+
+def test_lazy_instances_behave_like_eager_ones():
+    """Defaults, copies, iteration and hashing see the deferred fields."""
+    eager = DefaultedArrayExample(count=1, array=np.arange(3))
+    lazy = DefaultedArrayExample.from_json(eager.to_json(), lazy=True)
+    np.testing.assert_array_equal(lazy.array, np.arange(3))
+
+    lazy = DefaultedArrayExample.from_json(eager.to_json(), lazy=True)
+    assert lazy.model_fields_set == eager.model_fields_set
+    assert dict(lazy).keys() == dict(eager).keys()
+    np.testing.assert_array_equal(dict(lazy)["array"], np.arange(3))
+    with pytest.raises(TypeError, match="unhashable"):
+        hash(DefaultedArrayExample.from_json(eager.to_json(), lazy=True))
+
+    lazy = DefaultedArrayExample.from_json(eager.to_json(), lazy=True)
+    updated = lazy.model_copy(update={"array": np.ones(2)})
+    expected = DefaultedArrayExample(count=1, array=np.ones(2))
+    assert updated.fingerprint() == expected.fingerprint()
+    assert updated.to_dict() == expected.to_dict()
+    assert lazy.fingerprint() == eager.fingerprint()
+
+
+class NestedExample(Model):
+    """Model nesting other models next to plain and custom fields."""
+
+    label_list: list[str]
+    child: SchemaModel
+    child_map: dict[str, ArrayModel]
+    window: npt.NDArray | list
+    extra: Any
+
+
+def test_nested_models_serialize_custom_values_once():
+    """Nested models and custom-typed fields are encoded, plain fields untouched."""
+    model = NestedExample(
+        label_list=["a", "b"],
+        child=SchemaModel(array=np.array([1.0]), unit_value=tunits.Value(1, "ns")),
+        child_map={"x": ArrayModel(array=np.arange(3))},
+        window=np.ones(2),
+        extra={"value": 1 + 2j},
+    )
+    data = model.to_dict()
+    assert data["label_list"] == ["a", "b"]
+    assert data["child"]["array"]["__type__"] == "numpy.ndarray"
+    assert data["child"]["unit_value"]["__type__"] == "tunits.Value"
+    assert data["child_map"]["x"]["array"]["__encoding__"] == "buffer"
+    assert data["window"]["__type__"] == "numpy.ndarray"
+    assert data["extra"]["value"]["__type__"] == "python.complex"
+
+    restored = NestedExample.from_json(model.to_json())
+    np.testing.assert_array_equal(restored.child_map["x"].array, np.arange(3))
+    assert restored.extra == {"value": 1 + 2j}
+
+
+class ComputedExample(Model):
+    """Model exposing custom values through computed fields and extras."""
+
+    model_config = ConfigDict(extra="allow")
+
+    scale: float
+
+    @computed_field
+    @property
+    def samples(self) -> np.ndarray:
+        """Scaled sample points."""
+        return np.arange(3.0) * self.scale
+
+    @computed_field(alias="periodValue")
+    @property
+    def period(self) -> tunits.Value:
+        """Period matching the scale."""
+        return tunits.Value(self.scale, "ns")
+
+
+def test_computed_fields_and_extras_serialize_custom_values():
+    """Computed fields and extra attributes are tag-encoded like fields."""
+    model = ComputedExample.model_validate(
+        {"scale": 2.0, "trace": np.ones(2), "offset": tunits.Value(1, "ns")}
+    )
+    data = model.to_dict()
+    assert data["samples"]["__type__"] == "numpy.ndarray"
+    assert data["period"]["__type__"] == "tunits.Value"
+    assert model.model_dump(by_alias=True)["periodValue"]["__type__"] == "tunits.Value"
+    assert data["trace"]["__type__"] == "numpy.ndarray"
+    assert data["offset"]["__type__"] == "tunits.Value"
+
+    restored = ComputedExample.from_json(model.to_json())
+    np.testing.assert_array_equal(restored.samples, model.samples)
+    extra = restored.model_extra or {}
+    np.testing.assert_array_equal(extra["trace"], np.ones(2))
+    assert extra["offset"] == tunits.Value(1, "ns")
+
+
+def test_from_dict_does_not_modify_input():
+    """Decoding leaves the serialized payload untouched."""
+    data = NestedExample(
+        label_list=["a"],
+        child=SchemaModel(array=np.array([1.0]), unit_value=tunits.Value(1, "ns")),
+        child_map={},
+        window=[1, 2],
+        extra={"value": 1 + 2j},
+    ).to_dict()
+    snapshot = json.dumps(data, sort_keys=True)
+    NestedExample.from_dict(data)
+    NestedExample.from_dict(data, trusted=True)
+    assert json.dumps(data, sort_keys=True) == snapshot
+
+
+class ColorExample(str, enum.Enum):
+    """Enum stored by value."""
+
+    RED = "red"
+    BLUE = "blue"
+
+
+class TrustedExample(Model):
+    """Model with fields whose JSON form differs from the validated type."""
+
+    shape: tuple[int, int]
+    sizes: tuple[int, ...]
+    color: ColorExample
+    palette: dict[str, ColorExample]
+    fallback: ColorExample | None
+    child: SchemaModel
+
+
+def test_trusted_loading_rebuilds_tuples_and_enums():
+    """Trusted loading gives the same values as validation."""
+    model = TrustedExample(
+        shape=(2, 3),
+        sizes=(1, 2, 3),
+        color=ColorExample.RED,
+        palette={"x": ColorExample.BLUE},
+        fallback=None,
+        child=SchemaModel(array=np.array([1.0]), unit_value=tunits.Value(1, "ns")),
+    )
+    restored = TrustedExample.from_json(model.to_json(), trusted=True)
+    assert restored.shape == (2, 3)
+    assert restored.sizes == (1, 2, 3)
+    assert restored.color is ColorExample.RED
+    assert restored.palette == {"x": ColorExample.BLUE}
+    assert restored == TrustedExample.from_json(model.to_json())
+
+
+def test_tagged_proto_values_reject_unknown_fields():
+    """Encoded tunits values are parsed strictly."""
+    data = SchemaModel(
+        array=np.array([1.0]), unit_value=tunits.Value(1, "ns")
+    ).to_dict()
+    data["unit_value"]["unknown"] = 1
+    with pytest.raises(json_format.ParseError, match="unknown"):
+        SchemaModel.from_dict(data)
+
+
+def test_fingerprint_is_stable_and_order_independent():
+    """Equal content gives equal fingerprints regardless of mapping order."""
+    child = SchemaModel(array=np.array([1.0, 2.0]), unit_value=tunits.Value(1, "ns"))
+    first = NestedExample(
+        label_list=["a"],
+        child=child,
+        child_map={
+            "x": ArrayModel(array=np.arange(3)),
+            "y": ArrayModel(array=np.ones(2)),
+        },
+        window=np.ones(2),
+        extra={"a": 1, "b": 1 + 2j},
+    )
+    second = NestedExample.from_json(first.to_json())
+    reordered = first.model_copy(
+        update={"child_map": dict(reversed(first.child_map.items()))}
+    )
+    assert first.fingerprint() == second.fingerprint() == reordered.fingerprint()
+    assert first.fingerprint() == first.fingerprint()
+
+    changed = first.model_copy(
+        update={"child": child.model_copy(update={"array": np.array([1.0, 3.0])})}
+    )
+    assert changed.fingerprint() != first.fingerprint()
+    other_unit = first.model_copy(
+        update={"child": child.model_copy(update={"unit_value": tunits.Value(1, "us")})}
+    )
+    assert other_unit.fingerprint() != first.fingerprint()
+    other_dtype = ArrayModel(array=np.arange(3, dtype=np.int32))
+    assert other_dtype.fingerprint() != ArrayModel(array=np.arange(3)).fingerprint()
+
+
+def test_fingerprint_reuses_cached_child_digests(monkeypatch):
+    """Nested models are hashed once and mutable models are not cached."""
+    child = ArrayModel(array=np.arange(3))
+    parent = NestedExample(
+        label_list=[],
+        child=SchemaModel(array=np.array([1.0]), unit_value=tunits.Value(1, "ns")),
+        child_map={"x": child},
+        window=[],
+        extra=None,
+    )
+    expected = child.fingerprint()
+    calls = []
+    original = ArrayModel.fingerprint
+
+    def counting(self):
+        calls.append(self)
+        return original(self)
+
+    monkeypatch.setattr(ArrayModel, "fingerprint", counting)
+    parent.fingerprint()
+    parent.fingerprint()
+    assert calls == [child]
+    assert child.fingerprint() == expected
+
+    mutable = MutableExample(value=1)
+    before = mutable.fingerprint()
+    mutable.value = 2
+    assert mutable.fingerprint() != before
+
+
+def test_fingerprint_cache_is_invisible_and_dropped_by_copies():
+    """Memoized digests do not change equality or output and are not copied."""
+    model = ArrayModel(array=np.arange(1))
+    digest = model.fingerprint()
+    fresh = ArrayModel(array=np.arange(1))
+    assert model == fresh
+    assert fresh == model
+    assert repr(model) == repr(fresh)
+    assert model.to_dict() == fresh.to_dict()
+
+    changed = model.model_copy(update={"array": np.arange(2)})
+    assert changed.fingerprint() == ArrayModel(array=np.arange(2)).fingerprint()
+    assert copy.deepcopy(model).fingerprint() == digest
+    assert model.fingerprint() == digest
+
+
+def test_diff_and_apply_patch_handle_added_removed_and_arrays():
+    """Patches add and remove mapping keys and replace arrays and lists."""
+    base = NestedExample(
+        label_list=["a", "b"],
+        child=SchemaModel(array=np.array([1.0]), unit_value=tunits.Value(1, "ns")),
+        child_map={"x": ArrayModel(array=np.arange(3))},
+        window=np.ones(2),
+        extra={"keep": 1, "drop": 2},
+    )
+    target = NestedExample(
+        label_list=["a", "c", "d"],
+        child=base.child,
+        child_map={
+            "x": ArrayModel(array=np.arange(4)),
+            "y": ArrayModel(array=np.ones(1)),
+        },
+        window=np.ones(2),
+        extra={"keep": 1, "new": 1 + 2j},
+    )
+    patch = base.diff(target)
+    paths = sorted(tuple(change["path"]) for change in patch["changes"])
+    assert paths == [
+        ("child_map", "x", "array"),
+        ("child_map", "y"),
+        ("extra", "drop"),
+        ("extra", "new"),
+        ("label_list",),
+    ]
+
+    patched = base.apply_patch(json.loads(json.dumps(patch)))
+    assert patched.fingerprint() == target.fingerprint()
+    assert isinstance(patched.child_map["y"], ArrayModel)
+    assert patched.child is base.child
+    assert patched.window is base.window
+
+
+def test_diff_ignores_nan_and_patches_validate_final_state():
+    """NaN equals itself in diffs, and patches are validated as a whole."""
+    base = NestedExample(
+        label_list=[],
+        child=SchemaModel(
+            array=np.array([np.nan, 1.0]), unit_value=tunits.Value(np.nan, "ns")
+        ),
+        child_map={},
+        window=np.array([np.nan]),
+        extra={"nan": float("nan"), "complex": complex(np.nan, 1)},
+    )
+    copy = NestedExample.from_json(base.to_json())
+    assert base.diff(copy)["changes"] == []
+
+    frozen = FrozenRangeExample(lo=0, hi=1)
+    patch = frozen.diff(FrozenRangeExample(lo=5, hi=10))
+    assert frozen.apply_patch(patch) == FrozenRangeExample(lo=5, hi=10)
+
+
+class CompressedExample(Model):
+    """Model with a field that is always stored compressed."""
+
+    compressed: Annotated[npt.NDArray, ArrayEncoding(compression="zlib")]
+    plain: npt.NDArray
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma", "bz2"])
+def test_array_encoding_compression_roundtrip(codec):
+    """Compressed arrays are decoded without options."""
+    model = ArrayModel(array=np.zeros((64, 64), dtype=np.complex128))
+    data = model.to_dict(ArrayEncoding(compression=codec, level=1))
+    assert data["array"]["compression"] == codec
+    assert len(data["array"]["data"]) < len(model.to_dict()["array"]["data"]) / 10
+
+    restored = ArrayModel.from_json(json.dumps(data))
+    assert restored.array.dtype == np.complex128
+    assert restored.array.flags.writeable
+    np.testing.assert_array_equal(restored.array, model.array)
+
+
+def test_array_encoding_dtype_reduction():
+    """Downcasting is checked for exactness unless lossy is allowed."""
+    exact = ArrayModel(array=np.array([0.5, 1.0 + 2.0j, np.nan]))
+    data = exact.to_dict(ArrayEncoding(dtype="complex64"))
+    assert data["array"]["dtype"] == "c8"
+    assert data["array"]["source_dtype"] == "<c16"
+    restored = ArrayModel.from_dict(data)
+    assert restored.array.dtype == np.complex128
+    np.testing.assert_array_equal(restored.array, exact.array)
+
+    inexact = ArrayModel(array=np.array([0.1]))
+    assert inexact.to_dict(ArrayEncoding(dtype="float32"))["array"]["dtype"] == "f8"
+    data = inexact.to_dict(ArrayEncoding(dtype="float32", lossy=True))
+    assert data["array"]["dtype"] == "f4"
+    restored = ArrayModel.from_dict(data)
+    assert restored.array.dtype == np.float64
+    assert restored.array[0] == np.float32(0.1)
+
+
+@pytest.mark.filterwarnings("error")
+@pytest.mark.parametrize(
+    ("array", "dtype"),
+    [
+        (np.array([1.0 + 2.0j, 3.0]), "float64"),
+        (np.array([1.0, 2.0]) + 0j, "float32"),
+        (np.array([np.nan, np.inf, 1.0]), "int32"),
+        (np.array([1e300, 1.0]), "float32"),
+    ],
+)
+def test_array_encoding_dtype_reduction_does_not_warn(array, dtype):
+    """Trial casts that lose values fall back silently or reduce exactly."""
+    model = ArrayModel(array=array)
+    restored = ArrayModel.from_dict(model.to_dict(ArrayEncoding(dtype=dtype)))
+    np.testing.assert_array_equal(restored.array, array)
+    assert restored.array.dtype == array.dtype
+
+
+def test_array_encoding_field_annotation():
+    """Field options apply unless the caller passes its own."""
+    model = CompressedExample(compressed=np.ones(100), plain=np.ones(100))
+    data = model.to_dict()
+    assert data["compressed"]["compression"] == "zlib"
+    assert "compression" not in data["plain"]
+    restored = CompressedExample.from_json(model.to_json())
+    np.testing.assert_array_equal(restored.compressed, model.compressed)
+
+    data = model.to_dict(ArrayEncoding(compression="bz2"))
+    assert data["compressed"]["compression"] == "bz2"
+    assert data["plain"]["compression"] == "bz2"
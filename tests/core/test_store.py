@@ -0,0 +1,130 @@
+"""Tests for the content-addressed model store."""
+
+from __future__ import annotations
+
+import sqlite3
+import stat
+import sys
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+from pydantic import ValidationError
+
+from measurement_config.core import Model, ModelStore
+
+
+class ConfigExample(Model):
+    """Configuration stored alongside results."""
+
+    name: str
+
+
+class ResultExample(Model):
+    """Result with metadata and a large array."""
+
+    metadata: dict[str, Any]
+    data: npt.NDArray[np.float64]
+
+
+def test_store_deduplicates_models_and_blobs(tmp_path):
+    """Identical models and arrays are stored once."""
+    data = np.arange(1024, dtype=np.float64)
+    with ModelStore(tmp_path) as store:
+        first = store.put(ResultExample(metadata={"run": 1}, data=data))
+        again = store.put(ResultExample(metadata={"run": 1}, data=data))
+        other = store.put(ResultExample(metadata={"run": 2}, data=data))
+        assert first.digest == again.digest != other.digest
+        assert len(store) == 2
+        assert len(list((tmp_path / "blobs").rglob("*"))) == 2  # prefix dir + blob
+
+        loaded = store.get(first.digest)
+        assert isinstance(loaded, ResultExample)
+        assert isinstance(loaded.data, np.memmap)
+        np.testing.assert_array_equal(loaded.data, data)
+        assert loaded.fingerprint() == first.digest
+
+
+def test_store_writes_empty_arrays_as_blobs(tmp_path):
+    """Empty multi-dimensional arrays can be moved into blobs."""
+    model = ResultExample(metadata={}, data=np.zeros((0, 3)))
+    with ModelStore(tmp_path, blob_threshold=0) as store:
+        entry = store.put(model)
+        assert store.get(entry.digest).data.shape == (0, 3)
+
+
+def test_store_validates_unless_trusted(tmp_path):
+    """Stored objects are validated on load unless trust is requested."""
+    with ModelStore(tmp_path) as store:
+        entry = store.put(ConfigExample(name="a"))
+        path = next((tmp_path / "objects").rglob(f"{entry.digest}.json"))
+        path.write_text(path.read_text().replace('"a"', "1"))
+
+        with pytest.raises(ValidationError):
+            entry.load()
+        assert entry.load(trusted=True).name == 1
+
+
+def test_store_only_loads_defined_model_classes(tmp_path):
+    """Class names in the index never cause modules to be imported."""
+    with ModelStore(tmp_path) as store:
+        entry = store.put(ConfigExample(name="a"))
+    connection = sqlite3.connect(tmp_path / "index.sqlite")
+    with connection:
+        connection.execute("UPDATE objects SET class = 'this.ConfigExample'")
+    connection.close()
+
+    with ModelStore(tmp_path) as store:
+        with pytest.raises(TypeError, match="Unknown model class"):
+            store.get(entry.digest)
+        assert "this" not in sys.modules
+        assert store.get(entry.digest, cls=ConfigExample).name == "a"
+
+
+def test_store_creates_files_with_default_mode(tmp_path):
+    """Objects and blobs get the same permissions as files created with `open`."""
+    reference = tmp_path / "reference"
+    reference.write_text("")
+    with ModelStore(tmp_path / "store", blob_threshold=0) as store:
+        store.put(ResultExample(metadata={}, data=np.zeros(4)))
+    modes = {
+        stat.S_IMODE(path.stat().st_mode)
+        for directory in ("objects", "blobs")
+        for path in (tmp_path / "store" / directory).rglob("*")
+        if path.is_file()
+    }
+    assert modes == {stat.S_IMODE(reference.stat().st_mode)}
+
+
+def test_store_queries_index_without_loading(tmp_path):
+    """Queries use indexed fields, tags and creation time."""
+    config_a = ConfigExample(name="a")
+    config_b = ConfigExample(name="b")
+    with ModelStore(tmp_path, index_fields=["metadata.experiment"]) as store:
+        store.put(config_a)
+        for run, config in enumerate([config_a, config_b, config_a]):
+            store.put(
+                ResultExample(
+                    metadata={"experiment": "rabi", "run": run},
+                    data=np.zeros(4),
+                ),
+                tags={"config": config, "run": run},
+            )
+
+        results = store.find(ResultExample, tags={"config": config_a})
+        assert [entry.load(ResultExample).metadata["run"] for entry in results] == [
+            0,
+            2,
+        ]
+        assert len(store.find(tags={"experiment": "rabi"})) == 0
+        assert len(store.find(tags={"metadata.experiment": "rabi"})) == 3
+        assert len(store.find(ConfigExample)) == 1
+        assert store.find(since=results[-1].created + 1) == []
+        assert config_a in store
+        assert store.tags(results[0].digest)["run"] == [0]
+
+    with ModelStore(tmp_path) as store:
+        assert len(store) == 4
+        with pytest.raises(KeyError):
+            store.get("0" * 64)
@@ -0,0 +1,66 @@
+"""Shared fixtures for model tests."""
+
+from __future__ import annotations
+
+import pytest
+import tunits
+
+from measurement_config.models import (
+    DataAcquisitionConfig,
+    FrequencyConfig,
+    ParameterSweepConfig,
+    ParameterSweepContent,
+    ParametricSequenceConfig,
+    SweepMeasurementConfig,
+)
+
+
+@pytest.fixture
+def sweep_config() -> SweepMeasurementConfig:
+    """Sweep over three amplitudes and two pairs of frequency shifts."""
+    return SweepMeasurementConfig(
+        channel_list=["q0", "q1"],
+        sequence=ParametricSequenceConfig(
+            delta_time=tunits.Time(4.0, "ns"),
+            variable_list=["amp"],
+            command_list=[],
+        ),
+        frequency=FrequencyConfig(
+            channel_to_frequency={},
+            channel_to_frequency_reference={},
+            channel_to_frequency_shift={},
+            keep_oscillator_relative_phase=True,
+        ),
+        data_acquisition=DataAcquisitionConfig(
+            shot_count=10,
+            shot_repetition_margin=tunits.Time(1.0, "us"),
+            data_acquisition_duration=tunits.Time(200.0, "ns"),
+            data_acquisition_delay=tunits.Time(20.0, "ns"),
+            data_acquisition_timeout=tunits.Time(10.0, "ms"),
+            flag_average_waveform=True,
+            flag_average_shots=True,
+            delta_time=tunits.Time(4.0, "ns"),
+            channel_to_averaging_time={},
+            channel_to_averaging_window={},
+        ),
+        sweep_parameter=ParameterSweepConfig(
+            sweep_content_list={
+                "amp": ParameterSweepContent(
+                    category="sequence_variable",
+                    sweep_target=["amp"],
+                    value_list=[0.1, 0.2, 0.3],
+                ),
+                "q0_shift": ParameterSweepContent(
+                    category="frequency_shift",
+                    sweep_target=["q0"],
+                    value_list=tunits.ValueArray([0, 1], "MHz"),
+                ),
+                "q1_shift": ParameterSweepContent(
+                    category="frequency_shift",
+                    sweep_target=["q1"],
+                    value_list=tunits.ValueArray([0, -1], "MHz"),
+                ),
+            },
+            sweep_axis=[["amp"], ["q0_shift", "q1_shift"]],
+        ),
+    )
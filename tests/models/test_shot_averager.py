@@ -0,0 +1,60 @@
+"""Tests for the streaming shot averager."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from measurement_config.models import ShotAverager, SweepMeasurementResult
+
+
+def test_shot_averager_matches_batch_statistics(sweep_config):
+    """Block-wise accumulation equals statistics over all shots at once."""
+    rng = np.random.default_rng(0)
+    shots = (
+        rng.normal(size=(6, 50, 2, 4)) + 1j * rng.normal(size=(6, 50, 2, 4)) + 3 + 1j
+    )
+    averager = ShotAverager(sweep_config, point_shape=[4])
+    for start, stop in [(0, 7), (7, 8), (8, 30), (30, 50)]:
+        averager.add_chunk(0, shots[:, start:stop])
+    averager.add((0, 1), np.zeros((0, 2, 4)))
+
+    expected_mean = shots.mean(axis=1).reshape(3, 2, 2, 4)
+    expected_var = (np.abs(shots - shots.mean(axis=1, keepdims=True)) ** 2).sum(
+        axis=1
+    ) / 49
+    np.testing.assert_allclose(averager.mean(), expected_mean)
+    np.testing.assert_allclose(averager.variance(), expected_var.reshape(3, 2, 2, 4))
+    np.testing.assert_array_equal(averager.shot_count, np.full((3, 2), 50))
+
+    snapshot = averager.snapshot()
+    assert isinstance(snapshot, SweepMeasurementResult)
+    assert snapshot.data_shape == [3, 2, 2, 4]
+    assert snapshot.sweep_key_list == ["amp", "q0_shift"]
+    assert snapshot.data_key_list == ["q0", "q1"]
+    averager.add_chunk(0, shots[:, :1])
+    np.testing.assert_allclose(snapshot.data, expected_mean)
+
+    stderr = averager.snapshot("stderr")
+    assert stderr.metadata["statistic"] == "stderr"
+    assert stderr.metadata["shot_count"][0, 0] == 51
+
+
+def test_shot_averager_partial_points_and_errors(sweep_config):
+    """Points without enough shots report NaN variance; bad input raises."""
+    averager = ShotAverager(sweep_config, data_key_list=["q0"], dtype=np.float64)
+    averager.add((1, 0), np.array([[1.0], [3.0]]))
+    averager.add(np.int64(3), np.array([[5.0]]))
+    mean = averager.mean()
+    assert mean[1, 0, 0] == 2.0
+    assert mean[1, 1, 0] == 5.0
+    variance = averager.variance()
+    assert variance[1, 0, 0] == 2.0
+    assert np.isnan(variance[1, 1, 0])
+    assert np.isnan(variance[0, 0, 0])
+    assert averager.variance(ddof=0)[1, 1, 0] == 0.0
+
+    with pytest.raises(ValueError, match="out of range"):
+        averager.add_chunk(5, np.zeros((2, 1, 1)))
+    with pytest.raises(ValueError, match="Expected shots"):
+        averager.add(0, np.zeros((3, 2)))
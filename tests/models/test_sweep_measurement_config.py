@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import json
+
+import numpy as np
+import pytest
 import tunits
 
 from measurement_config.models import (
@@ -12,6 +16,7 @@ from measurement_config.models import (
     ParametricSequenceConfig,
     ParametricSequencePulseCommand,
     SweepMeasurementConfig,
+    SweepMeasurementResult,
 )
 
 
@@ -83,3 +88,334 @@ def test_sweep_measurement_config_roundtrip():
     assert restored.frequency == config.frequency
     assert restored.data_acquisition == config.data_acquisition
     assert restored.sweep_parameter == config.sweep_parameter
+
+
+def _make_grid_sweep_parameter() -> ParameterSweepConfig:
+    return ParameterSweepConfig(
+        sweep_content_list={
+            "amp_sweep": ParameterSweepContent(
+                category="sequence_variable",
+                sweep_target=["amp"],
+                value_list=[0.1, 0.2, 0.3],
+            ),
+            "q0_shift": ParameterSweepContent(
+                category="frequency_shift",
+                sweep_target=["q0"],
+                value_list=tunits.ValueArray([0.0, 1.0], "MHz"),
+            ),
+            "duration_sweep": ParameterSweepContent(
+                category="sequence_variable",
+                sweep_target=["duration"],
+                value_list=np.array([10.0, 20.0]),
+            ),
+        },
+        sweep_axis=[["amp_sweep"], ["q0_shift", "duration_sweep"]],
+    )
+
+
+def test_parameter_sweep_shape():
+    """Sweep shape has one entry per axis."""
+    assert _make_grid_sweep_parameter().shape == (3, 2)
+
+    mismatched = ParameterSweepConfig(
+        sweep_content_list={
+            "a": ParameterSweepContent(
+                category="sequence_variable", sweep_target=["a"], value_list=[1, 2]
+            ),
+            "b": ParameterSweepContent(
+                category="sequence_variable", sweep_target=["b"], value_list=[1]
+            ),
+        },
+        sweep_axis=[["a", "b"]],
+    )
+    with pytest.raises(ValueError, match="equal lengths"):
+        _ = mismatched.shape
+
+
+def test_parameter_sweep_resolve_expression_over_grid():
+    """Expressions are evaluated over the broadcast sweep grid."""
+    sweep = _make_grid_sweep_parameter()
+
+    result = sweep.resolve("amp * duration + offset", {"offset": 1.0})
+    expected = np.array([[0.1], [0.2], [0.3]]) * np.array([[10.0, 20.0]]) + 1.0
+    np.testing.assert_allclose(result, expected)
+
+    constant_along_axis = sweep.resolve("2 * amp")
+    assert constant_along_axis.shape == (3, 2)
+    np.testing.assert_allclose(constant_along_axis[:, 0], constant_along_axis[:, 1])
+
+
+def test_parameter_sweep_index_engine():
+    """Flat and per-axis indices map to the same sweep point values."""
+    sweep = _make_grid_sweep_parameter()
+    assert sweep.size == 6
+    assert sweep.unravel_index(3) == (1, 1)
+    assert sweep.ravel_index((1, 1)) == 3
+
+    point = sweep.point(3)
+    assert point["amp_sweep"] == 0.2
+    assert point["q0_shift"] == tunits.Value(1.0, "MHz")
+    assert point["duration_sweep"] == 20.0
+    assert sweep.point((1, 1)) == point
+    assert sweep.point(np.int64(3)) == point
+    assert sweep.point((np.int64(1), np.int64(1))) == point
+    assert sweep.unravel_index(np.int64(3)) == (1, 1)
+
+    points = list(sweep.iter_points())
+    assert len(points) == 6
+    assert points[3] == point
+    assert [p["amp_sweep"] for p in points] == [0.1, 0.1, 0.2, 0.2, 0.3, 0.3]
+
+
+def test_parameter_sweep_iter_chunks():
+    """Chunks cover all sweep points in order with NumPy value blocks."""
+    sweep = _make_grid_sweep_parameter()
+    chunks = list(sweep.iter_chunks(4))
+    assert [(c.start, c.stop) for c in chunks] == [(0, 4), (4, 6)]
+    np.testing.assert_allclose(chunks[0].values["amp_sweep"], [0.1, 0.1, 0.2, 0.2])
+    np.testing.assert_allclose(chunks[1].values["duration_sweep"], [10.0, 20.0])
+    assert isinstance(chunks[0].values["q0_shift"], tunits.ValueArray)
+
+    with pytest.raises(ValueError, match="chunk_size must be positive"):
+        next(sweep.iter_chunks(0))
+
+
+def test_sweep_measurement_config_resolve_sweep():
+    """Arguments and frequency shifts are resolved over the sweep grid."""
+    config = SweepMeasurementConfig(
+        channel_list=["q0", "q1"],
+        sequence=ParametricSequenceConfig(
+            delta_time=tunits.Time(4.0, "ns"),
+            variable_list=["amp", "duration", "phase"],
+            command_list=[
+                ParametricSequencePulseCommand(
+                    name="pulse",
+                    channel_list=["q0"],
+                    argument_list=["amp * duration", 0.5, "phase"],
+                ),
+                ParametricSequencePulseCommand(
+                    name="pulse",
+                    channel_list=["q1"],
+                    argument_list=["2 * amp * duration"],
+                ),
+            ],
+        ),
+        frequency=FrequencyConfig(
+            channel_to_frequency={},
+            channel_to_frequency_reference={},
+            channel_to_frequency_shift={
+                "q0": tunits.Frequency(0.5, "MHz"),
+                "q1": tunits.Frequency(2.0, "MHz"),
+            },
+            keep_oscillator_relative_phase=True,
+        ),
+        data_acquisition=_make_data_acquisition(),
+        sweep_parameter=_make_grid_sweep_parameter(),
+    )
+
+    resolved = config.resolve_sweep(params={"phase": 0.25}, frequency_unit="MHz")
+    amp = np.array([[0.1], [0.2], [0.3]])
+    duration = np.array([[10.0, 20.0]])
+
+    first, constant, phase = resolved.argument_list[0]
+    np.testing.assert_allclose(first, amp * duration)
+    assert constant.shape == (3, 2)
+    assert constant.strides == (0, 0)
+    np.testing.assert_allclose(phase, np.full((3, 2), 0.25))
+    np.testing.assert_allclose(resolved.argument_list[1][0], 2 * amp * duration)
+
+    np.testing.assert_allclose(
+        resolved.channel_to_frequency_shift["q0"], [[0.0, 1.0]] * 3
+    )
+    np.testing.assert_allclose(resolved.channel_to_frequency_shift["q1"], 2.0)
+    assert resolved.channel_to_frequency_shift["q1"].shape == (3, 2)
+
+
+def test_sweep_measurement_config_trusted_load():
+    """Trusted loading builds the same nested models without validation."""
+    config = SweepMeasurementConfig(
+        channel_list=["q0"],
+        sequence=_make_parametric_sequence(),
+        frequency=_make_frequency_config(),
+        data_acquisition=_make_data_acquisition(),
+        sweep_parameter=_make_sweep_parameter(),
+    )
+
+    restored = SweepMeasurementConfig.from_json(config.to_json(), trusted=True)
+    assert isinstance(restored.sequence.command_list[0], ParametricSequencePulseCommand)
+    assert restored.sequence == config.sequence
+    assert restored.frequency == config.frequency
+    assert restored.sweep_parameter == config.sweep_parameter
+    assert restored.to_dict() == config.to_dict()
+
+    # Data from another serialization version is validated as usual
+    data = config.to_dict()
+    data["__meta__"] = {"version": 0}
+    data["channel_list"] = ("q0",)
+    restored = SweepMeasurementConfig.from_dict(data, trusted=True)
+    assert restored.channel_list == ["q0"]
+
+
+def test_sweep_measurement_config_diff_and_apply_patch():
+    """A patch holds only changed paths and rebuilds the target config."""
+    base = SweepMeasurementConfig(
+        channel_list=["q0"],
+        sequence=_make_parametric_sequence(),
+        frequency=_make_frequency_config(),
+        data_acquisition=_make_data_acquisition(),
+        sweep_parameter=_make_sweep_parameter(),
+    )
+    frequency = base.frequency.model_copy(
+        update={"channel_to_frequency": {"q0": tunits.Frequency(5.1, "GHz")}}
+    )
+    target = base.model_copy(update={"frequency": frequency})
+
+    patch = json.loads(json.dumps(base.diff(target)))
+    assert [change["path"] for change in patch["changes"]] == [
+        ["frequency", "channel_to_frequency", "q0"]
+    ]
+    assert patch["changes"][0]["value"]["__type__"] == "tunits.Frequency"
+
+    patched = base.apply_patch(patch)
+    assert patched.fingerprint() == target.fingerprint()
+    assert patched.sequence is base.sequence
+    assert patched.data_acquisition is base.data_acquisition
+    assert base.diff(base)["changes"] == []
+
+    with pytest.raises(ValueError, match="different model"):
+        target.apply_patch(patch)
+
+
+def _make_grid_config() -> SweepMeasurementConfig:
+    return SweepMeasurementConfig(
+        channel_list=["q0"],
+        sequence=_make_parametric_sequence(),
+        frequency=_make_frequency_config(),
+        data_acquisition=_make_data_acquisition(),
+        sweep_parameter=_make_grid_sweep_parameter(),
+    )
+
+
+def _run_shard(config: SweepMeasurementConfig) -> SweepMeasurementResult:
+    values = config.sweep_parameter.broadcast_values("sequence_variable")
+    amp = np.asarray(values["amp"], dtype=float)
+    data = np.broadcast_to(amp + values["duration"], config.sweep_parameter.shape)
+    data = data[..., np.newaxis]
+    return SweepMeasurementResult(
+        metadata={"experiment": "rabi"},
+        data=data,
+        data_shape=list(data.shape),
+        sweep_key_list=["amp_sweep", "q0_shift"],
+        data_key_list=["q0"],
+    )
+
+
+@pytest.mark.parametrize("to_file", [False, True])
+def test_sweep_measurement_config_shard_and_merge(tmp_path, to_file):
+    """Shard results merge into the result of the unsharded sweep."""
+    config = _make_grid_config()
+    shards = config.shard(6, axes=["amp_sweep", 1])
+
+    assert len(shards) == 6
+    assert [shard.config.sweep_parameter.shape for shard in shards] == [(1, 1)] * 6
+    assert shards[0].config.sequence is config.sequence
+    assert shards[1].config.sweep_parameter.sweep_content_list[
+        "q0_shift"
+    ].value_list == tunits.ValueArray([1.0], "MHz")
+
+    merged = SweepMeasurementResult.merge_shards(
+        shards,
+        [_run_shard(shard.config) for shard in shards],
+        path=tmp_path / "merged.mcfg" if to_file else None,
+    )
+    expected = _run_shard(config)
+    np.testing.assert_array_equal(merged.data, expected.data)
+    assert merged.data_shape == expected.data_shape
+    assert merged.metadata == {"experiment": "rabi"}
+
+
+def test_sweep_measurement_config_shard_balances_axes():
+    """Shard counts are spread over axes and ranges stay balanced."""
+    config = _make_grid_config()
+
+    shards = config.shard(2)
+    assert [shard.region[0] for shard in shards] == [slice(0, 2), slice(2, 3)]
+    assert shards[0].config.sweep_parameter.sweep_content_list[
+        "amp_sweep"
+    ].value_list == [0.1, 0.2]
+
+    with pytest.raises(ValueError, match="Cannot split"):
+        config.shard(4)
+    with pytest.raises(ValueError, match="Unknown sweep content"):
+        config.shard(2, axes=["missing"])
+    with pytest.raises(ValueError, match="more than once"):
+        config.shard(2, axes=[0, "amp_sweep"])
+    with pytest.raises(ValueError, match="exactly once"):
+        SweepMeasurementResult.merge_shards(
+            shards[:1] * 2, [_run_shard(shards[0].config)] * 2
+        )
+
+
+def test_sweep_measurement_config_shard_searches_factorizations():
+    """Counts are factored over the axes even where a greedy split dead-ends."""
+    sweep = ParameterSweepConfig(
+        sweep_content_list={
+            "amp_sweep": ParameterSweepContent(
+                category="sequence_variable",
+                sweep_target=["amp"],
+                value_list=[0.1, 0.2, 0.3],
+            ),
+            "duration_sweep": ParameterSweepContent(
+                category="sequence_variable",
+                sweep_target=["duration"],
+                value_list=[10.0, 20.0, 30.0, 40.0],
+            ),
+        },
+        sweep_axis=[["amp_sweep"], ["duration_sweep"]],
+    )
+    config = _make_grid_config().model_copy(update={"sweep_parameter": sweep})
+
+    shards = config.shard(12, axes=[0, 1])
+    assert [shard.config.sweep_parameter.shape for shard in shards] == [(1, 1)] * 12
+    assert [
+        shard.config.sweep_parameter.shape for shard in config.shard(6, axes=[0, 1])
+    ] == [(1, 2)] * 6
+    assert [
+        shard.config.sweep_parameter.shape for shard in config.shard(4, axes=[0, 1])
+    ] == [(3, 1)] * 4
+    assert [
+        shard.config.sweep_parameter.shape for shard in config.shard(3, axes=[1, 0])
+    ] == [(1, 4)] * 3
+    with pytest.raises(ValueError, match="Cannot split"):
+        config.shard(5, axes=[0, 1])
+
+
+def test_sweep_measurement_config_derive_shares_untouched_subtrees():
+    """Derived configs copy only the changed path and validate it."""
+    config = _make_grid_config()
+    variant = config.derive(
+        {
+            "frequency.channel_to_frequency.q1": tunits.Frequency(6.0, "GHz"),
+            ("sequence", "command_list", 0, "channel_list"): ["q0", "q1"],
+        },
+        channel_list=["q0", "q1"],
+    )
+
+    assert variant.channel_list == ["q0", "q1"]
+    assert variant.frequency.channel_to_frequency["q1"] == tunits.Frequency(6.0, "GHz")
+    assert variant.sequence.command_list[0].channel_list == ["q0", "q1"]
+    assert config.channel_list == ["q0"]
+    assert "q1" not in config.frequency.channel_to_frequency
+    assert variant.data_acquisition is config.data_acquisition
+    assert variant.sweep_parameter is config.sweep_parameter
+    assert variant.frequency.channel_to_frequency_shift is (
+        config.frequency.channel_to_frequency_shift
+    )
+    assert config.derive() is config
+
+    with pytest.raises(ValueError, match="valid"):
+        config.derive({"data_acquisition.shot_count": "many"})
+    with pytest.raises(KeyError, match="Unknown field"):
+        config.derive({"frequency.missing": 1})
+    with pytest.raises(KeyError, match=r"out of range: 'sequence\.command_list\.5'"):
+        config.derive({("sequence", "command_list", 5, "channel_list"): []})
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import numpy as np
+import pytest
 
 from measurement_config.models import SweepMeasurementResult
 
@@ -26,3 +27,78 @@ def test_sweep_measurement_result_roundtrip():
     assert restored.data_shape == result.data_shape
     assert restored.sweep_key_list == result.sweep_key_list
     assert restored.data_key_list == result.data_key_list
+
+
+def test_sweep_measurement_result_container_roundtrip(tmp_path):
+    """Result arrays are memory-mapped when loaded from a container file."""
+    data = (np.arange(24.0) + 1j * np.arange(24.0)).reshape(2, 3, 4)
+    result = SweepMeasurementResult(
+        metadata={"experiment": "rabi", "shots": 1024},
+        data=data,
+        data_shape=[2, 3, 4],
+        sweep_key_list=["amp", "freq_shift"],
+        data_key_list=["q0", "q1", "q2", "q3"],
+    )
+    path = tmp_path / "result.bin"
+    result.to_container(path)
+
+    restored = SweepMeasurementResult.from_container(path)
+    assert isinstance(restored.data, np.memmap)
+    assert not restored.data.flags.writeable
+    np.testing.assert_array_equal(restored.data, data)
+    assert restored.metadata == result.metadata
+    assert restored.data_shape == result.data_shape
+    assert restored.sweep_key_list == result.sweep_key_list
+    assert restored.data_key_list == result.data_key_list
+
+    in_memory = SweepMeasurementResult.from_container(path, mmap_mode=None)
+    assert not isinstance(in_memory.data, np.memmap)
+    np.testing.assert_array_equal(in_memory.data, data)
+
+
+def _make_grid_result() -> SweepMeasurementResult:
+    data = np.arange(4 * 3 * 2 * 5, dtype=float).reshape(4, 3, 2, 5)
+    return SweepMeasurementResult(
+        metadata={},
+        data=data,
+        data_shape=list(data.shape),
+        sweep_key_list=["amp", "freq"],
+        data_key_list=["q0", "q1"],
+    )
+
+
+def test_sweep_measurement_result_select_views():
+    """Label selections index the data without copying when possible."""
+    result = _make_grid_result()
+    assert result.sweep_shape == (4, 3)
+    assert result.point_shape == (5,)
+
+    selected = result.select(data_key="q1", amp=slice(1, 3), freq=[0, 2])
+    assert np.shares_memory(selected.data, result.data)
+    np.testing.assert_array_equal(selected.data, result.data[1:3, ::2, 1:2])
+    assert selected.data_shape == [2, 2, 1, 5]
+    assert selected.data_key_list == ["q1"]
+
+    point = result.select(amp=-1)
+    assert np.shares_memory(point.data, result.data)
+    assert point.sweep_key_list == ["freq"]
+    assert point.sweep_shape == (3,)
+
+    picked = result.select(data_key=["q1", "q0"], amp=[3, 0, 1])
+    np.testing.assert_array_equal(picked.data, result.data[[3, 0, 1]][:, :, ::-1])
+    assert picked.data_key_list == ["q1", "q0"]
+
+    with pytest.raises(ValueError, match="Unknown sweep key"):
+        result.select(phase=0)
+    with pytest.raises(ValueError, match="Unknown data key"):
+        result.select(data_key="q2")
+
+
+def test_sweep_measurement_result_reduce():
+    """Reductions drop the reduced sweep axes from the labels."""
+    result = _make_grid_result()
+
+    averaged = result.reduce(np.mean, over="amp")
+    np.testing.assert_array_equal(averaged.data, result.data.mean(axis=0))
+    assert averaged.sweep_key_list == ["freq"]
+    assert averaged.data_shape == [3, 2, 5]
@@ -0,0 +1,83 @@
+"""Tests for the incremental sweep measurement writer."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from measurement_config.models import SweepMeasurementResult, SweepMeasurementWriter
+
+
+def test_writer_points_and_chunks(tmp_path, sweep_config):
+    """Data written per point and per chunk ends up in the final result."""
+    path = tmp_path / "result.bin"
+    expected = np.arange(3 * 2 * 2 * 4, dtype=np.complex128).reshape(3, 2, 2, 4)
+    with SweepMeasurementWriter(
+        path,
+        sweep_config,
+        data_key_list=["q0", "q1"],
+        point_shape=[4],
+        metadata={"experiment": "rabi"},
+    ) as writer:
+        assert writer.sweep_shape == (3, 2)
+        assert writer.size == 6
+        writer.write(np.int64(0), expected[0, 0])
+        writer.write((0, np.int64(1)), expected[0, 1])
+        writer.write_chunk(2, expected.reshape(6, 2, 4)[2:])
+        result = writer.finalize()
+
+    assert isinstance(result, SweepMeasurementResult)
+    np.testing.assert_array_equal(result.data, expected)
+    assert result.data_shape == [3, 2, 2, 4]
+    assert result.sweep_key_list == ["amp", "q0_shift"]
+    assert result.data_key_list == ["q0", "q1"]
+    assert result.metadata == {"experiment": "rabi"}
+
+
+def test_writer_keeps_partial_data(tmp_path, sweep_config):
+    """Data flushed before the writer stops is readable from the file."""
+    path = tmp_path / "result.bin"
+    writer = SweepMeasurementWriter(
+        path, sweep_config, data_key_list=["q0"], fill_value=np.nan
+    )
+    writer.write(1, [1 + 1j])
+    writer.flush()
+
+    partial = SweepMeasurementResult.from_container(path)
+    flat = partial.data.reshape(-1)
+    assert flat[1] == 1 + 1j
+    assert np.isnan(flat[[0, 2, 3, 4, 5]]).all()
+
+    writer.close()
+    with pytest.raises(ValueError, match="Writer is closed"):
+        writer.write(0, [0])
+
+
+def test_writer_rejects_out_of_range_chunk(tmp_path, sweep_config):
+    """Raise when a chunk extends past the last sweep point."""
+    writer = SweepMeasurementWriter(
+        tmp_path / "result.bin", sweep_config, data_key_list=["q0"]
+    )
+    with pytest.raises(ValueError, match="out of range"):
+        writer.write_chunk(5, np.zeros((2, 1)))
+    writer.close()
+
+
+def test_writer_handles_empty_results(tmp_path, sweep_config):
+    """Writers without data keys or sweep points produce empty results."""
+    with SweepMeasurementWriter(tmp_path / "keys.bin", sweep_config, []) as writer:
+        assert writer.size == 6
+        writer.write(0, np.zeros(0))
+        writer.flush()
+        result = writer.finalize()
+    assert result.data.shape == (3, 2, 0)
+
+    empty_config = sweep_config.derive(
+        {"sweep_parameter.sweep_content_list.amp.value_list": []}
+    )
+    with SweepMeasurementWriter(
+        tmp_path / "points.bin", empty_config, ["q0"], point_shape=[4]
+    ) as writer:
+        assert writer.size == 0
+        result = writer.finalize()
+    assert result.data.shape == (0, 2, 1, 4)
@@ -0,0 +1,75 @@
+"""Tests for the import cost of the package."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+# Modules that are slow to import and only needed by optional features
+HEAVY_MODULES = (
+    "sympy",
+    "sqlite3",
+    "multiprocessing",
+    "google.protobuf.json_format",
+    "measurement_config.core.store",
+)
+
+# Dependencies every import of the package needs anyway
+BASELINE_MODULES = "numpy, pydantic, tunits"
+
+# Time the package may add on top of its dependencies, relative to the time
+# they take; loading sympy and the protobuf codec eagerly roughly doubles it.
+IMPORT_TIME_BUDGET = 1.0
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(  # noqa: S603
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _cold_import_times(module: str) -> tuple[float, float]:
+    """Return the import times of the dependencies and then of `module`."""
+    result = _run_python(
+        "-c",
+        "import time; "
+        "start = time.perf_counter(); "
+        f"import {BASELINE_MODULES}; "
+        "middle = time.perf_counter(); "
+        f"import {module}; "
+        "print(middle - start, time.perf_counter() - middle)",
+    )
+    baseline, own = map(float, result.stdout.split())
+    return baseline, own
+
+
+@pytest.mark.parametrize("module", ["measurement_config", "measurement_config.models"])
+def test_import_does_not_load_heavy_modules(module):
+    """Importing the package does not load optional heavy dependencies."""
+    result = _run_python(
+        "-c",
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))",
+    )
+    assert result.stdout.strip() == ""
+
+
+@pytest.mark.parametrize("module", ["measurement_config", "measurement_config.models"])
+def test_cold_import_time_within_budget(module):
+    """The package adds little to the import time of its dependencies."""
+    baseline, own = _cold_import_times(module)
+    assert own < IMPORT_TIME_BUDGET * baseline
+
+
+def test_lazy_exports_are_loaded_on_first_access():
+    """Lazily loaded classes remain available from measurement_config.core."""
+    from measurement_config.core import Expression, ModelStore, StoreEntry
+
+    assert Expression("a + 1").resolve({"a": 1}) == 2
+    assert ModelStore.__module__ == StoreEntry.__module__
+    assert ModelStore.__module__ == "measurement_config.core.store"